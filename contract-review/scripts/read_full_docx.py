@@ -1,15 +1,22 @@
-
 import sys
-from docx import Document
+from docx_text import iter_paragraphs
 
 def read_docx(file_path):
     try:
-        doc = Document(file_path)
-        text = '\n'.join([para.text for para in doc.paragraphs])
-        # Also read tables as they often contain important contract info
-        for table in doc.tables:
-            for row in table.rows:
-                text += '\n' + ' | '.join([cell.text for cell in row.cells])
+        # Stream document.xml so long contracts are read in bounded memory.
+        # Body paragraphs come first, then the tables as they often contain
+        # important contract info: one line per row, cells joined by " | ".
+        paragraphs = []
+        rows = {}  # (table, row) -> {cell: [paragraph texts]}
+        for para in iter_paragraphs(file_path):
+            if para.cell is None:
+                paragraphs.append(para.text)
+            else:
+                cells = rows.setdefault(para.cell[:2], {})
+                cells.setdefault(para.cell[2], []).append(para.text)
+        text = '\n'.join(paragraphs)
+        for cells in rows.values():
+            text += '\n' + ' | '.join('\n'.join(cell) for cell in cells.values())
         print(text)
     except Exception as e:
         print(f"Error: {e}")
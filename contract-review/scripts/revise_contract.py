@@ -1,116 +1,71 @@
 import sys
 import os
 import argparse
-import time
-from docx import Document
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
-from datetime import datetime
+import tempfile
+from pathlib import Path
 
-# Helper to create w:ins (Insertion)
-def create_ins_element(text, author="ABL-LICHENG", date_str=None):
-    if date_str is None:
-        date_str = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-        
-    run = OxmlElement('w:r')
-    text_el = OxmlElement('w:t')
-    text_el.text = text
-    run.append(text_el)
-    
-    ins = OxmlElement('w:ins')
-    ins.set(qn('w:id'), str(int(time.time() * 1000))) # Unique ID
-    ins.set(qn('w:author'), author)
-    ins.set(qn('w:date'), date_str)
-    ins.append(run)
-    return ins
+# The tracked-change engine lives in the docx skill, which must be installed
+# next to this one (or pointed to with the DOCX_SKILL_DIR environment variable)
+DOCX_SKILL_DIR = Path(os.environ.get("DOCX_SKILL_DIR") or Path(__file__).resolve().parents[2] / "docx")
+sys.path.insert(0, str(DOCX_SKILL_DIR))
 
-# Helper to create w:del (Deletion)
-def create_del_element(text, author="ABL-LICHENG", date_str=None):
-    if date_str is None:
-        date_str = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-        
-    run = OxmlElement('w:r')
-    del_text = OxmlElement('w:delText')
-    del_text.text = text
-    run.append(del_text)
-    
-    del_el = OxmlElement('w:del')
-    del_el.set(qn('w:id'), str(int(time.time() * 1000) + 1))
-    del_el.set(qn('w:author'), author)
-    del_el.set(qn('w:date'), date_str)
-    del_el.append(run)
-    return del_el
+try:
+    from ooxml.scripts.pack import pack_document
+    from ooxml.scripts.unpack import unpack_document
+    from scripts.document import Document
+    DOCX_SKILL_ERROR = None
+except ImportError as e:
+    DOCX_SKILL_ERROR = (
+        f"revise_contract.py needs the docx skill, which was not found at {DOCX_SKILL_DIR} ({e}). "
+        "Install the docx skill next to contract-review, or set DOCX_SKILL_DIR to its directory."
+    )
 
-def apply_revisions(doc_path, output_path, revisions):
+def apply_revisions(doc_path, output_path, revisions, author="ABL-LICHENG", initials="ABL"):
     """
     Apply revisions to a DOCX file using native Track Changes.
     
     revisions: List of dicts {'original': 'text to find', 'revised': 'new text'}
+
+    Each original text is replaced at its first occurrence in the document.
+    All revisions are matched in one pass, and only the runs holding the text
+    are split, so the formatting of the surrounding text is kept.
+
+    Raises ImportError if the docx skill is not installed.
     """
-    try:
-        doc = Document(doc_path)
-    except Exception as e:
-        print(f"Error loading document: {e}")
-        return
+    if DOCX_SKILL_ERROR:
+        raise ImportError(DOCX_SKILL_ERROR)
 
-    # Enable tracking changes view in the saved file? 
-    # doc.settings.element.append(OxmlElement('w:trackRevisions')) # Optional: force tracking on
-    
-    replacements_made = 0
-    
-    for rev in revisions:
-        original_text = rev.get('original', '').strip()
-        revised_text = rev.get('revised', '')
-        
-        if not original_text:
-            continue
-            
-        found = False
-        for p in doc.paragraphs:
-            if original_text in p.text:
-                # Found the paragraph containing the text
-                # To properly implement track changes, we need to rebuild the paragraph components
-                # This simple implementation replaces the WHOLE occurrence + surrounding text in that paragraph
-                # while preserving the "track changes" structure for the part that changed.
-                
-                # Split paragraph text by the original_text
-                # Note: This method loses character-level formatting (bold/italic) of the paragraph
-                # but ensures the revision is strictly recorded.
-                parts = p.text.split(original_text)
-                
-                # Clear existing runs
-                p.clear() 
-                
-                # Rebuild
-                for i, part in enumerate(parts):
-                    # Add the unchanged text before/between matches
-                    if part:
-                        run = p.add_run(part)
-                    
-                    # Add the revision (Delete Original + Insert New)
-                    if i < len(parts) - 1:
-                        # 1. Add Deletion Marker
-                        p._element.append(create_del_element(original_text))
-                        
-                        # 2. Add Insertion Marker (if there is new text)
-                        if revised_text:
-                            p._element.append(create_ins_element(revised_text))
-                            
-                found = True
+    revisions = [
+        {'original': rev.get('original', '').strip(), 'revised': rev.get('revised', '')}
+        for rev in revisions
+    ]
+    revisions = [rev for rev in revisions if rev['original']]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        unpacked_dir = Path(temp_dir) / "unpacked"
+        try:
+            unpack_document(doc_path, unpacked_dir)
+            doc = Document(unpacked_dir, author=author, initials=initials, engine="lxml")
+        except Exception as e:
+            print(f"Error loading document: {e}")
+            return
+
+        results = doc.suggest_replacements(revisions)
+
+        replacements_made = 0
+        for rev, result in zip(revisions, results):
+            if result['error']:
+                print(f"Warning: Could not find text: '{rev['original'][:30]}...'")
+            else:
                 replacements_made += 1
-                # Break after one replacement per revision to avoid infinite loops if original == revised
-                # Remove break if you want global replace
-                break 
-        
-        if not found:
-            print(f"Warning: Could not find text: '{original_text[:30]}...'")
 
-    try:
-        doc.save(output_path)
-        print(f"Successfully saved revised contract to: {output_path}")
-        print(f"Total revisions applied: {replacements_made}")
-    except Exception as e:
-        print(f"Error saving document: {e}")
+        try:
+            doc.save(validate=False)
+            pack_document(unpacked_dir, output_path)
+            print(f"Successfully saved revised contract to: {output_path}")
+            print(f"Total revisions applied: {replacements_made}")
+        except Exception as e:
+            print(f"Error saving document: {e}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Apply Track Changes revisions to a contract.")
@@ -120,6 +75,10 @@ if __name__ == "__main__":
     parser.add_argument("--open", action="store_true", help="Open the file after saving (macOS only)")
     
     args = parser.parse_args()
+
+    if DOCX_SKILL_ERROR:
+        print(f"Error: {DOCX_SKILL_ERROR}")
+        sys.exit(1)
     
     # Parse revisions string
     # Format: "original text"|"new text";;"original text 2"|"new text 2"
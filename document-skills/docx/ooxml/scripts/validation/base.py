@@ -2,11 +2,22 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import hashlib
+import json
+import os
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from .original import OriginalPackage
+from .schemas import SCHEMA_REGISTRY
+
+SCHEMAS_DIR = Path(__file__).parent.parent.parent / "schemas"
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,13 +114,39 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        jobs=1,
+        incremental=False,
+        dirty_parts=None,
+        streaming=False,
+    ):
+        """
+        Args:
+            unpacked_dir: Path to unpacked Office document directory
+            original_file: Path to original .docx/.pptx/.xlsx file
+            verbose: Enable verbose output
+            jobs: Number of worker processes for per-part XSD validation (1 = serial)
+            incremental: Only re-check parts whose content changed since the last
+                successful validation (state is stored next to unpacked_dir)
+            dirty_parts: Optional part names (e.g. "word/document.xml") known to have
+                changed; implies incremental and skips hashing unchanged parts
+            streaming: Lower peak memory for large parts: the well-formedness, ID
+                uniqueness and relationship ID checks read parts with iterparse,
+                and trees built for the other checks are not cached, so at most
+                one full tree is alive at a time (at the cost of extra parses)
+        """
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
+        self.jobs = jobs
+        self.streaming = streaming
 
         # Set schemas directory
-        self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+        self.schemas_dir = SCHEMAS_DIR
 
         # Get all XML and .rels files
         patterns = ["*.xml", "*.rels"]
@@ -120,18 +157,268 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parsed trees shared by all checks: path -> ((mtime_ns, size), tree or error)
+        self._tree_cache = {}
+        # Number of times each file was actually read from disk, either parsed
+        # into a tree or streamed with iterparse
+        self.parse_counts = Counter()
+
+        # Original file is opened lazily and XSD errors are memoized per part
+        self._original_package = None
+        self._original_errors = {}
+
+        # Per-part ID occurrences: path -> ((mtime_ns, size), occurrences)
+        self._ids_cache = {}
+
+        # Incremental validation: part name -> content hash, summaries of parts
+        # for cross-part checks, and the set of parts that must be re-checked
+        # (None means every part is checked)
+        self.incremental = incremental or dirty_parts is not None
+        self._original_sha1 = None
+        self._part_hashes = {}
+        self._summaries = {}
+        self._state = self._load_state() if self.incremental else None
+        self._dirty_parts = self._compute_dirty_parts(dirty_parts)
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    @classmethod
+    def warm_up_schemas(cls):
+        """Compile every schema in SCHEMA_MAPPINGS into the process-wide registry.
+
+        Long-running processes can call this once at startup so that later
+        validations only pay validation time, not schema compilation time.
+
+        Returns:
+            float: Seconds spent compiling the schemas
+        """
+        schema_paths = {SCHEMAS_DIR / path for path in cls.SCHEMA_MAPPINGS.values()}
+        return SCHEMA_REGISTRY.warm_up(sorted(schema_paths))
+
+    def _part_name(self, path):
+        """Return the package part name of a file (e.g. "word/document.xml")."""
+        return Path(path).relative_to(self.unpacked_dir).as_posix()
+
+    def _state_path(self):
+        """Path of the incremental validation state, stored next to unpacked_dir."""
+        return self.unpacked_dir.parent / f".{self.unpacked_dir.name}.validation.json"
+
+    def _original_hash(self):
+        """Content hash of the original file that validation compares against."""
+        if self._original_sha1 is None:
+            self._original_sha1 = hashlib.sha1(
+                self.original_file.read_bytes()
+            ).hexdigest()
+        return self._original_sha1
+
+    def _load_state(self):
+        """Load the state of the last successful validation, if it still applies.
+
+        The state is discarded if it is unreadable or malformed, or if it was
+        written by a different validator or against a different original file;
+        every part is checked in that case.
+        """
+        try:
+            state = json.loads(self._state_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or not isinstance(state.get("parts"), dict):
+            return None
+        for entry in state["parts"].values():
+            if not (
+                isinstance(entry, dict)
+                and isinstance(entry.get("sha1"), str)
+                and isinstance(entry.get("summary"), dict)
+                and {"root", "global_ids"} <= entry["summary"].keys()
+            ):
+                return None
+        if state.get("validator") != type(self).__name__:
+            return None
+        if state.get("original_sha1") != self._original_hash():
+            return None
+        return state
+
+    def _compute_dirty_parts(self, dirty_parts):
+        """Determine which parts changed since the last successful validation.
+
+        Returns:
+            set: Part names to re-check, or None if every part must be checked
+        """
+        if not self.incremental:
+            return None
+
+        part_names = [self._part_name(f) for f in self.xml_files]
+        stored = self._state["parts"] if self._state else {}
+
+        if dirty_parts is not None:
+            # Trust the caller for known parts; hash only parts that may have changed
+            dirty = {Path(p).as_posix() for p in dirty_parts}
+            dirty.update(p for p in part_names if p not in stored)
+            for part in part_names:
+                if part in dirty:
+                    self._part_hashes[part] = self._hash_part(part)
+                else:
+                    self._part_hashes[part] = stored[part]["sha1"]
+        else:
+            for part in part_names:
+                self._part_hashes[part] = self._hash_part(part)
+            dirty = {
+                part
+                for part in part_names
+                if stored.get(part, {}).get("sha1") != self._part_hashes[part]
+            }
+
+        return dirty if self._state else None
+
+    def _hash_part(self, part_name):
+        """Content hash of a part in unpacked_dir."""
+        return hashlib.sha1((self.unpacked_dir / part_name).read_bytes()).hexdigest()
+
+    def _is_dirty(self, xml_file):
+        """Check if a file must be re-checked (always True when not incremental)."""
+        if self._dirty_parts is None:
+            return True
+        return self._part_name(xml_file) in self._dirty_parts
+
+    def _changed_files(self):
+        """XML files that per-part checks need to look at."""
+        return [f for f in self.xml_files if self._is_dirty(f)]
+
+    def _part_summary(self, xml_file):
+        """Return what cross-part checks need to know about a file.
+
+        For unchanged parts the summary comes from the stored state; otherwise
+        it is computed from the (cached) parsed tree.
+
+        Returns:
+            dict: {"root": root element local name,
+                   "global_ids": [[tag, id_value, line], ...]}
+        """
+        part = self._part_name(xml_file)
+        if part not in self._summaries:
+            if not self._is_dirty(xml_file):
+                self._summaries[part] = self._state["parts"][part]["summary"]
+            else:
+                root_tag = self._read_root(xml_file).tag
+                self._summaries[part] = {
+                    "root": root_tag.split("}")[-1] if "}" in root_tag else root_tag,
+                    "global_ids": [
+                        [tag, id_value, line]
+                        for tag, _, scope, id_value, line in self._collect_ids(xml_file)
+                        if scope == "global"
+                    ],
+                }
+        return self._summaries[part]
+
+    def save_validation_state(self):
+        """Record part hashes and summaries after a successful validation.
+
+        Subclasses call this when all checks pass. Does nothing unless the
+        validator was created with incremental=True or dirty_parts.
+        """
+        if not self.incremental:
+            return
+
+        parts = {}
+        for xml_file in self.xml_files:
+            part = self._part_name(xml_file)
+            parts[part] = {
+                "sha1": self._part_hashes.get(part) or self._hash_part(part),
+                "summary": self._part_summary(xml_file),
+            }
+        state = {
+            "validator": type(self).__name__,
+            "original_sha1": self._original_hash(),
+            "parts": parts,
+        }
+        self._state_path().write_text(json.dumps(state), encoding="utf-8")
+
+    def _parse_xml(self, xml_file):
+        """Parse an XML file, reusing the cached tree while the file is unchanged.
+
+        The tree is keyed by path and re-parsed only when the file's mtime or size
+        changes. Parse errors are cached and re-raised the same way. The returned
+        tree is shared between checks and must not be modified; use
+        _parse_xml_copy() for checks that need to mutate it. In streaming mode
+        nothing is cached: every call parses the file again, and the tree is
+        freed as soon as the caller drops it.
+
+        Args:
+            xml_file: Path to the XML file
+
+        Returns:
+            lxml.etree._ElementTree: The parsed (shared) tree
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        xml_file = Path(xml_file)
+        if self.streaming:
+            self.parse_counts[xml_file] += 1
+            return lxml.etree.parse(str(xml_file))
+
+        version = self._file_version(xml_file)
+        cached = self._tree_cache.get(xml_file)
+        if cached is None or cached[0] != version:
+            self.parse_counts[xml_file] += 1
+            try:
+                result = lxml.etree.parse(str(xml_file))
+            except Exception as e:
+                result = e
+            cached = (version, result)
+            self._tree_cache[xml_file] = cached
+
+        if isinstance(cached[1], Exception):
+            raise cached[1]
+        return cached[1]
+
+    def _file_version(self, xml_file):
+        """Return (mtime_ns, size) of a file, used to invalidate cached results."""
+        stat = Path(xml_file).stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _parse_xml_copy(self, xml_file):
+        """Return a private copy of the cached tree that the caller may modify."""
+        if self.streaming:
+            # Not cached, so the parsed tree is already private
+            return self._parse_xml(xml_file)
+        return copy.deepcopy(self._parse_xml(xml_file))
+
+    def _read_root(self, xml_file):
+        """Return the root element of a file, with its attributes and namespaces.
+
+        In streaming mode only the root's start tag is read, so the element has
+        no children.
+        """
+        if not self.streaming:
+            return self._parse_xml(xml_file).getroot()
+        elements = self._stream_elements(xml_file)
+        try:
+            return next(elements)
+        finally:
+            elements.close()
+
+    @property
+    def original_package(self):
+        """OriginalPackage for the original file, opened on first use."""
+        if self._original_package is None:
+            self._original_package = OriginalPackage(self.original_file)
+        return self._original_package
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self._changed_files():
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                if self.streaming:
+                    for _ in self._stream_elements(xml_file):
+                        pass
+                else:
+                    self._parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -157,9 +444,9 @@ class BaseSchemaValidator:
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self._changed_files():
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._read_root(xml_file)
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -190,74 +477,49 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                if self._is_dirty(xml_file):
+                    occurrences = self._collect_ids(xml_file)
+                else:
+                    # Unchanged part: only its global IDs can conflict with others
+                    occurrences = [
+                        (tag, None, "global", id_value, line)
+                        for tag, id_value, line in self._part_summary(xml_file)[
+                            "global_ids"
+                        ]
+                    ]
                 file_ids = {}  # Track IDs that must be unique within this file
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
+                for tag, attr_name, scope, id_value, line in occurrences:
+                    if scope == "global":
+                        # Check global uniqueness
+                        if id_value in global_ids:
+                            prev_file, prev_line, prev_tag = global_ids[id_value]
+                            errors.append(
+                                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                                f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
                             )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
+                        else:
+                            global_ids[id_value] = (
+                                xml_file.relative_to(self.unpacked_dir),
+                                line,
+                                tag,
+                            )
+                    elif scope == "file":
+                        # Check file-level uniqueness
+                        key = (tag, attr_name)
+                        if key not in file_ids:
+                            file_ids[key] = {}
+
+                        if id_value in file_ids[key]:
+                            prev_line = file_ids[key][id_value]
+                            errors.append(
+                                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                f"Line {line}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                f"(first occurrence at line {prev_line})"
+                            )
+                        else:
+                            file_ids[key][id_value] = line
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
@@ -274,6 +536,101 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _collect_ids(self, xml_file):
+        """Collect the IDs in a file that are subject to UNIQUE_ID_REQUIREMENTS.
+
+        Elements inside mc:AlternateContent are ignored. In streaming mode the
+        file is read with iterparse instead of building a tree. Results are
+        cached until the file changes.
+
+        Returns:
+            list: (tag, attr_name, scope, id_value, line) tuples in document order
+        """
+        version = self._file_version(xml_file)
+        cached = self._ids_cache.get(xml_file)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        if self.streaming:
+            elements = self._stream_elements(xml_file, skip_alternate_content=True)
+        else:
+            # Work on a copy since AlternateContent subtrees are removed below
+            root = self._parse_xml_copy(xml_file).getroot()
+
+            # Remove all mc:AlternateContent elements from the tree
+            mc_elements = root.xpath(
+                ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+            )
+            for elem in mc_elements:
+                elem.getparent().remove(elem)
+            elements = root.iter()
+
+        # Now collect IDs from the remaining elements
+        occurrences = []
+        for elem in elements:
+            occurrence = self._id_occurrence(elem)
+            if occurrence is not None:
+                occurrences.append(occurrence)
+
+        self._ids_cache[xml_file] = (version, occurrences)
+        return occurrences
+
+    def _id_occurrence(self, elem):
+        """Return (tag, attr_name, scope, id_value, line) if elem has a required ID."""
+        # Get the element name without namespace
+        tag = elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
+
+        # Check if this element type has ID uniqueness requirements
+        if tag not in self.UNIQUE_ID_REQUIREMENTS:
+            return None
+        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+        # Look for the specified attribute
+        for attr, value in elem.attrib.items():
+            attr_local = attr.split("}")[-1].lower() if "}" in attr else attr.lower()
+            if attr_local == attr_name:
+                return (tag, attr_name, scope, value, elem.sourceline)
+        return None
+
+    def _stream_elements(self, xml_file, skip_alternate_content=False):
+        """Yield the elements of a file in document order without keeping the tree.
+
+        Elements are yielded at their start tag, so their tag, attributes and
+        sourceline are available but their children are not. Each element is
+        cleared (and removed from its parent) once its end tag is reached, so
+        memory stays bounded regardless of file size.
+
+        Args:
+            xml_file: Path to the XML file
+            skip_alternate_content: If True, elements inside mc:AlternateContent
+                (below the root) are not yielded
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        self.parse_counts[Path(xml_file)] += 1
+        mc_tag = f"{{{self.MC_NAMESPACE}}}AlternateContent"
+        depth = 0  # Depth of the current element (root = 0)
+        mc_depth = 0  # Number of open mc:AlternateContent ancestors
+
+        for event, elem in lxml.etree.iterparse(str(xml_file), events=("start", "end")):
+            if event == "start":
+                if skip_alternate_content and depth > 0 and elem.tag == mc_tag:
+                    mc_depth += 1
+                depth += 1
+                if mc_depth == 0:
+                    yield elem
+            else:
+                depth -= 1
+                if skip_alternate_content and depth > 0 and elem.tag == mc_tag:
+                    mc_depth -= 1
+                elem.clear()
+                # Drop already processed siblings so the parent doesn't grow
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
@@ -296,7 +653,7 @@ class BaseSchemaValidator:
                 and file_path.name != "[Content_Types].xml"
                 and not file_path.name.endswith(".rels")
             ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
+                all_files.append(_resolve_part_path(file_path))
 
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
@@ -310,7 +667,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -339,7 +696,7 @@ class BaseSchemaValidator:
 
                         # Normalize the path and check if it exists
                         try:
-                            target_path = target_path.resolve()
+                            target_path = _resolve_part_path(target_path)
                             if target_path.exists() and target_path.is_file():
                                 referenced_files.add(target_path)
                                 all_referenced_files.add(target_path)
@@ -390,8 +747,6 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -409,9 +764,13 @@ class BaseSchemaValidator:
             if not rels_file.exists():
                 continue
 
+            # Skip pairs where neither the part nor its .rels changed
+            if not self._is_dirty(xml_file) and not self._is_dirty(rels_file):
+                continue
+
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -433,11 +792,14 @@ class BaseSchemaValidator:
                         )
                         rid_to_type[rid] = type_name
 
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                # Parse (or stream) the XML file to find all r:id references
+                if self.streaming:
+                    elements = self._stream_elements(xml_file)
+                else:
+                    elements = self._parse_xml(xml_file).getroot().iter()
 
                 # Find all elements with r:id attributes
-                for elem in xml_root.iter():
+                for elem in elements:
                     # Check for r:id attribute (relationship ID)
                     rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
                     if rid_attr:
@@ -531,7 +893,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -593,8 +955,8 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
+                    # Unchanged parts use the root name recorded by the last run
+                    root_name = self._part_summary(xml_file)["root"]
 
                     if root_name in declarable_roots and path_str not in declared_parts:
                         errors.append(
@@ -649,7 +1011,7 @@ class BaseSchemaValidator:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
         """
         # Resolve both paths to handle symlinks
-        xml_file = Path(xml_file).resolve()
+        xml_file = _resolve_part_path(xml_file)
         unpacked_dir = self.unpacked_dir.resolve()
 
         # Validate current file
@@ -691,12 +1053,12 @@ class BaseSchemaValidator:
         original_error_count = 0
         valid_count = 0
         skipped_count = 0
+        stats_before = SCHEMA_REGISTRY.stats()
+        xml_files = self._changed_files()
+        results = self._validate_files_against_xsd(xml_files)
 
-        for xml_file in self.xml_files:
+        for xml_file, (is_valid, new_file_errors) in zip(xml_files, results):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,21 +1074,40 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
         # Print summary
         if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
+            print(f"Validated {len(xml_files)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
+            if len(xml_files) < len(self.xml_files):
+                print(
+                    f"  - Unchanged since last successful validation: "
+                    f"{len(self.xml_files) - len(xml_files)}"
+                )
             if original_error_count:
                 print(f"  - With original errors (ignored): {original_error_count}")
             print(
                 f"  - With NEW errors: {len(new_errors) > 0 and len([e for e in new_errors if not e.startswith('    ')]) or 0}"
             )
+            if self._use_process_pool(xml_files):
+                print(f"  - Validated in {self.jobs} worker processes")
+            else:
+                stats_after = SCHEMA_REGISTRY.stats()
+                compile_time = (
+                    stats_after["compile_seconds"] - stats_before["compile_seconds"]
+                )
+                validate_time = (
+                    stats_after["validate_seconds"] - stats_before["validate_seconds"]
+                )
+                print(
+                    f"  - Schema compile time: {compile_time:.2f}s, "
+                    f"validation time: {validate_time:.2f}s"
+                )
 
         if new_errors:
             print("\nFAILED - Found NEW validation errors:")
@@ -738,6 +1119,39 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _use_process_pool(self, xml_files):
+        """Check if XSD validation should be fanned out to worker processes."""
+        return bool(self.jobs) and self.jobs > 1 and len(xml_files) > 1
+
+    def _validate_files_against_xsd(self, xml_files):
+        """Run validate_file_against_xsd for each file, in parallel if jobs > 1.
+
+        Each worker process builds its own validator, so it keeps its own
+        compiled schemas and original-package baseline cache. Results are
+        returned in the order of xml_files, which keeps the report identical
+        to the serial path.
+
+        Returns:
+            list: (is_valid, new_errors_set) tuples, one per file
+        """
+        if not self._use_process_pool(xml_files):
+            return [
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in xml_files
+            ]
+
+        chunksize = max(1, len(xml_files) // (self.jobs * 4))
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_xsd_worker,
+            initargs=(type(self), self.unpacked_dir, self.original_file),
+        ) as executor:
+            return list(
+                executor.map(
+                    _validate_file_xsd_in_worker, xml_files, chunksize=chunksize
+                )
+            )
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -762,11 +1176,16 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+    def _clean_ignorable_namespaces(self, xml_doc, in_place=False):
+        """Remove attributes and elements not in allowed namespaces.
+
+        Works on a copy unless in_place is True, in which case xml_doc is modified.
+        """
+        if not in_place:
+            xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
+            xml_copy = lxml.etree.fromstring(xml_string)
+        else:
+            xml_copy = xml_doc.getroot()
 
         # Remove attributes not in allowed namespaces
         for elem in xml_copy.iter():
@@ -830,38 +1249,53 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            xml_doc = self._parse_xml(xml_file)
+            relative_path = xml_file.relative_to(base_path)
+        except Exception as e:
+            return False, {str(e)}
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+        # In streaming mode the tree is not cached, so it can be cleaned in place
+        return self._validate_tree_xsd(
+            xml_doc, schema_path, relative_path, private=self.streaming
+        )
+
+    def _validate_tree_xsd(self, xml_doc, schema_path, relative_path, private=False):
+        """Validate a parsed XML tree against an XSD schema.
+
+        Args:
+            xml_doc: Parsed lxml ElementTree
+            schema_path: Path to the XSD schema to validate against
+            relative_path: Path of the part relative to the package root
+            private: If True, the tree is not used elsewhere and is cleaned in
+                place instead of being copied first
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
+        Returns:
+            tuple: (is_valid, errors_set)
+        """
+        try:
+            # Load compiled schema (compiled once per process)
+            SCHEMA_REGISTRY.get(schema_path)
+
+            # Preprocess XML
+            xml_doc, _ = self._remove_template_tags_from_text_nodes(
+                xml_doc, in_place=private
+            )
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
+            # Clean ignorable namespaces if needed; the tree is a copy by now
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
             ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+                xml_doc = self._clean_ignorable_namespaces(xml_doc, in_place=True)
 
             # Validate
-            if schema.validate(xml_doc):
+            is_valid, messages = SCHEMA_REGISTRY.validate(schema_path, xml_doc)
+            if is_valid:
                 return True, set()
             else:
-                errors = set()
-                for error in schema.error_log:
-                    # Store normalized error message (without line numbers for comparison)
-                    errors.add(error.message)
-                return False, errors
+                # Store normalized error messages (without line numbers for comparison)
+                return False, set(messages)
 
         except Exception as e:
             return False, {str(e)}
@@ -869,46 +1303,54 @@ class BaseSchemaValidator:
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The part is read directly from the original archive and the result is
+        memoized, so each original part is validated at most once per run.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
-        xml_file = Path(xml_file).resolve()
+        xml_file = _resolve_part_path(xml_file)
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
+        part_name = relative_path.as_posix()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        if part_name not in self._original_errors:
+            self._original_errors[part_name] = self._compute_original_file_errors(
+                xml_file, part_name
+            )
+        return self._original_errors[part_name]
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+    def _compute_original_file_errors(self, xml_file, part_name):
+        """Validate one part of the original archive. Returns a set of error messages."""
+        if not self.original_package.has_part(part_name):
+            # File didn't exist in original, so no original errors
+            return set()
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        schema_path = self._get_schema_path(xml_file)
+        if not schema_path:
+            return set()
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+        try:
+            xml_doc = self.original_package.parse(part_name)
+        except Exception as e:
+            return {str(e)}
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        is_valid, errors = self._validate_tree_xsd(
+            xml_doc, schema_path, Path(part_name), private=True
+        )
+        return errors if errors else set()
 
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
+    def _remove_template_tags_from_text_nodes(self, xml_doc, in_place=False):
         """Remove template tags from XML text nodes and collect warnings.
 
         Template tags follow the pattern {{ ... }} and are used as placeholders
         for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
+        XSD validation while preserving XML structure. Works on a copy unless
+        in_place is True, in which case xml_doc is modified.
 
         Returns:
             tuple: (cleaned_xml_doc, warnings_list)
@@ -916,9 +1358,12 @@ class BaseSchemaValidator:
         warnings = []
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
 
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        if not in_place:
+            # Create a copy of the document to avoid modifying the original
+            xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
+            xml_copy = lxml.etree.fromstring(xml_string)
+        else:
+            xml_copy = xml_doc.getroot()
 
         def process_text_content(text, content_type):
             if not text:
@@ -947,5 +1392,31 @@ class BaseSchemaValidator:
         return lxml.etree.ElementTree(xml_copy), warnings
 
 
+# Validator owned by the current worker process (see _init_xsd_worker)
+_worker_validator = None
+
+
+def _resolve_part_path(path):
+    """
+    Make a file path absolute and resolve its directories, but not the file.
+
+    The parts of an unpacked directory may be symlinks (see the Workspace
+    class of the docx skill); following them would leave unpacked_dir.
+    """
+    path = Path(os.path.normpath(Path(path).absolute()))
+    return path.parent.resolve() / path.name
+
+
+def _init_xsd_worker(validator_cls, unpacked_dir, original_file):
+    """Create the per-process validator used by XSD worker processes."""
+    global _worker_validator
+    _worker_validator = validator_cls(unpacked_dir, original_file)
+
+
+def _validate_file_xsd_in_worker(xml_file):
+    """Validate one file against its schema in a worker process."""
+    return _worker_validator.validate_file_against_xsd(xml_file, verbose=False)
+
+
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,230 @@
+import contextlib
+import io
+import json
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from validation import DOCXSchemaValidator
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+PKG_NS = "http://schemas.openxmlformats.org/package/2006"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+WML = "application/vnd.openxmlformats-officedocument.wordprocessingml"
+
+PACKAGE = {
+    "[Content_Types].xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="{PKG_NS}/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml" ContentType="{WML}.document.main+xml"/>
+  <Override PartName="/word/settings.xml" ContentType="{WML}.settings+xml"/>
+</Types>
+""",
+    "_rels/.rels": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="{PKG_NS}/relationships">
+  <Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="word/document.xml"/>
+</Relationships>
+""",
+    "word/_rels/document.xml.rels": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="{PKG_NS}/relationships">
+  <Relationship Id="rId1" Type="{REL_NS}/settings" Target="settings.xml"/>
+</Relationships>
+""",
+    "word/settings.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings xmlns:w="{W_NS}">
+  <w:defaultTabStop w:val="720"/>
+</w:settings>
+""",
+    "word/document.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}">
+  <w:body>
+    <w:p>
+      <w:r>
+        <w:t>First paragraph</w:t>
+      </w:r>
+    </w:p>
+  </w:body>
+</w:document>
+""",
+}
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the ooxml/scripts directory: python -m unittest validation.base_test
+class ValidatorTestCase(unittest.TestCase):
+    def setUp(self):
+        """Write the package both as an original .docx and unpacked"""
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.original = self.tmp / "original.docx"
+        self.unpacked = self.tmp / "unpacked"
+        with zipfile.ZipFile(self.original, "w") as archive:
+            for part, content in PACKAGE.items():
+                archive.writestr(part, content)
+                path = self.unpacked / part
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(content, encoding="utf-8")
+
+    def validate(self, **kwargs):
+        """Run a DOCXSchemaValidator quietly and return it with its result"""
+        validator = DOCXSchemaValidator(self.unpacked, self.original, **kwargs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = validator.validate()
+        return validator, result
+
+
+class TestParseCounts(ValidatorTestCase):
+    def test_each_part_parsed_once(self):
+        """Test that all checks share one parsed tree per part"""
+        validator, result = self.validate()
+        self.assertTrue(result)
+        self.assertEqual(set(validator.parse_counts), set(validator.xml_files))
+        self.assertEqual(max(validator.parse_counts.values()), 1)
+
+    def test_reads_per_part_when_streaming(self):
+        """Test how often each part is read when trees are not cached"""
+        validator, result = self.validate(streaming=True)
+        self.assertTrue(result)
+        counts = {
+            validator._part_name(path): count
+            for path, count in validator.parse_counts.items()
+        }
+        # Every part is read by the well-formedness, namespace, ID and XSD
+        # checks. On top of that [Content_Types].xml is parsed by the content
+        # type check, .rels files by the file reference check, parts with a
+        # content type have their root read for it, document.xml.rels and
+        # document.xml are read by the relationship ID check, and document.xml
+        # is parsed by the whitespace, deletion and insertion checks.
+        self.assertEqual(
+            counts,
+            {
+                "[Content_Types].xml": 5,
+                "_rels/.rels": 5,
+                "word/_rels/document.xml.rels": 6,
+                "word/settings.xml": 5,
+                "word/document.xml": 9,
+            },
+        )
+
+
+class TestStreaming(ValidatorTestCase):
+    def test_same_errors_as_tree_mode(self):
+        """Test that both modes report the same duplicate IDs and line numbers"""
+        mc = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+        (self.unpacked / "word" / "document.xml").write_text(
+            f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}" xmlns:mc="{mc}">
+  <w:body>
+    <w:p>
+      <w:bookmarkStart w:id="1" w:name="first"/>
+      <mc:AlternateContent>
+        <mc:Choice Requires="w14">
+          <w:bookmarkStart w:id="1" w:name="choice"/>
+        </mc:Choice>
+        <mc:Fallback>
+          <w:bookmarkStart w:id="2" w:name="fallback"/>
+        </mc:Fallback>
+      </mc:AlternateContent>
+      <w:bookmarkStart w:id="2" w:name="second"/>
+      <w:bookmarkStart w:id="1" w:name="third"/>
+    </w:p>
+  </w:body>
+</w:document>
+""",
+            encoding="utf-8",
+        )
+        outputs = []
+        for streaming in (False, True):
+            validator = DOCXSchemaValidator(
+                self.unpacked, self.original, streaming=streaming
+            )
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertFalse(validator.validate_unique_ids())
+            outputs.append(output.getvalue())
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn(
+            "Line 15: Duplicate id='1' in <bookmarkstart> (first occurrence at line 5)",
+            outputs[1],
+        )
+        # The IDs inside mc:AlternateContent are not counted
+        self.assertIn("Found 1 ID uniqueness violations", outputs[1])
+
+
+class TestIncrementalValidation(ValidatorTestCase):
+    def setUp(self):
+        """Validate once so that the validation state is saved"""
+        super().setUp()
+        self.document = self.unpacked / "word" / "document.xml"
+        self.settings = self.unpacked / "word" / "settings.xml"
+        validator, result = self.validate(incremental=True)
+        self.assertTrue(result)
+        self.assertIsNone(validator._dirty_parts)
+        self.state_path = validator._state_path()
+        self.assertTrue(self.state_path.exists())
+
+    def edit_document(self, old, new):
+        self.document.write_text(
+            self.document.read_text(encoding="utf-8").replace(old, new),
+            encoding="utf-8",
+        )
+
+    def test_unchanged_parts_are_skipped(self):
+        """Test that a second run skips every unchanged part"""
+        validator, result = self.validate(incremental=True)
+        self.assertTrue(result)
+        self.assertEqual(validator._dirty_parts, set())
+        self.assertEqual(validator.parse_counts[self.document], 0)
+        self.assertEqual(validator.parse_counts[self.settings], 0)
+
+    def test_edited_part_is_rechecked(self):
+        """Test that only the edited part is re-checked"""
+        self.edit_document("First paragraph", "Edited paragraph")
+        validator, result = self.validate(incremental=True)
+        self.assertTrue(result)
+        self.assertEqual(validator._dirty_parts, {"word/document.xml"})
+        self.assertEqual(validator.parse_counts[self.document], 1)
+        self.assertEqual(validator.parse_counts[self.settings], 0)
+
+    def test_invalid_edit_fails_on_every_run(self):
+        """Test that a failed run does not record the invalid part as checked"""
+        self.edit_document("</w:body>", "<w:bogus/></w:body>")
+        for _ in range(2):
+            validator, result = self.validate(incremental=True)
+            self.assertFalse(result)
+            self.assertEqual(validator._dirty_parts, {"word/document.xml"})
+
+    def test_unusable_state_falls_back_to_full_run(self):
+        """Test that a missing, corrupt or foreign state file checks every part"""
+        state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        without_summary = json.loads(json.dumps(state))
+        del without_summary["parts"]["word/document.xml"]["summary"]
+        states = {
+            "missing": None,
+            "not JSON": "{",
+            "not an object": "[]",
+            "without parts": json.dumps({**state, "parts": None}),
+            "without a summary": json.dumps(without_summary),
+            "other validator": json.dumps(
+                {**state, "validator": "PPTXSchemaValidator"}
+            ),
+            "other original": json.dumps({**state, "original_sha1": "0" * 40}),
+        }
+        self.edit_document("</w:body>", "<w:bogus/></w:body>")
+        for description, content in states.items():
+            if content is None:
+                self.state_path.unlink()
+            else:
+                self.state_path.write_text(content, encoding="utf-8")
+            validator, result = self.validate(incremental=True)
+            self.assertIsNone(validator._dirty_parts, description)
+            self.assertEqual(validator.parse_counts[self.settings], 1, description)
+            self.assertFalse(result, description)
+
+
+if __name__ == "__main__":
+    unittest.main()
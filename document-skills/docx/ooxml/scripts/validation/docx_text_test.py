@@ -0,0 +1,51 @@
+import io
+import unittest
+
+from validation.docx_text import W_NS, iter_paragraphs
+
+
+def document(body):
+    return io.BytesIO(
+        f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>'.encode()
+    )
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the ooxml/scripts directory: python -m unittest validation.docx_text_test
+class TestIterParagraphs(unittest.TestCase):
+    def test_deleted_tabs_and_breaks_follow_the_deletion(self):
+        body = (
+            "<w:p><w:r><w:t>Hello</w:t></w:r>"
+            '<w:del w:author="Claude"><w:r><w:tab/><w:delText>gone</w:delText>'
+            "<w:br/></w:r></w:del>"
+            "<w:r><w:t>World</w:t></w:r></w:p>"
+        )
+        [paragraph] = iter_paragraphs(document(body))
+        self.assertEqual(paragraph.text, "HelloWorld")
+        [paragraph] = iter_paragraphs(document(body), include_deletions=True)
+        self.assertEqual(paragraph.text, "Hello\tgone\nWorld")
+
+    def test_nested_paragraphs_are_yielded_once(self):
+        body = (
+            "<w:p><w:r><w:t>Outer</w:t></w:r><w:r><w:txbxContent>"
+            "<w:p><w:r><w:t>Box</w:t></w:r></w:p>"
+            "</w:txbxContent></w:r><w:r><w:t> end</w:t></w:r></w:p>"
+        )
+        outer, box = iter_paragraphs(document(body))
+        self.assertEqual((outer.text, outer.parent), ("Outer end", None))
+        self.assertEqual((box.text, box.parent), ("Box", 0))
+
+    def test_changes_outside_paragraphs_are_reported(self):
+        body = (
+            '<w:tbl><w:tr><w:trPr><w:ins w:author="Claude"/></w:trPr>'
+            "<w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+        )
+        authors = set()
+        [paragraph] = iter_paragraphs(document(body), changed_by=authors)
+        self.assertEqual(paragraph.inserted_by, set())
+        self.assertEqual(paragraph.cell, (0, 0, 0))
+        self.assertEqual(authors, {"Claude"})
+
+
+if __name__ == "__main__":
+    unittest.main()
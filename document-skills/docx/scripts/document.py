@@ -18,6 +18,7 @@ Usage:
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
 
     # Suggest tracked changes
+    doc.suggest_replacements([{"original": "old text", "revised": "new text"}])
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
@@ -26,23 +27,472 @@ Usage:
     doc.save()
 """
 
+import bisect
+import collections
+import copy
+import fnmatch
 import html
+import os
 import random
+import re
 import shutil
 import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
+from lxml import etree
 from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Set DOCX_DEBUG_CHANGE_IDS=1 to verify every allocated tracked change ID is unused
+DEBUG_CHANGE_IDS = os.environ.get("DOCX_DEBUG_CHANGE_IDS") == "1"
+
+# Parts opened with LxmlDocxXMLEditor when Document(engine="lxml"). Package
+# parts (settings, rels, people) stay on minidom; they are small and Document's
+# own setup code edits them through the minidom API. The comment parts are only
+# touched through CommentStore, which works on either engine.
+LXML_ENGINE_PARTS = (
+    "word/document.xml",
+    "word/footnotes.xml",
+    "word/endnotes.xml",
+    "word/header*.xml",
+    "word/footer*.xml",
+    "word/comments*.xml",
+)
+
+# Comment parts kept in sync by CommentStore, with their root elements. Each
+# is created from the template of the same name when first needed.
+COMMENT_PARTS = {
+    "word/comments.xml": "w:comments",
+    "word/commentsExtended.xml": "w15:commentsEx",
+    "word/commentsIds.xml": "w16cid:commentsIds",
+    "word/commentsExtensible.xml": "w16cex:commentsExtensible",
+}
+
+# Operations accepted by DocxXMLEditor.apply_edits
+FRAGMENT_OPERATIONS = ("replace_node", "insert_after", "insert_before", "append_to")
+BATCH_OPERATIONS = FRAGMENT_OPERATIONS + (
+    "suggest_deletion",
+    "revert_insertion",
+    "revert_deletion",
+)
+
+# Text standing for run content that suggest_replacements cannot match or
+# split (drawings, field codes, ...) and for boundaries between runs that
+# cannot be edited together
+_OPAQUE = "\ufffc"
+
+# Run children with a text equivalent; w:t holds text, other children are opaque
+_RUN_TEXT_ELEMENTS = {"w:tab": "\t", "w:br": "\n", "w:cr": "\n"}
+
+# Runs inside these elements are left alone by suggest_replacements
+_TRACKED_CHANGE_TAGS = ("w:ins", "w:del", "w:moveFrom", "w:moveTo")
+
+# Matches the w:id of a w:ins or w:del start tag in raw XML
+_CHANGE_ID_PATTERN = re.compile(rb"<w:(?:ins|del)\b[^>]*?\sw:id=[\"'](\d+)[\"']")
+
+
+class ChangeIdAllocator:
+    """Monotonic source of w:id values for tracked changes (w:ins, w:del).
+
+    Tracked change IDs must be unique across document.xml, footnotes, endnotes,
+    headers and footers, so a Document shares one allocator between all of its
+    editors. The allocator is seeded from a single scan and then counts upward
+    instead of rescanning the DOM for every new change.
+
+    Attributes:
+        next_id (int): ID returned by the next call to allocate()
+        debug (bool): Check each allocated ID against the registered editors
+    """
+
+    def __init__(self, next_id=0, debug=DEBUG_CHANGE_IDS):
+        self.next_id = next_id
+        self.debug = debug
+        self.editors = []
+
+    @classmethod
+    def from_parts(cls, xml_files, debug=DEBUG_CHANGE_IDS):
+        """Create an allocator seeded from the given XML part files."""
+        allocator = cls(debug=debug)
+        for xml_file in xml_files:
+            for match in _CHANGE_ID_PATTERN.finditer(xml_file.read_bytes()):
+                allocator.observe(match.group(1))
+        return allocator
+
+    @classmethod
+    def from_editor(cls, editor, debug=DEBUG_CHANGE_IDS):
+        """Create an allocator seeded from the tracked changes in one editor."""
+        allocator = cls(debug=debug)
+        for tag in ("w:ins", "w:del"):
+            for elem in editor._iter_elements(tag):
+                allocator.observe(editor._attribute(elem, "w:id"))
+        return allocator
+
+    def observe(self, change_id):
+        """Record an existing ID so it is never handed out."""
+        try:
+            self.next_id = max(self.next_id, int(change_id) + 1)
+        except ValueError:
+            pass
+
+    def allocate(self):
+        """Return a new, unused tracked change ID.
+
+        Raises:
+            RuntimeError: In debug mode, if the ID is already used in a loaded part
+        """
+        change_id = self.next_id
+        self.next_id += 1
+        if self.debug:
+            for editor in self.editors:
+                for tag in ("w:ins", "w:del"):
+                    for elem in editor._iter_elements(tag):
+                        if editor._attribute(elem, "w:id") == str(change_id):
+                            raise RuntimeError(
+                                f"Tracked change ID {change_id} is already used "
+                                f"in {editor.xml_path.name}"
+                            )
+        return change_id
+
+
+class Workspace:
+    """Copy-on-write view of an unpacked document directory.
+
+    The original directory is never modified. Parts are copied into the
+    overlay directory the first time they are opened for writing; reads of
+    all other parts fall through to the original, so setting up a workspace
+    copies nothing, however large the document's media is.
+
+    Attributes:
+        original_path (Path): Unpacked document directory (read-only)
+        overlay_path (Path): Directory holding changed and added parts
+    """
+
+    def __init__(self, original_path, overlay_path):
+        self.original_path = Path(original_path)
+        self.overlay_path = Path(overlay_path)
+        self.overlay_path.mkdir(parents=True, exist_ok=True)
+
+    def _part_name(self, part):
+        """Return the part name ("word/document.xml") of a part name or overlay path."""
+        part = Path(part)
+        if part.is_absolute():
+            part = part.relative_to(self.overlay_path)
+        return part.as_posix()
+
+    def path(self, part):
+        """Return the file a part is read from: its overlay copy, else the original."""
+        part_name = self._part_name(part)
+        overlay_file = self.overlay_path / part_name
+        return overlay_file if overlay_file.exists() else self.original_path / part_name
+
+    def exists(self, part):
+        """Check whether a part exists in the overlay or the original."""
+        return self.path(part).is_file()
+
+    def write_path(self, part):
+        """Return the overlay file of a part, copying the original there first."""
+        part_name = self._part_name(part)
+        overlay_file = self.overlay_path / part_name
+        if not overlay_file.exists():
+            overlay_file.parent.mkdir(parents=True, exist_ok=True)
+            original_file = self.original_path / part_name
+            if original_file.is_file():
+                shutil.copy2(original_file, overlay_file)
+        return overlay_file
+
+    def parts(self, pattern="**/*"):
+        """Return the sorted part names matching a glob pattern, in either layer."""
+        names = set()
+        for root in (self.original_path, self.overlay_path):
+            names.update(
+                path.relative_to(root).as_posix()
+                for path in root.glob(pattern)
+                if path.is_file()
+            )
+        return sorted(names)
+
+    def files(self, pattern="**/*"):
+        """Return the files to read for the parts matching a glob pattern."""
+        return [self.path(part) for part in self.parts(pattern)]
+
+    def changed_parts(self):
+        """Return the names of the parts in the overlay (copied or added)."""
+        return [
+            path.relative_to(self.overlay_path).as_posix()
+            for path in sorted(self.overlay_path.rglob("*"))
+            if path.is_file()
+        ]
+
+    def view(self, view_path):
+        """
+        Build a directory of symlinks showing the merged document.
+
+        Used for validators, which expect a complete unpacked directory. The
+        view is rebuilt from scratch on every call.
+
+        Returns:
+            Path: view_path
+        """
+        view_path = Path(view_path)
+        if view_path.exists():
+            shutil.rmtree(view_path)
+        for part in self.parts():
+            link = view_path / part
+            link.parent.mkdir(parents=True, exist_ok=True)
+            link.symlink_to(self.path(part).resolve())
+        return view_path
+
+    def save(self, destination, unchanged=()):
+        """
+        Write the merged document to a directory.
+
+        Writing back to the original directory copies only the changed parts;
+        any other destination receives every part.
+
+        Args:
+            destination: Directory to write to
+            unchanged: Overlay parts known to still match the original (e.g.
+                parts opened by an editor that was never modified)
+
+        Returns:
+            list: Names of the parts written
+        """
+        destination = Path(destination)
+        if destination.resolve() == self.original_path.resolve():
+            parts = [part for part in self.changed_parts() if part not in unchanged]
+        else:
+            parts = self.parts()
+        for part in parts:
+            target = destination / part
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(self.path(part), target)
+        return parts
+
+
+class CommentStore:
+    """Comments of a Document, indexed across the four comment parts.
+
+    comments.xml, commentsExtended.xml, commentsIds.xml and
+    commentsExtensible.xml are scanned once, when the store is created;
+    after that comments are looked up by w:id, paraId or durableId in
+    constant time. New comments are only recorded in memory. flush() writes
+    them to all four parts together, with one append per part, and is called
+    by Document.save and before a comment part is opened.
+
+    Attributes:
+        by_id (dict): Comment ID -> comment info dict with "id", "para_id",
+            "durable_id" and "parent_para_id" (comments without a paraId
+            cannot be replied to and are not included)
+        by_para_id (dict): paraId -> comment info dict
+        durable_ids (set): durableIds used by any comment
+        next_id (int): ID given to the next comment added
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self.by_id = {}
+        self.by_para_id = {}
+        self.durable_ids = set()
+        self.next_id = 0
+        self._pending = []
+        self._load()
+
+    def _load(self):
+        """Index the comments already in the document."""
+        workspace = self.document._workspace
+        if not workspace.exists("word/comments.xml"):
+            return
+
+        editor = self.document["word/comments.xml"]
+        for comment_elem in editor._iter_elements("w:comment"):
+            try:
+                comment_id = int(editor._attribute(comment_elem, "w:id"))
+            except ValueError:
+                continue
+            self.next_id = max(self.next_id, comment_id + 1)
+
+            # The paraId of the comment's first paragraph identifies it in the
+            # other comment parts
+            para_id = next(
+                (
+                    editor._attribute(elem, "w14:paraId")
+                    for elem in editor._subtree(comment_elem)
+                    if editor._tag(elem) == "w:p"
+                    and editor._attribute(elem, "w14:paraId")
+                ),
+                None,
+            )
+            if para_id:
+                self._index(
+                    {
+                        "id": comment_id,
+                        "para_id": para_id,
+                        "durable_id": None,
+                        "parent_para_id": None,
+                    }
+                )
+
+        if workspace.exists("word/commentsExtended.xml"):
+            editor = self.document["word/commentsExtended.xml"]
+            for elem in editor._iter_elements("w15:commentEx"):
+                comment = self.by_para_id.get(editor._attribute(elem, "w15:paraId"))
+                if comment is not None:
+                    parent = editor._attribute(elem, "w15:paraIdParent")
+                    comment["parent_para_id"] = parent or None
+
+        if workspace.exists("word/commentsIds.xml"):
+            editor = self.document["word/commentsIds.xml"]
+            for elem in editor._iter_elements("w16cid:commentId"):
+                durable_id = editor._attribute(elem, "w16cid:durableId")
+                self.durable_ids.add(durable_id)
+                comment = self.by_para_id.get(editor._attribute(elem, "w16cid:paraId"))
+                if comment is not None:
+                    comment["durable_id"] = durable_id
+
+        if workspace.exists("word/commentsExtensible.xml"):
+            editor = self.document["word/commentsExtensible.xml"]
+            for elem in editor._iter_elements("w16cex:commentExtensible"):
+                self.durable_ids.add(editor._attribute(elem, "w16cex:durableId"))
+
+    def _index(self, comment):
+        self.by_id[comment["id"]] = comment
+        self.by_para_id[comment["para_id"]] = comment
+        if comment["durable_id"]:
+            self.durable_ids.add(comment["durable_id"])
+
+    def add(self, text, author, initials, parent_id=None, comment_id=None):
+        """
+        Record a new comment; it is written to the comment parts by flush().
+
+        Args:
+            text: Comment text
+            author: Author name
+            initials: Author initials
+            parent_id: ID of the comment this one replies to, if any
+            comment_id: ID to use (default: next_id)
+
+        Returns:
+            dict: The comment info (see by_id)
+
+        Raises:
+            ValueError: If the parent comment is unknown or the ID is taken
+        """
+        if parent_id is not None and parent_id not in self.by_id:
+            raise ValueError(f"Parent comment with id={parent_id} not found")
+        if comment_id is None:
+            comment_id = self.next_id
+        elif comment_id in self.by_id or comment_id < 0:
+            raise ValueError(f"Comment id={comment_id} is already used")
+        self.next_id = max(self.next_id, comment_id + 1)
+
+        comment = {
+            "id": comment_id,
+            "para_id": _generate_unique_hex_id(self.by_para_id),
+            "durable_id": _generate_unique_hex_id(self.durable_ids),
+            "parent_para_id": (
+                self.by_id[parent_id]["para_id"] if parent_id is not None else None
+            ),
+        }
+        self._index(comment)
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._pending.append((comment, text, author, initials, timestamp))
+        return comment
+
+    def flush(self):
+        """Write the comments added since the last flush to the four comment parts."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        fragments = {part: [] for part in COMMENT_PARTS}
+        for comment, text, author, initials, timestamp in pending:
+            escaped_text = (
+                text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            )
+            # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p and w:rsidR on w:r
+            # are automatically added by DocxXMLEditor
+            fragments["word/comments.xml"].append(
+                f'''<w:comment w:id="{comment["id"]}" w:author="{html.escape(author, quote=True)}" w:date="{timestamp}" w:initials="{html.escape(initials, quote=True)}">
+  <w:p w14:paraId="{comment["para_id"]}" w14:textId="77777777">
+    <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
+    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
+  </w:p>
+</w:comment>'''
+            )
+            if comment["parent_para_id"]:
+                comment_ex = f'<w15:commentEx w15:paraId="{comment["para_id"]}" w15:paraIdParent="{comment["parent_para_id"]}" w15:done="0"/>'
+            else:
+                comment_ex = f'<w15:commentEx w15:paraId="{comment["para_id"]}" w15:done="0"/>'
+            fragments["word/commentsExtended.xml"].append(comment_ex)
+            fragments["word/commentsIds.xml"].append(
+                f'<w16cid:commentId w16cid:paraId="{comment["para_id"]}" w16cid:durableId="{comment["durable_id"]}"/>'
+            )
+            fragments["word/commentsExtensible.xml"].append(
+                f'<w16cex:commentExtensible w16cex:durableId="{comment["durable_id"]}" w16cex:dateUtc="{timestamp}"/>'
+            )
+
+        workspace = self.document._workspace
+        for part, root_tag in COMMENT_PARTS.items():
+            if not workspace.exists(part):
+                shutil.copy(TEMPLATE_DIR / Path(part).name, workspace.write_path(part))
+            editor = self.document[part]
+            root = editor.get_node(tag=root_tag)
+            editor.append_to(root, "\n".join(fragments[part]))
+
+
+class _TextMatcher:
+    """Aho-Corasick automaton finding many literal strings in one pass over a text."""
+
+    def __init__(self, patterns):
+        self.lengths = [len(pattern) for pattern in patterns]
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # Failure links, breadth first so shorter suffixes are done first
+        queue = collections.deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find(self, text):
+        """Yield (start, pattern index) for every occurrence, ordered by end."""
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self.lengths
+        state = 0
+        for position, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield position - lengths[index], index
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -57,7 +507,12 @@ class DocxXMLEditor(XMLEditor):
     """
 
     def __init__(
-        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        change_ids=None,
     ):
         """Initialize with required RSID and optional author.
 
@@ -66,52 +521,35 @@ class DocxXMLEditor(XMLEditor):
             rsid: RSID to automatically apply to new elements
             author: Author name for tracked changes and comments (default: "Claude")
             initials: Author initials (default: "C")
+            change_ids: Shared tracked change ID allocator (default: one seeded
+                from this file)
         """
         super().__init__(xml_path)
         self.rsid = rsid
         self.author = author
         self.initials = initials
-
-    def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        if change_ids is None:
+            change_ids = ChangeIdAllocator.from_editor(self)
+        self.change_ids = change_ids
+        self.change_ids.editors.append(self)
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._declare_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._declare_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._declare_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -129,6 +567,7 @@ class DocxXMLEditor(XMLEditor):
         """
         from datetime import datetime, timezone
 
+        self.dirty = True
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         def is_inside_deletion(elem):
@@ -167,7 +606,9 @@ class DocxXMLEditor(XMLEditor):
         def add_tracked_change_attrs(elem):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+                elem.setAttribute("w:id", str(self.change_ids.allocate()))
+            else:
+                self.change_ids.observe(elem.getAttribute("w:id"))
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -261,6 +702,333 @@ class DocxXMLEditor(XMLEditor):
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    def apply_edits(self, edits):
+        """Apply a batch of edits in one pass.
+
+        Every locator is resolved against the tree before anything changes, all
+        XML payloads are parsed together, and the edits are applied bottom-up
+        (last position in the document first) so edits inside an element run
+        before edits to the element itself. Edits on the same element run in
+        the order given, like consecutive calls would, except that insertions
+        next to a run deleted earlier in the batch go next to its w:del wrapper
+        (so suggest_deletion followed by insert_after replaces the run).
+
+        Args:
+            edits: List of (locator, operation, payload) tuples:
+                - locator: get_node keyword arguments (dict) or a DOM element
+                - operation: "replace_node", "insert_after", "insert_before",
+                  "append_to", "suggest_deletion", "revert_insertion" or
+                  "revert_deletion"
+                - payload: XML string for replace_node/insert_*/append_to,
+                  omitted or None otherwise
+
+        Returns:
+            list: One dict per edit, in input order, with "operation",
+                  "target" (resolved element), "result" (the operation's return
+                  value), "error" (message or None) and "seconds"
+
+        Raises:
+            ValueError: If a locator does not resolve, an operation is unknown,
+                        or an edit targets an element removed by a replace_node
+                        edit. The tree is left untouched in that case.
+
+        Example:
+            results = doc["word/document.xml"].apply_edits([
+                ({"tag": "w:r", "contains": "30 days"}, "suggest_deletion", None),
+                ({"tag": "w:p", "line_number": 42}, "insert_after",
+                 "<w:ins><w:r><w:t>New clause</w:t></w:r></w:ins>"),
+            ])
+        """
+        edits = [tuple(edit) + (None,) * (3 - len(edit)) for edit in edits]
+
+        # Resolve every locator against the unmodified tree
+        targets = []
+        problems = []
+        for i, (locator, operation, payload) in enumerate(edits):
+            if operation not in BATCH_OPERATIONS:
+                problems.append(f"edit {i}: unknown operation {operation!r}")
+            elif (operation in FRAGMENT_OPERATIONS) != (payload is not None):
+                problems.append(f"edit {i}: {operation} payload mismatch")
+            try:
+                if isinstance(locator, dict):
+                    targets.append(self.get_node(**locator))
+                elif self._is_attached(locator):
+                    targets.append(locator)
+                else:
+                    raise ValueError("Element is not part of the document")
+            except ValueError as e:
+                targets.append(None)
+                problems.append(f"edit {i}: {e}")
+
+        # Nothing may touch an element that a replace_node edit removes
+        replaced = {
+            target: i
+            for i, (target, (_, operation, _)) in enumerate(zip(targets, edits))
+            if operation == "replace_node" and target is not None
+        }
+        for i, target in enumerate(targets):
+            node = target
+            while node is not None:
+                if replaced.get(node, i) != i:
+                    problems.append(
+                        f"edit {i}: target is removed by a replace_node edit"
+                    )
+                    break
+                node = self._parent(node)
+
+        if problems:
+            raise ValueError("Cannot apply edits:\n  " + "\n  ".join(problems))
+
+        # Parse all payloads with a single parser run
+        fragment_edits = [i for i, edit in enumerate(edits) if edit[2] is not None]
+        parsed = self._parse_fragments([edits[i][2] for i in fragment_edits])
+        fragments = dict(zip(fragment_edits, parsed))
+
+        # Apply bottom-up; edits on the same element keep their order
+        positions = {
+            elem: position
+            for position, elem in enumerate(self._iter_elements())
+        }
+        order = sorted(range(len(edits)), key=lambda i: (-positions[targets[i]], i))
+
+        results = [None] * len(edits)
+        wrappers = {}
+        for i in order:
+            operation = edits[i][1]
+            started = time.perf_counter()
+            result, error = None, None
+            try:
+                if operation in FRAGMENT_OPERATIONS:
+                    anchor = targets[i]
+                    if operation in ("insert_after", "insert_before"):
+                        anchor = wrappers.get(anchor, anchor)
+                    result = self._place_nodes(operation, anchor, fragments[i])
+                    self._inject_attributes_to_nodes(result)
+                else:
+                    result = getattr(self, operation)(targets[i])
+                    if operation == "suggest_deletion" and result is not targets[i]:
+                        # The deleted run is now wrapped in w:del
+                        wrappers[targets[i]] = result
+            except ValueError as e:
+                error = str(e)
+            results[i] = {
+                "operation": operation,
+                "target": targets[i],
+                "result": result,
+                "error": error,
+                "seconds": time.perf_counter() - started,
+            }
+        return results
+
+    def suggest_replacements(self, replacements):
+        """Replace many text strings with tracked changes in one pass.
+
+        The text of every paragraph is indexed by run once and all targets are
+        searched for together (Aho-Corasick), so thousands of replacements cost
+        about one scan of the part. Only the runs holding a match are split;
+        the matched text goes into a w:del and the new text into a w:ins right
+        after it, both with the formatting (w:rPr) of the run they replace.
+
+        Text inside existing tracked changes, field codes, drawings and other
+        non-text run content is never matched, and a match cannot span runs
+        with different parents (e.g. into a hyperlink).
+
+        Args:
+            replacements: List of dicts with "original" (text to find),
+                "revised" (new text, "" to only delete) and optionally "all"
+                (replace every occurrence instead of the first). Items are
+                matched in document order; where matches overlap, the one that
+                starts first (then the longest) wins.
+
+        Returns:
+            list: One dict per item, in input order, with "matches" (number of
+                  occurrences replaced) and "error" (message or None)
+
+        Raises:
+            ValueError: If an item is malformed. Nothing is changed in that case.
+
+        Example:
+            results = doc["word/document.xml"].suggest_replacements([
+                {"original": "thirty (30) days", "revised": "sixty (60) days"},
+                {"original": "Seller", "revised": "Vendor", "all": True},
+            ])
+        """
+        problems = []
+        for i, item in enumerate(replacements):
+            original = item.get("original")
+            if not isinstance(original, str) or not original:
+                problems.append(f"replacement {i}: original must be non-empty text")
+            elif _OPAQUE in original:
+                problems.append(f"replacement {i}: original contains U+FFFC")
+            if not isinstance(item.get("revised", ""), str):
+                problems.append(f"replacement {i}: revised must be text")
+        if problems:
+            raise ValueError("Cannot suggest replacements:\n  " + "\n  ".join(problems))
+
+        patterns = list(dict.fromkeys(item["original"] for item in replacements))
+        pattern_items = {pattern: [] for pattern in patterns}
+        for i, item in enumerate(replacements):
+            pattern_items[item["original"]].append(i)
+        matcher = _TextMatcher(patterns)
+
+        # Find and assign matches paragraph by paragraph, in document order
+        counts = [0] * len(replacements)
+        affected = {}  # run -> (pieces, [(start, end, revised or None)])
+        for paragraph in self._iter_elements("w:p"):
+            runs, text = self._paragraph_runs(paragraph)
+            if not runs:
+                continue
+            run_starts = [run_start for run_start, _, _ in runs]
+            found = sorted(
+                matcher.find(text), key=lambda m: (m[0], -matcher.lengths[m[1]])
+            )
+            covered = 0
+            for start, pattern_index in found:
+                if start < covered:
+                    continue
+                item = next(
+                    (
+                        i
+                        for i in pattern_items[patterns[pattern_index]]
+                        if counts[i] == 0 or replacements[i].get("all")
+                    ),
+                    None,
+                )
+                if item is None:
+                    continue
+                counts[item] += 1
+                end = start + matcher.lengths[pattern_index]
+                covered = end
+                revised = replacements[item].get("revised", "")
+                self._assign_match(runs, run_starts, start, end, revised, affected)
+
+        edits = [
+            (run, "replace_node", self._replacement_runs_xml(run, pieces, cuts))
+            for run, (pieces, cuts) in affected.items()
+        ]
+        if edits:
+            self.apply_edits(edits)
+        return [
+            {"matches": count, "error": None if count else "Text not found"}
+            for count in counts
+        ]
+
+    def _paragraph_runs(self, paragraph):
+        """Index the runs of a paragraph that suggest_replacements may split.
+
+        Returns:
+            tuple: (list of (run start offset, run, pieces), paragraph text),
+                   where pieces are (child element, text) pairs covering the
+                   run's text and _OPAQUE marks content that cannot be edited
+        """
+        stop_tags = _TRACKED_CHANGE_TAGS + ("w:p",)
+        runs = []
+        parts = []
+        offset = 0
+        previous_parent = None
+        for run in self._subtree(paragraph):
+            if self._tag(run) != "w:r":
+                continue
+            # Find the run's paragraph, stopping at tracked changes on the way
+            parent = self._parent(run)
+            node = parent
+            while node is not paragraph and self._tag(node) not in stop_tags:
+                node = self._parent(node)
+            if node is not paragraph:
+                if self._tag(node) != "w:p":
+                    # Runs in tracked changes separate the text around them
+                    parts.append(_OPAQUE)
+                    offset += 1
+                    previous_parent = None
+                # Runs of nested paragraphs (text boxes) belong to those
+                continue
+            if previous_parent is not None and parent is not previous_parent:
+                parts.append(_OPAQUE)
+                offset += 1
+            previous_parent = parent
+
+            pieces = []
+            for child in self._children(run):
+                tag = self._tag(child)
+                if tag == "w:rPr":
+                    continue
+                if tag == "w:t":
+                    pieces.append((child, self._text(child)))
+                else:
+                    pieces.append((child, _RUN_TEXT_ELEMENTS.get(tag, _OPAQUE)))
+            runs.append((offset, run, pieces))
+            for _, piece_text in pieces:
+                parts.append(piece_text)
+                offset += len(piece_text)
+        return runs, "".join(parts)
+
+    def _assign_match(self, runs, run_starts, start, end, revised, affected):
+        """Record the cuts a match makes in each run it overlaps."""
+        first = max(bisect.bisect_right(run_starts, start) - 1, 0)
+        overlapping = []
+        for run_start, run, pieces in runs[first:]:
+            if run_start >= end:
+                break
+            run_end = run_start + sum(len(text) for _, text in pieces)
+            if min(end, run_end) > max(start, run_start):
+                overlapping.append((run_start, run_end, run, pieces))
+        for number, (run_start, run_end, run, pieces) in enumerate(overlapping):
+            cuts = affected.setdefault(run, (pieces, []))[1]
+            last = number == len(overlapping) - 1
+            cuts.append(
+                (
+                    max(start, run_start) - run_start,
+                    min(end, run_end) - run_start,
+                    revised if last else None,
+                )
+            )
+
+    def _replacement_runs_xml(self, run, pieces, cuts):
+        """Build the runs, w:del and w:ins that replace a run cut by matches."""
+        run_xml = self._to_xml(run)
+        start_tag = run_xml[: run_xml.index(">") + 1]
+        rpr = "".join(
+            self._to_xml(child)
+            for child in self._children(run)
+            if self._tag(child) == "w:rPr"
+        )
+
+        def content(start, end, deleted):
+            xml = []
+            offset = 0
+            for child, text in pieces:
+                piece_start, offset = offset, offset + len(text)
+                if piece_start >= end or offset <= start or not text:
+                    continue
+                if self._tag(child) != "w:t":
+                    xml.append(self._to_xml(child))
+                    continue
+                part = html.escape(
+                    text[max(start, piece_start) - piece_start : end - piece_start],
+                    quote=False,
+                )
+                tag = "w:delText" if deleted else "w:t"
+                xml.append(f'<{tag} xml:space="preserve">{part}</{tag}>')
+            return "".join(xml)
+
+        xml = []
+        length = sum(len(text) for _, text in pieces)
+        position = 0
+        for start, end, revised in sorted(cuts, key=lambda cut: cut[0]):
+            kept = content(position, start, False)
+            if kept:
+                xml.append(f"{start_tag}{rpr}{kept}</w:r>")
+            xml.append(f"<w:del><w:r>{rpr}{content(start, end, True)}</w:r></w:del>")
+            if revised:
+                xml.append(
+                    f"<w:ins><w:r>{rpr}{_text_to_run_content(revised)}</w:r></w:ins>"
+                )
+            position = end
+        kept = content(position, length, False)
+        if kept:
+            xml.append(f"{start_tag}{rpr}{kept}</w:r>")
+        return "".join(xml)
+
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
 
@@ -306,7 +1074,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
 
             # Process each run
             for run in runs:
@@ -318,7 +1086,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
                 for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
+                    del_text = self._dom.createElement("w:delText")
                     # Copy ALL child nodes (not just firstChild) to handle entities
                     while t_elem.firstChild:
                         del_text.appendChild(t_elem.firstChild)
@@ -333,6 +1101,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Add del wrapper back to ins
             ins_elem.appendChild(del_wrapper)
+            self._index_changed(ins_elem)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -391,7 +1160,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
+            ins_elem = self._dom.createElement("w:ins")
 
             for run in runs:
                 # Clone the run
@@ -399,7 +1168,7 @@ class DocxXMLEditor(XMLEditor):
 
                 # Convert w:delText → w:t
                 for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
+                    t_elem = self._dom.createElement("w:t")
                     # Copy ALL child nodes (not just firstChild) to handle entities
                     while del_text.firstChild:
                         t_elem.appendChild(del_text.firstChild)
@@ -502,7 +1271,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -520,11 +1289,12 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             parent = elem.parentNode
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
             del_wrapper.appendChild(elem)
+            self._index_changed(del_wrapper)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -546,20 +1316,20 @@ class DocxXMLEditor(XMLEditor):
                 rPr_list = pPr.getElementsByTagName("w:rPr")
 
                 if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
+                    rPr = self._dom.createElement("w:rPr")
                     pPr.appendChild(rPr)
                 else:
                     rPr = rPr_list[0]
 
                 # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
+                del_marker = self._dom.createElement("w:del")
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -578,11 +1348,12 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
                 elem.removeChild(child)
                 del_wrapper.appendChild(child)
             elem.appendChild(del_wrapper)
+            self._index_changed(elem)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -593,6 +1364,253 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class LxmlDocxXMLEditor(LxmlXMLEditor, DocxXMLEditor):
+    """DocxXMLEditor on the lxml engine (see LxmlXMLEditor).
+
+    Same attribute injection and tracked change methods as DocxXMLEditor, but
+    elements are lxml elements. Used by Document(engine="lxml") for the large
+    story parts (see LXML_ENGINE_PARTS).
+    """
+
+    def _inject_attributes_to_nodes(self, nodes):
+        """Inject RSID, author, and date attributes into lxml elements.
+
+        Mirrors DocxXMLEditor._inject_attributes_to_nodes.
+
+        Args:
+            nodes: List of lxml elements to process
+        """
+        self.dirty = True
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        def has(elem, name):
+            clark = self._clark(name)
+            return clark is not None and clark in elem.attrib
+
+        def set_missing(elem, name, value):
+            if not has(elem, name):
+                elem.set(self._clark(name), value)
+
+        def add_rsid_to_p(elem):
+            set_missing(elem, "w:rsidR", self.rsid)
+            set_missing(elem, "w:rsidRDefault", self.rsid)
+            set_missing(elem, "w:rsidP", self.rsid)
+            # Add w14:paraId and w14:textId if not present
+            for name in ("w14:paraId", "w14:textId"):
+                if not has(elem, name):
+                    self._ensure_w14_namespace()
+                    elem.set(self._clark(name), _generate_hex_id())
+
+        def add_rsid_to_r(elem):
+            # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
+            if any(True for _ in elem.iterancestors(self._clark("w:del"))):
+                set_missing(elem, "w:rsidDel", self.rsid)
+            else:
+                set_missing(elem, "w:rsidR", self.rsid)
+
+        def add_tracked_change_attrs(elem):
+            # Auto-assign w:id if not present
+            if not has(elem, "w:id"):
+                elem.set(self._clark("w:id"), str(self.change_ids.allocate()))
+            else:
+                self.change_ids.observe(self._attribute(elem, "w:id"))
+            set_missing(elem, "w:author", self.author)
+            set_missing(elem, "w:date", timestamp)
+            if not has(elem, "w16du:dateUtc"):
+                self._ensure_w16du_namespace()
+                elem.set(self._clark("w16du:dateUtc"), timestamp)
+
+        def add_comment_attrs(elem):
+            set_missing(elem, "w:author", self.author)
+            set_missing(elem, "w:date", timestamp)
+            set_missing(elem, "w:initials", self.initials)
+
+        def add_comment_extensible_date(elem):
+            if not has(elem, "w16cex:dateUtc"):
+                self._ensure_w16cex_namespace()
+                elem.set(self._clark("w16cex:dateUtc"), timestamp)
+
+        def add_xml_space_to_t(elem):
+            text = elem.text
+            if text and (text[0].isspace() or text[-1].isspace()):
+                set_missing(elem, "xml:space", "preserve")
+
+        handlers = [
+            ("w:p", add_rsid_to_p),
+            ("w:r", add_rsid_to_r),
+            ("w:t", add_xml_space_to_t),
+            ("w:ins", add_tracked_change_attrs),
+            ("w:del", add_tracked_change_attrs),
+            ("w:comment", add_comment_attrs),
+            ("w16cex:commentExtensible", add_comment_extensible_date),
+        ]
+        for node in nodes:
+            if not isinstance(node.tag, str):
+                continue
+            # Handle the node itself, then its descendants tag by tag
+            for tag, handler in handlers:
+                if node.tag == self._clark_tag(tag):
+                    handler(node)
+            for tag, handler in handlers:
+                clark = self._clark_tag(tag)
+                if clark is not None:
+                    for elem in list(node.iterdescendants(clark)):
+                        handler(elem)
+
+    def revert_insertion(self, elem):
+        """Reject an insertion by wrapping its content in a deletion.
+
+        See DocxXMLEditor.revert_insertion.
+        """
+        ins_tag = self._clark("w:ins")
+        if elem.tag == ins_tag:
+            ins_elements = [elem]
+        else:
+            ins_elements = list(elem.iterdescendants(ins_tag))
+
+        if not ins_elements:
+            raise ValueError(
+                f"revert_insertion requires w:ins elements. "
+                f"The provided element <{self._tag(elem)}> contains no insertions. "
+            )
+
+        for ins_elem in ins_elements:
+            runs = list(ins_elem.iter(self._clark("w:r")))
+            if not runs:
+                continue
+
+            for run in runs:
+                self._mark_run_deleted(run)
+
+            # Move all children into a w:del wrapper inside the w:ins
+            children = list(ins_elem)
+            del_wrapper = etree.SubElement(ins_elem, self._clark("w:del"))
+            del_wrapper.text, ins_elem.text = ins_elem.text, None
+            for child in children:
+                del_wrapper.append(child)
+            self._index_changed(ins_elem)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+
+        return [elem]
+
+    def revert_deletion(self, elem):
+        """Reject a deletion by re-inserting the deleted content.
+
+        See DocxXMLEditor.revert_deletion.
+        """
+        del_tag = self._clark("w:del")
+        is_single_del = elem.tag == del_tag
+        if is_single_del:
+            del_elements = [elem]
+        else:
+            del_elements = list(elem.iterdescendants(del_tag))
+
+        if not del_elements:
+            raise ValueError(
+                f"revert_deletion requires w:del elements. "
+                f"The provided element <{self._tag(elem)}> contains no deletions. "
+            )
+
+        created_insertion = None
+        rsid_r, rsid_del = self._clark("w:rsidR"), self._clark("w:rsidDel")
+        for del_elem in del_elements:
+            runs = list(del_elem.iter(self._clark("w:r")))
+            if not runs:
+                continue
+
+            ins_elem = etree.Element(self._clark("w:ins"))
+            for run in runs:
+                new_run = copy.deepcopy(run)
+                for del_text in new_run.iter(self._clark("w:delText")):
+                    del_text.tag = self._clark("w:t")
+                if rsid_del in new_run.attrib:
+                    new_run.set(rsid_r, new_run.attrib.pop(rsid_del))
+                elif rsid_r not in new_run.attrib:
+                    new_run.set(rsid_r, self.rsid)
+                new_run.tail = None
+                ins_elem.append(new_run)
+            for node in ins_elem.iter():
+                node.sourceline = 0
+
+            nodes = self._place_nodes("insert_after", del_elem, [ins_elem])
+            self._inject_attributes_to_nodes(nodes)
+            if is_single_del:
+                created_insertion = ins_elem
+
+        if is_single_del and created_insertion is not None:
+            return [elem, created_insertion]
+        else:
+            return [elem]
+
+    def suggest_deletion(self, elem):
+        """Mark a w:r or w:p element as deleted with tracked changes.
+
+        See DocxXMLEditor.suggest_deletion.
+        """
+        tag = self._tag(elem)
+        if tag == "w:r":
+            if any(True for _ in elem.iter(self._clark("w:delText"))):
+                raise ValueError("w:r element already contains w:delText")
+
+            self._mark_run_deleted(elem)
+
+            # Wrap in w:del
+            del_wrapper = etree.Element(self._clark("w:del"))
+            elem.addprevious(del_wrapper)
+            del_wrapper.tail, elem.tail = elem.tail, None
+            del_wrapper.append(elem)
+            self._index_changed(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return del_wrapper
+
+        elif tag == "w:p":
+            if any(
+                True
+                for _ in elem.iterdescendants(self._clark("w:ins"), self._clark("w:del"))
+            ):
+                raise ValueError("w:p element already contains tracked changes")
+
+            ppr = elem.find(f".//{self._clark('w:pPr')}")
+            is_numbered = (
+                ppr is not None and ppr.find(f".//{self._clark('w:numPr')}") is not None
+            )
+
+            if is_numbered:
+                # Add <w:del/> marker to w:rPr in w:pPr
+                rpr = ppr.find(f".//{self._clark('w:rPr')}")
+                if rpr is None:
+                    rpr = etree.SubElement(ppr, self._clark("w:rPr"))
+                rpr.insert(0, etree.Element(self._clark("w:del")))
+
+            for run in elem.iter(self._clark("w:r")):
+                self._mark_run_deleted(run)
+
+            # Wrap all non-pPr children in <w:del>
+            children = [c for c in elem if c.tag != self._clark("w:pPr")]
+            del_wrapper = etree.SubElement(elem, self._clark("w:del"))
+            for child in children:
+                del_wrapper.append(child)
+            self._index_changed(elem)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return elem
+
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {tag}")
+
+    def _mark_run_deleted(self, run):
+        """Convert w:t to w:delText and w:rsidR to w:rsidDel in a run."""
+        rsid_r, rsid_del = self._clark("w:rsidR"), self._clark("w:rsidDel")
+        if rsid_r in run.attrib:
+            run.set(rsid_del, run.attrib.pop(rsid_r))
+        elif rsid_del not in run.attrib:
+            run.set(rsid_del, self.rsid)
+        for t_elem in run.iter(self._clark("w:t")):
+            t_elem.tag = self._clark("w:delText")
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -604,6 +1622,28 @@ def _generate_hex_id() -> str:
     return f"{random.randint(1, 0x7FFFFFFE):08X}"
 
 
+def _generate_unique_hex_id(used) -> str:
+    """Generate a para/durable ID (see _generate_hex_id) that is not in used."""
+    while True:
+        hex_id = _generate_hex_id()
+        if hex_id not in used:
+            return hex_id
+
+
+def _text_to_run_content(text):
+    """Convert text to w:t elements, with w:tab and w:br for tabs and line breaks."""
+    xml = []
+    for part in re.split(r"([\t\n])", text):
+        if part == "\t":
+            xml.append("<w:tab/>")
+        elif part == "\n":
+            xml.append("<w:br/>")
+        elif part:
+            escaped = html.escape(part, quote=False)
+            xml.append(f'<w:t xml:space="preserve">{escaped}</w:t>')
+    return "".join(xml)
+
+
 def _generate_rsid() -> str:
     """Generate random 8-character hex RSID."""
     return "".join(random.choices("0123456789ABCDEF", k=8))
@@ -619,6 +1659,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        engine="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,20 +1671,26 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            engine: XML engine for the story parts in LXML_ENGINE_PARTS,
+                "minidom" (default) or "lxml" (faster and smaller for large
+                documents; nodes are lxml elements)
         """
+        if engine not in ("minidom", "lxml"):
+            raise ValueError(f"Unknown engine: {engine}")
+        self.engine = engine
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Create temporary directory for changed parts; everything else is read
+        # from the original directory (see Workspace)
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self._workspace = Workspace(self.original_path, self.unpacked_path)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Validation baseline, packed on first use (see original_docx)
+        self._original_docx = None
 
         self.word_path = self.unpacked_path / "word"
 
@@ -657,6 +1704,13 @@ class Document:
 
         # Cache for lazy-loaded editors
         self._editors = {}
+        # Parts serialized by an editor at least once (they differ from the original)
+        self._saved_parts = set()
+
+        # Tracked change IDs are shared by all editors (one scan of word/ parts)
+        self._change_ids = ChangeIdAllocator.from_parts(
+            self._workspace.files("word/**/*.xml")
+        )
 
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
@@ -664,9 +1718,9 @@ class Document:
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
-        # Load existing comments and determine next ID (before setup modifies files)
-        self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
+        # Index existing comments across the comment parts (before setup modifies files)
+        self._comments = None
+        self._comments = CommentStore(self)
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -700,13 +1754,25 @@ class Document:
             # Get node from comments.xml
             comment = doc["word/comments.xml"].get_node(tag="w:comment", attrs={"w:id": "0"})
         """
+        if xml_path in COMMENT_PARTS and self._comments is not None:
+            # Write pending comments first so the part is complete
+            self._comments.flush()
         if xml_path not in self._editors:
-            file_path = self.unpacked_path / xml_path
-            if not file_path.exists():
+            if not self._workspace.exists(xml_path):
                 raise ValueError(f"XML file not found: {xml_path}")
+            file_path = self._workspace.write_path(xml_path)
             # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
+            editor_class = DocxXMLEditor
+            if self.engine == "lxml" and any(
+                fnmatch.fnmatchcase(xml_path, pattern) for pattern in LXML_ENGINE_PARTS
+            ):
+                editor_class = LxmlDocxXMLEditor
+            self._editors[xml_path] = editor_class(
+                file_path,
+                rsid=self.rsid,
+                author=self.author,
+                initials=self.initials,
+                change_ids=self._change_ids,
             )
         return self._editors[xml_path]
 
@@ -727,39 +1793,14 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        comment_id = self._comments.next_id
 
         # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
-
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
-
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        for target, operation, xml in self._comment_anchor_edits(comment_id, start, end):
+            getattr(self._document, operation)(target, xml)
 
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
-
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
-
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
-
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
-
-        self.next_comment_id += 1
+        # The comment parts are written in one batch by CommentStore.flush
+        self._comments.add(text, self.author, self.initials, comment_id=comment_id)
         return comment_id
 
     def reply_to_comment(
@@ -780,55 +1821,182 @@ class Document:
         Example:
             cm.reply_to_comment(parent_comment_id=0, text="I agree with this change")
         """
-        if parent_comment_id not in self.existing_comments:
+        if parent_comment_id not in self._comments.by_id:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
-
-        parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        comment_id = self._comments.next_id
 
         # Add comment ranges to document.xml immediately
-        parent_start_elem = self._document.get_node(
-            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
-        )
-        parent_ref_elem = self._document.get_node(
-            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
+        for target, operation, xml in self._reply_anchor_edits(
+            comment_id, parent_comment_id
+        ):
+            getattr(self._document, operation)(target, xml)
+
+        self._comments.add(
+            text,
+            self.author,
+            self.initials,
+            parent_id=parent_comment_id,
+            comment_id=comment_id,
         )
+        return comment_id
 
-        self._document.insert_after(
-            parent_start_elem, self._comment_range_start_xml(comment_id)
-        )
-        parent_ref_run = parent_ref_elem.parentNode
-        self._document.insert_after(
-            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
-        )
-        self._document.insert_after(
-            parent_ref_run, self._comment_ref_run_xml(comment_id)
-        )
+    def add_comments(self, comments):
+        """
+        Add many comments and replies in one batch.
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        Gives the same result as calling add_comment and reply_to_comment in
+        order, but places all comment ranges in document.xml with one
+        apply_edits call (one more per level of replies to comments from the
+        same batch) and writes the comment parts once, on save.
 
-        # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
-        )
+        Args:
+            comments: List of dicts, each with "text" and either "start" and
+                "end" (a new comment, as for add_comment) or "parent" (ID of the
+                comment to reply to, which may be an earlier item of the batch)
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        Returns:
+            list: One dict per item, in input order, with "id" (the comment ID,
+                  or None if it was not added) and "error" (message or None)
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        Raises:
+            ValueError: If an item is malformed or replies to an unknown
+                        comment. Nothing is added in that case.
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        Example:
+            results = doc.add_comments([
+                {"start": node, "end": node, "text": "Please check"},
+                {"parent": 0, "text": "Agreed"},
+            ])
+        """
+        first_id = self._comments.next_id
+        ids = [first_id + i for i in range(len(comments))]
+
+        # Replies to comments of this batch are anchored after their parent
+        levels = {}
+        problems = []
+        for i, item in enumerate(comments):
+            if "text" not in item:
+                problems.append(f"comment {i}: missing text")
+            if "parent" in item:
+                parent = item["parent"]
+                if first_id <= parent < ids[i]:
+                    levels[i] = levels.get(parent - first_id, 0) + 1
+                elif parent in self._comments.by_id:
+                    levels[i] = 0
+                else:
+                    problems.append(f"comment {i}: parent id={parent} not found")
+            elif "start" in item and "end" in item:
+                levels[i] = 0
+            else:
+                problems.append(f"comment {i}: needs start and end, or parent")
+        if problems:
+            raise ValueError("Cannot add comments:\n  " + "\n  ".join(problems))
+
+        errors = {}
+        for level in range(max(levels.values(), default=-1) + 1):
+            edits, owners = [], []
+            for i, item in enumerate(comments):
+                if levels[i] != level:
+                    continue
+                parent = item.get("parent")
+                if parent is not None and parent - first_id in errors:
+                    errors[i] = f"parent comment id={parent} was not added"
+                    continue
+                try:
+                    if parent is None:
+                        item_edits = self._comment_anchor_edits(
+                            ids[i], item["start"], item["end"]
+                        )
+                    else:
+                        item_edits = self._reply_anchor_edits(ids[i], parent)
+                except ValueError as e:
+                    errors[i] = str(e)
+                    continue
+                edits.extend(item_edits)
+                owners.extend([i] * len(item_edits))
+            if edits:
+                for i, result in zip(owners, self._document.apply_edits(edits)):
+                    if result["error"]:
+                        errors.setdefault(i, result["error"])
+
+        results = []
+        for i, item in enumerate(comments):
+            if i in errors:
+                results.append({"id": None, "error": errors[i]})
+                continue
+            self._comments.add(
+                item["text"],
+                self.author,
+                self.initials,
+                parent_id=item.get("parent"),
+                comment_id=ids[i],
+            )
+            results.append({"id": ids[i], "error": None})
+        return results
 
-        self.next_comment_id += 1
-        return comment_id
+    @property
+    def existing_comments(self):
+        """Comments that can be replied to: comment ID -> info dict (see CommentStore)."""
+        return self._comments.by_id
+
+    @property
+    def next_comment_id(self):
+        """ID the next added comment will get."""
+        return self._comments.next_id
+
+    def apply_edits(self, edits, xml_path="word/document.xml"):
+        """
+        Apply a batch of (locator, operation, payload) edits to one XML part.
+
+        See DocxXMLEditor.apply_edits for the edit format and ordering rules.
+
+        Args:
+            edits: List of (locator, operation, payload) tuples
+            xml_path: Part to edit (default: "word/document.xml")
+
+        Returns:
+            list: Per-edit result dicts with "result", "error" and "seconds"
+
+        Example:
+            results = doc.apply_edits([
+                ({"tag": "w:r", "contains": "thirty (30)"}, "suggest_deletion", None),
+                ({"tag": "w:r", "contains": "thirty (30)"}, "insert_after",
+                 '<w:ins><w:r><w:t>sixty (60)</w:t></w:r></w:ins>'),
+            ])
+            failed = [r for r in results if r["error"]]
+        """
+        return self[xml_path].apply_edits(edits)
+
+    def suggest_replacements(self, replacements, xml_path="word/document.xml"):
+        """
+        Replace many text strings in one XML part with tracked changes.
+
+        See DocxXMLEditor.suggest_replacements for matching rules.
+
+        Args:
+            replacements: List of dicts with "original", "revised" and
+                optionally "all"
+            xml_path: Part to edit (default: "word/document.xml")
+
+        Returns:
+            list: Per-replacement dicts with "matches" and "error"
+
+        Example:
+            results = doc.suggest_replacements([
+                {"original": "thirty (30) days", "revised": "sixty (60) days"},
+                {"original": "Party B", "revised": "the Buyer", "all": True},
+            ])
+            missing = [r for r in results if r["error"]]
+        """
+        return self[xml_path].suggest_replacements(replacements)
+
+    @property
+    def original_docx(self):
+        """The original directory packed as a .docx, built the first time it is needed."""
+        if self._original_docx is None:
+            self._original_docx = Path(self.temp_dir) / "original.docx"
+            pack_document(self.original_path, self._original_docx, validate=False)
+        return self._original_docx
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
@@ -839,15 +2007,20 @@ class Document:
         """
         Validate the document against XSD schema and redlining rules.
 
+        Schema validation is incremental: parts unchanged since the last
+        successful validation in this session are not re-checked.
+
         Raises:
             ValueError: If validation fails.
         """
         # Create validators with current state
+        self._comments.flush()
+        view_path = self._workspace.view(Path(self.temp_dir) / "view")
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            view_path, self.original_docx, verbose=False, incremental=True
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            view_path, self.original_docx, verbose=False
         )
 
         # Run validations
@@ -856,77 +2029,74 @@ class Document:
         if not redlining_validator.validate():
             raise ValueError("Redlining validation failed")
 
-    def save(self, destination=None, validate=True) -> None:
+    def save(self, destination=None, validate=True):
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only editors that may have been modified are serialized: dirty ones, and
+        ones whose DOM or nodes were handed out (editor.dom, get_node), since
+        those may have been edited directly.
 
         Args:
-            destination: Optional path to save to. If None, saves back to original directory.
+            destination: Optional path to save to. If None, saves back to original
+                directory, rewriting only the parts that were changed or added.
             validate: If True, validates document before saving (default: True).
+
+        Returns:
+            List of dicts, one per part written to the destination, with keys:
+                part: Part name (e.g. "word/document.xml")
+                bytes: Size of the written file
+                seconds: Time spent serializing the part in this call (0.0 for
+                    parts that were copied as they were)
+
+        Example:
+            report = doc.save()
+            total = sum(entry["bytes"] for entry in report)
         """
-        # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
+        # Write pending comments; then only ensure comment relationships and
+        # content types if comment files exist
+        self._comments.flush()
+        if self._workspace.exists(self.comments_path):
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
+        # Save modified XML files in temp directory
+        seconds = {}
+        for part, editor in self._editors.items():
+            if not editor.might_be_modified():
+                continue
+            start = time.perf_counter()
             editor.save()
+            seconds[part] = time.perf_counter() - start
+            self._saved_parts.add(part)
 
         # Validate by default
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Write changed parts back to the original directory, or the whole
+        # document to a new destination. Parts only read by an editor still
+        # match the original.
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
-
-    # ==================== Private: Initialization ====================
-
-    def _get_next_comment_id(self):
-        """Get the next available comment ID."""
-        if not self.comments_path.exists():
-            return 0
-
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
-
-    def _load_existing_comments(self):
-        """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
-            return {}
-
-        editor = self["word/comments.xml"]
-        existing = {}
-
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if not comment_id:
-                continue
-
-            # Find para_id from the w:p element within the comment
-            para_id = None
-            for p_elem in comment_elem.getElementsByTagName("w:p"):
-                para_id = p_elem.getAttribute("w14:paraId")
-                if para_id:
-                    break
-
-            if not para_id:
-                continue
-
-            existing[int(comment_id)] = {"para_id": para_id}
-
-        return existing
+        if target_path.resolve() == self.original_path.resolve():
+            # The validation baseline is packed from the original directory, so
+            # it must be taken before this session's edits are written into it
+            self.original_docx
+        unchanged = {
+            part
+            for part in self._editors
+            if part not in self._saved_parts and (self.original_path / part).is_file()
+        }
+        written = self._workspace.save(target_path, unchanged=unchanged)
+        return [
+            {
+                "part": part,
+                "bytes": (target_path / part).stat().st_size,
+                "seconds": seconds.get(part, 0.0),
+            }
+            for part in written
+        ]
 
     # ==================== Private: Setup Methods ====================
 
@@ -953,7 +2123,7 @@ class Document:
 
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
-        if not path.exists():
+        if not self._workspace.exists(path):
             # Copy from template
             shutil.copy(TEMPLATE_DIR / "people.xml", path)
 
@@ -965,7 +2135,7 @@ class Document:
             return
 
         # Add Override element
-        root = editor.dom.documentElement
+        root = editor._dom.documentElement
         override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
 
@@ -976,7 +2146,7 @@ class Document:
         if self._has_relationship(editor, "people.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor._dom.documentElement
         root_tag = root.tagName  # type: ignore
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid = editor.get_next_rid()
@@ -1004,7 +2174,7 @@ class Document:
         if track_revisions:
             track_revisions_exists = any(
                 elem.tagName == f"{prefix}:trackRevisions"
-                for elem in editor.dom.getElementsByTagName(f"{prefix}:trackRevisions")
+                for elem in editor._dom.getElementsByTagName(f"{prefix}:trackRevisions")
             )
 
             if not track_revisions_exists:
@@ -1012,7 +2182,7 @@ class Document:
                 # Try to insert before documentProtection, defaultTabStop, or at start
                 inserted = False
                 for tag in [f"{prefix}:documentProtection", f"{prefix}:defaultTabStop"]:
-                    elements = editor.dom.getElementsByTagName(tag)
+                    elements = editor._dom.getElementsByTagName(tag)
                     if elements:
                         editor.insert_before(elements[0], track_rev_xml)
                         inserted = True
@@ -1025,7 +2195,7 @@ class Document:
                         editor.append_to(root, track_rev_xml)
 
         # Always check if rsids section exists
-        rsids_elements = editor.dom.getElementsByTagName(f"{prefix}:rsids")
+        rsids_elements = editor._dom.getElementsByTagName(f"{prefix}:rsids")
 
         if not rsids_elements:
             # Add new rsids section
@@ -1036,13 +2206,13 @@ class Document:
 
             # Try to insert after compat, before clrSchemeMapping, or before closing tag
             inserted = False
-            compat_elements = editor.dom.getElementsByTagName(f"{prefix}:compat")
+            compat_elements = editor._dom.getElementsByTagName(f"{prefix}:compat")
             if compat_elements:
                 editor.insert_after(compat_elements[0], rsids_xml)
                 inserted = True
 
             if not inserted:
-                clr_elements = editor.dom.getElementsByTagName(
+                clr_elements = editor._dom.getElementsByTagName(
                     f"{prefix}:clrSchemeMapping"
                 )
                 if clr_elements:
@@ -1063,72 +2233,42 @@ class Document:
                 rsid_xml = f'<{prefix}:rsid {prefix}:val="{self.rsid}"/>'
                 editor.append_to(rsids_elem, rsid_xml)
 
-    # ==================== Private: XML File Creation ====================
-
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
-
-        editor = self["word/comments.xml"]
-        root = editor.get_node(tag="w:comments")
+    # ==================== Private: XML Fragments ====================
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    def _comment_anchor_edits(self, comment_id, start, end):
+        """Return the (target, operation, xml) edits that anchor a new comment."""
+        # If end node is a paragraph, append comment markup inside it
+        # Otherwise insert after it (for run-level anchors)
+        end_operation = (
+            "append_to" if self._document._tag(end) == "w:p" else "insert_after"
         )
-        # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
-        # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
-  <w:p w14:paraId="{para_id}" w14:textId="77777777">
-    <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
-    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
-  </w:p>
-</w:comment>'''
-        editor.append_to(root, comment_xml)
-
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
-
-        editor = self["word/commentsExtended.xml"]
-        root = editor.get_node(tag="w15:commentsEx")
-
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
-
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
-
-        editor = self["word/commentsIds.xml"]
-        root = editor.get_node(tag="w16cid:commentsIds")
-
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
-
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
-
-        editor = self["word/commentsExtensible.xml"]
-        root = editor.get_node(tag="w16cex:commentsExtensible")
-
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
+        return [
+            (start, "insert_before", self._comment_range_start_xml(comment_id)),
+            (end, end_operation, self._comment_range_end_xml(comment_id)),
+        ]
 
-    # ==================== Private: XML Fragments ====================
+    def _reply_anchor_edits(self, comment_id, parent_comment_id):
+        """Return the (target, operation, xml) edits that anchor a reply next to its parent."""
+        parent_start_elem = self._document.get_node(
+            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
+        )
+        parent_ref_elem = self._document.get_node(
+            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
+        )
+        parent_ref_run = self._document._parent(parent_ref_elem)
+        return [
+            (
+                parent_start_elem,
+                "insert_after",
+                self._comment_range_start_xml(comment_id),
+            ),
+            (
+                parent_ref_run,
+                "insert_after",
+                self._comment_ref_run_xml(comment_id)
+                + f'<w:commentRangeEnd w:id="{comment_id}"/>',
+            ),
+        ]
 
     def _comment_range_start_xml(self, comment_id):
         """Generate XML for comment range start."""
@@ -1159,31 +2299,26 @@ class Document:
 
     def _has_relationship(self, editor, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
-            if rel_elem.getAttribute("Target") == target:
-                return True
-        return False
+        return bool(editor._find_indexed("Relationship", {"Target": target}, None, None))
 
     def _has_override(self, editor, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
-            if override_elem.getAttribute("PartName") == part_name:
-                return True
-        return False
+        return bool(
+            editor._find_indexed("Override", {"PartName": part_name}, None, None)
+        )
 
     def _has_author(self, editor, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
-            if person_elem.getAttribute("w15:author") == author:
-                return True
-        return False
+        return bool(
+            editor._find_indexed("w15:person", {"w15:author": author}, None, None)
+        )
 
     def _add_author_to_people(self, author):
         """Add author to people.xml (called during initialization)."""
         people_path = self.word_path / "people.xml"
 
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._workspace.exists(people_path):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
@@ -1207,7 +2342,7 @@ class Document:
         if self._has_relationship(editor, "comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor._dom.documentElement
         root_tag = root.tagName  # type: ignore
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid_num = int(editor.get_next_rid()[3:])
@@ -1247,7 +2382,7 @@ class Document:
         if self._has_override(editor, "/word/comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor._dom.documentElement
 
         # Add Override elements
         overrides = [
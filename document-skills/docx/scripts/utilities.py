@@ -30,12 +30,30 @@ Example usage:
     editor.save()
 """
 
+import bisect
 import html
+import re
 from pathlib import Path
 from typing import Optional, Union
+from xml.parsers import expat
 
 import defusedxml.minidom
 import defusedxml.sax
+from lxml import etree
+
+# Element wrapping each fragment when several are parsed together
+_FRAGMENT_TAG = "xml-editor-fragment"
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+# First line number libxml2 cannot report exactly in sourceline
+_MAX_SOURCELINE = 65535
+
+# A prefixed namespace declaration in raw XML
+_PREFIX_DECLARATION = re.compile(rb"xmlns:([\w.-]+)\s*=")
+
+# A namespace declaration in a start tag: prefix (None for the default) and URI
+_NAMESPACE_DECLARATION = re.compile(r'\s+xmlns(?::([\w.-]+))?="([^"]*)"')
 
 
 class XMLEditor:
@@ -50,6 +68,8 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        dirty: True if the tree was changed through the editor since it was
+            loaded or last saved. Direct DOM edits are not tracked; see save().
     """
 
     def __init__(self, xml_path):
@@ -70,8 +90,21 @@ class XMLEditor:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
-        parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._dom = self._parse()
+
+        # Lookup indexes for get_node, built on first use
+        self._reset_index()
+        self._wrapper_cache = None
+        self.dirty = False
+        # Set once the tree or one of its nodes is handed out, after which it
+        # may be changed without the editor knowing
+        self._exposed = False
+
+    @property
+    def dom(self):
+        """The parsed document, for direct manipulation."""
+        self._exposed = True
+        return self._dom
 
     def get_node(
         self,
@@ -109,40 +142,19 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        matches = self._find_indexed(tag, attrs, line_number, contains)
+        if not matches and self._tag_index is not None:
+            # Confirm with a full scan before reporting a miss, so nodes changed
+            # through direct DOM manipulation are still found
+            matches = [
+                elem
+                for elem in self._iter_elements(tag)
+                if self._matches(
+                    elem, attrs, line_number, contains, self._get_element_text
+                )
+            ]
+            if matches:
+                self._reset_index()
 
         if not matches:
             # Build descriptive error message
@@ -178,8 +190,264 @@ class XMLEditor:
                 f"Multiple nodes found: <{tag}>. "
                 f"Add more filters (attrs, line_number, or contains) to narrow the search."
             )
+        self._exposed = True
         return matches[0]
 
+    def reindex(self):
+        """
+        Discard the lookup indexes used by get_node and mark the editor dirty.
+
+        The indexes and the dirty flag are kept up to date by replace_node,
+        insert_after, insert_before and append_to. Call this after changing the
+        DOM directly (removeChild, appendChild, setAttribute, ...) so the next
+        lookup rebuilds the indexes from the current tree and Document.save
+        writes the change.
+        """
+        self._reset_index()
+        self.dirty = True
+
+    def _reset_index(self):
+        """Discard the lookup indexes; they are rebuilt by the next lookup."""
+        self._tag_index = None
+        self._attr_index = {}
+        self._line_index = {}
+        self._text_cache = {}
+        self._pending = []
+
+    def _matches(self, elem, attrs, line_number, contains, get_text):
+        """Check a single element against the get_node filters."""
+        # Check line_number filter
+        if line_number is not None:
+            elem_line = self._line(elem)
+
+            # Handle both single line number and range
+            if isinstance(line_number, range):
+                if elem_line not in line_number:
+                    return False
+            else:
+                if elem_line != line_number:
+                    return False
+
+        # Check attrs filter
+        if attrs is not None:
+            if not all(
+                self._attribute(elem, attr_name) == attr_value
+                for attr_name, attr_value in attrs.items()
+            ):
+                return False
+
+        # Check contains filter
+        if contains is not None:
+            # Normalize the search string: convert HTML entities to Unicode characters
+            # This allows searching for both "&#8220;Rowan" and ""Rowan"
+            normalized_contains = html.unescape(contains)
+            if normalized_contains not in get_text(elem):
+                return False
+
+        return True
+
+    def _find_indexed(self, tag, attrs, line_number, contains):
+        """
+        Find matching elements using the lookup indexes.
+
+        Candidates come from the most selective index available (line number,
+        then the first attribute, then the tag) and are re-checked against every
+        filter. Text is first compared with the cached text, which does not see
+        direct DOM edits, so the final matches are checked against their live
+        text. Stale index entries can therefore only cause misses, never wrong
+        hits.
+        """
+        if self._tag_index is None:
+            self._build_index()
+
+        if line_number is not None:
+            candidates = self._line_candidates(tag, line_number)
+        elif attrs:
+            attr_name, attr_value = next(iter(attrs.items()))
+            candidates = self._attr_candidates(tag, attr_name, attr_value)
+        else:
+            candidates = self._tag_index.get(tag, ())
+
+        matches = [
+            elem
+            for elem in candidates
+            if self._matches(elem, attrs, line_number, contains, self._cached_text)
+        ]
+        # Only the (few) matches pay for the check that they are still attached
+        # and were not renamed or changed in place since they were indexed
+        return [
+            elem
+            for elem in matches
+            if self._tag(elem) == tag
+            and self._is_attached(elem)
+            and (
+                contains is None
+                or html.unescape(contains) in self._get_element_text(elem)
+            )
+        ]
+
+    def _build_index(self):
+        """Index every element of the document by tag name."""
+        self._reset_index()
+        self._tag_index = {}
+        for elem in self._iter_elements():
+            self._tag_index.setdefault(self._tag(elem), {})[elem] = None
+
+    def _line_candidates(self, tag, line_number):
+        """Return elements of a tag parsed at a line or within a line range."""
+        if tag not in self._line_index:
+            # Only elements from the original parse have a line, and they never
+            # change line, so this index needs no maintenance
+            lines = ((self._line(elem), elem) for elem in self._tag_index.get(tag, ()))
+            positioned = sorted(
+                (line, seq, elem)
+                for seq, (line, elem) in enumerate(lines)
+                if line is not None
+            )
+            self._line_index[tag] = (
+                [line for line, _, _ in positioned],
+                [elem for _, _, elem in positioned],
+            )
+        lines, elems = self._line_index[tag]
+        if isinstance(line_number, range):
+            if line_number.step != 1:
+                return [elem for line, elem in zip(lines, elems) if line in line_number]
+            start, stop = line_number.start, line_number.stop
+        else:
+            start, stop = line_number, line_number + 1
+        return elems[bisect.bisect_left(lines, start) : bisect.bisect_left(lines, stop)]
+
+    def _attr_candidates(self, tag, attr_name, attr_value):
+        """Return elements of a tag whose attribute has the given value."""
+        if self._pending:
+            # Fold in elements added or changed since the last attribute lookup.
+            # This is deferred because callers often set attributes right after
+            # inserting nodes.
+            pending, self._pending = self._pending, []
+            for (index_tag, index_attr), by_value in self._attr_index.items():
+                for elem in pending:
+                    if self._tag(elem) == index_tag:
+                        value = self._attribute(elem, index_attr)
+                        by_value.setdefault(value, {})[elem] = None
+
+        key = (tag, attr_name)
+        if key not in self._attr_index:
+            by_value = {}
+            for elem in self._tag_index.get(tag, ()):
+                by_value.setdefault(self._attribute(elem, attr_name), {})[elem] = None
+            self._attr_index[key] = by_value
+        return self._attr_index[key].get(attr_value, ())
+
+    def _cached_text(self, elem):
+        """Like _get_element_text, but memoized per element."""
+        text = self._text_cache.get(elem)
+        if text is None:
+            text_parts = []
+            for node in elem.childNodes:
+                if node.nodeType == node.TEXT_NODE:
+                    if node.data.strip():
+                        text_parts.append(node.data)
+                elif node.nodeType == node.ELEMENT_NODE:
+                    text_parts.append(self._cached_text(node))
+            text = self._text_cache[elem] = "".join(text_parts)
+        return text
+
+    def _is_attached(self, elem):
+        """Check that an element is still part of the document tree."""
+        node = elem
+        while node.parentNode is not None:
+            node = node.parentNode
+        return node is self._dom
+
+    def _index_added(self, nodes):
+        """Update the lookup indexes for nodes inserted into the tree."""
+        if self._tag_index is None:
+            return
+        for node in nodes:
+            if self._is_element(node):
+                for elem in self._subtree(node):
+                    self._tag_index.setdefault(self._tag(elem), {})[elem] = None
+                    self._pending.append(elem)
+            self._invalidate_text(self._parent(node))
+
+    def _index_removed(self, elem, parent):
+        """Update the lookup indexes for an element detached from parent."""
+        if self._tag_index is None:
+            return
+        for removed in self._subtree(elem):
+            self._tag_index.get(self._tag(removed), {}).pop(removed, None)
+            self._text_cache.pop(removed, None)
+        self._invalidate_text(parent)
+
+    def _index_changed(self, elem):
+        """Update the lookup indexes for an element whose subtree was edited in place."""
+        if self._tag_index is None:
+            return
+        for changed in self._subtree(elem):
+            self._text_cache.pop(changed, None)
+        self._index_added([elem])
+
+    def _invalidate_text(self, node):
+        """Drop cached text for a node and all of its ancestors."""
+        while node is not None:
+            self._text_cache.pop(node, None)
+            node = self._parent(node)
+
+    def _parse(self):
+        """Parse xml_path into a minidom Document with parse_position on elements."""
+        parser = _create_line_tracking_parser()
+        return defusedxml.minidom.parse(str(self.xml_path), parser)
+
+    def _iter_elements(self, tag="*"):
+        """Return all elements with a qualified tag name, in document order."""
+        return self._dom.getElementsByTagName(tag)
+
+    def _subtree(self, elem):
+        """Return an element and all of its descendant elements, in document order."""
+        return [elem] + elem.getElementsByTagName("*")
+
+    def _is_element(self, node):
+        """Check whether a node is an element (not text, a comment, ...)."""
+        return node.nodeType == node.ELEMENT_NODE
+
+    def _tag(self, elem):
+        """Return the qualified tag name of an element (e.g. "w:p")."""
+        return elem.tagName
+
+    def _attribute(self, elem, name):
+        """Return an attribute value by qualified name, or "" if absent."""
+        return elem.getAttribute(name)
+
+    def _line(self, elem):
+        """Return the line an element started on in the original file, or None."""
+        return getattr(elem, "parse_position", (None,))[0]
+
+    def _parent(self, elem):
+        """Return the parent node of an element (None when detached)."""
+        return elem.parentNode
+
+    def _children(self, elem):
+        """Return the child elements of an element, in document order."""
+        return [node for node in elem.childNodes if node.nodeType == node.ELEMENT_NODE]
+
+    def _text(self, elem):
+        """Return the text directly inside an element, whitespace included."""
+        return "".join(
+            node.data
+            for node in elem.childNodes
+            if node.nodeType in (node.TEXT_NODE, node.CDATA_SECTION_NODE)
+        )
+
+    def _to_xml(self, elem):
+        """Serialize an element as an XML fragment for the edit methods."""
+        return elem.toxml()
+
+    def _declare_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is missing."""
+        root = self._dom.documentElement
+        if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+            root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -217,12 +485,8 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
         nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
-        return nodes
+        return self._place_nodes("replace_node", elem, nodes)
 
     def insert_after(self, elem, xml_content):
         """
@@ -238,15 +502,8 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
-        return nodes
+        return self._place_nodes("insert_after", elem, nodes)
 
     def insert_before(self, elem, xml_content):
         """
@@ -262,11 +519,8 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        return nodes
+        return self._place_nodes("insert_before", elem, nodes)
 
     def append_to(self, elem, xml_content):
         """
@@ -283,15 +537,49 @@ class XMLEditor:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
+        return self._place_nodes("append_to", elem, nodes)
+
+    def _place_nodes(self, operation, elem, nodes):
+        """
+        Put already imported nodes into the tree relative to elem.
+
+        Args:
+            operation: "replace_node", "insert_after", "insert_before" or "append_to"
+            elem: defusedxml.minidom.Element the operation is relative to
+            nodes: Nodes returned by _parse_fragment or _parse_fragments
+
+        Returns:
+            List[defusedxml.minidom.Node]: The placed nodes
+        """
+        if operation == "append_to":
+            for node in nodes:
+                elem.appendChild(node)
+        elif operation == "insert_after":
+            parent = elem.parentNode
+            next_sibling = elem.nextSibling
+            for node in nodes:
+                if next_sibling:
+                    parent.insertBefore(node, next_sibling)
+                else:
+                    parent.appendChild(node)
+        elif operation in ("insert_before", "replace_node"):
+            parent = elem.parentNode
+            for node in nodes:
+                parent.insertBefore(node, elem)
+            if operation == "replace_node":
+                parent.removeChild(elem)
+                self._index_removed(elem, parent)
+        else:
+            raise ValueError(f"Unknown operation: {operation}")
+        self._index_added(nodes)
+        self.dirty = True
         return nodes
 
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
-            rel_id = rel_elem.getAttribute("Id")
+        for rel_elem in self._iter_elements("Relationship"):
+            rel_id = self._attribute(rel_elem, "Id")
             if rel_id.startswith("rId"):
                 try:
                     max_id = max(max_id, int(rel_id[3:]))
@@ -306,8 +594,18 @@ class XMLEditor:
         Serializes the DOM tree and writes it back to the original file path,
         preserving the original encoding (ascii or utf-8).
         """
-        content = self.dom.toxml(encoding=self.encoding)
+        content = self._dom.toxml(encoding=self.encoding)
         self.xml_path.write_bytes(content)
+        self.dirty = False
+
+    def might_be_modified(self):
+        """Check if the tree may differ from the file, so save() must be called.
+
+        True for dirty editors, and for editors whose tree or nodes were handed
+        out (dom, get_node), since those can be edited directly without
+        marking the editor dirty.
+        """
+        return self.dirty or self._exposed
 
     def _parse_fragment(self, xml_content):
         """
@@ -322,26 +620,334 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, xml_contents):
+        """
+        Parse several XML fragments with a single parser run.
+
+        Args:
+            xml_contents: List of strings containing XML fragments
+
+        Returns:
+            List with one list of imported nodes per fragment
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        items = "".join(
+            f"<{_FRAGMENT_TAG}>{xml_content}</{_FRAGMENT_TAG}>"
+            for xml_content in xml_contents
+        )
+        wrapper = f"{self._fragment_wrapper()}{items}</root>"
         fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
+        results = []
+        for item in fragment_doc.documentElement.childNodes:  # type: ignore
+            nodes = [
+                self._dom.importNode(child, deep=True) for child in item.childNodes
+            ]
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            results.append(nodes)
+        return results
+
+    def _fragment_wrapper(self):
+        """
+        Return the opening wrapper tag used to parse fragments.
+
+        The wrapper re-declares the namespaces of the root document element. It
+        is cached until an attribute is added to the root element.
+        """
+        root_elem = self._dom.documentElement
+        attr_count = root_elem.attributes.length if root_elem else 0  # type: ignore
+        if self._wrapper_cache is None or self._wrapper_cache[0] != attr_count:
+            # Extract namespace declarations from the root document element
+            namespaces = []
+            if root_elem and root_elem.attributes:
+                for i in range(root_elem.attributes.length):
+                    attr = root_elem.attributes.item(i)
+                    if attr.name.startswith("xmlns"):  # type: ignore
+                        namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+
+            ns_decl = " ".join(namespaces)
+            self._wrapper_cache = (attr_count, f"<root {ns_decl}>")
+        return self._wrapper_cache[1]
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml instead of minidom.
+
+    Offers the same get_node, replace_node, insert_after, insert_before,
+    append_to, get_next_rid and save API. Loading and lookups run in C and
+    elements are several times smaller than minidom nodes, which matters for
+    multi-MB parts. Line numbers come from lxml's sourceline. Elements
+    returned by get_node and the edit methods are lxml elements, so direct
+    DOM manipulation uses the lxml API (dom is an lxml ElementTree).
+    """
+
+    def _parse(self):
+        """Parse xml_path with a hardened lxml parser."""
+        data = self.xml_path.read_bytes()
+        tree = etree.ElementTree(
+            etree.fromstring(
+                data, _create_hardened_parser(), base_url=str(self.xml_path)
+            )
+        )
+        _reject_entity_declarations(tree)
+        self._clark_cache = {}
+        # Prefixes declared anywhere in the file, kept by _declare_namespace
+        self._declared_prefixes = {
+            prefix.decode() for prefix in _PREFIX_DECLARATION.findall(data)
+        }
+        self._big_lines = {}
+        if data.count(b"\n") >= _MAX_SOURCELINE:
+            # libxml2 stores line numbers in 16 bits, so sourceline is unreliable
+            # from line 65535 on; take those lines from expat instead
+            lines = _element_start_lines(data)
+            for elem, line in zip(tree.getroot().iter(etree.Element), lines):
+                if line >= _MAX_SOURCELINE:
+                    self._big_lines[elem] = line
+        return tree
+
+    def _clark(self, name):
+        """
+        Convert a qualified name ("w:p") to lxml's "{namespace}p" form.
+
+        Unprefixed element names use the default namespace; unprefixed
+        attribute names have none. Returns None for an undeclared prefix.
+        """
+        if name not in self._clark_cache:
+            prefix, _, local = name.rpartition(":")
+            if prefix == "xml":
+                clark = f"{{{XML_NAMESPACE}}}{local}"
+            elif prefix:
+                uri = self._dom.getroot().nsmap.get(prefix)
+                clark = f"{{{uri}}}{local}" if uri else None
+            else:
+                clark = name
+            self._clark_cache[name] = clark
+        return self._clark_cache[name]
+
+    def _clark_tag(self, name):
+        """Like _clark, but unprefixed names use the default namespace."""
+        if name == "*":
+            return name
+        if ":" in name:
+            return self._clark(name)
+        uri = self._dom.getroot().nsmap.get(None)
+        return f"{{{uri}}}{name}" if uri else name
+
+    def _subtree(self, elem):
+        return list(elem.iter(etree.Element))
+
+    def _is_element(self, node):
+        return isinstance(node.tag, str)
+
+    def _iter_elements(self, tag="*"):
+        clark = self._clark_tag(tag)
+        if clark is None:
+            return []
+        if clark == "*":
+            return list(self._dom.getroot().iter(etree.Element))
+        return list(self._dom.getroot().iter(clark))
+
+    def _tag(self, elem):
+        local = etree.QName(elem).localname
+        return f"{elem.prefix}:{local}" if elem.prefix else local
+
+    def _attribute(self, elem, name):
+        clark = self._clark(name)
+        return elem.get(clark, "") if clark else ""
+
+    def _line(self, elem):
+        # Elements from fragments have their sourceline cleared to 0
+        if elem.sourceline and elem.sourceline >= _MAX_SOURCELINE:
+            return self._big_lines.get(elem)
+        return elem.sourceline or None
+
+    def _parent(self, elem):
+        return elem.getparent()
+
+    def _is_attached(self, elem):
+        return elem.getroottree().getroot() is self._dom.getroot()
+
+    def _children(self, elem):
+        return [child for child in elem if isinstance(child.tag, str)]
+
+    def _text(self, elem):
+        return elem.text or ""
+
+    def _to_xml(self, elem):
+        xml = etree.tostring(elem, encoding="unicode", with_tail=False)
+        # tostring declares inherited namespaces on the element; drop the ones
+        # the fragment wrapper declares anyway
+        root_nsmap = self._dom.getroot().nsmap
+        end = xml.index(">")
+        start_tag = _NAMESPACE_DECLARATION.sub(
+            lambda m: "" if root_nsmap.get(m.group(1)) == m.group(2) else m.group(0),
+            xml[:end],
+        )
+        return start_tag + xml[end:]
+
+    def _declare_namespace(self, prefix, uri):
+        root = self._dom.getroot()
+        if prefix not in root.nsmap:
+            # Moving every node to a new root is slow on large trees, so let
+            # libxml2 add the declaration in place. cleanup_namespaces would also
+            # drop unused declarations; keep all of them, as prefixes can be
+            # used in attribute values only (mc:Ignorable)
+            self._declared_prefixes.add(prefix)
+            etree.cleanup_namespaces(
+                self._dom,
+                top_nsmap={prefix: uri},
+                keep_ns_prefixes=sorted(self._declared_prefixes),
+            )
+            self._clark_cache = {}
+            self.dirty = True
+        elif root.nsmap[prefix] != uri:
+            # lxml cannot add a declaration to an existing element, so move the
+            # children to a copy of the root that declares it
+            new_root = etree.Element(
+                root.tag, attrib=dict(root.attrib), nsmap={**root.nsmap, prefix: uri}
+            )
+            new_root.text = root.text
+            new_root.sourceline = root.sourceline
+            new_root.extend(list(root))
+            self._dom._setroot(new_root)
+            self._clark_cache = {}
+            self.reindex()
+
+    def _get_element_text(self, elem):
+        return "".join(text for text in elem.itertext(etree.Element) if text.strip())
+
+    def _cached_text(self, elem):
+        text = self._text_cache.get(elem)
+        if text is None:
+            text_parts = [elem.text] if elem.text and elem.text.strip() else []
+            for child in elem:
+                if isinstance(child.tag, str):
+                    text_parts.append(self._cached_text(child))
+                if child.tail and child.tail.strip():
+                    text_parts.append(child.tail)
+            text = self._text_cache[elem] = "".join(text_parts)
+        return text
+
+    def _place_nodes(self, operation, elem, nodes):
+        if operation == "append_to":
+            for node in nodes:
+                elem.append(node)
+        elif operation == "insert_after":
+            anchor = elem
+            for node in nodes:
+                anchor.addnext(node)
+                anchor = node
+        elif operation in ("insert_before", "replace_node"):
+            for node in nodes:
+                elem.addprevious(node)
+            if operation == "replace_node":
+                parent = elem.getparent()
+                _remove_preserving_tail(elem)
+                self._index_removed(elem, parent)
+        else:
+            raise ValueError(f"Unknown operation: {operation}")
+        self._index_added(nodes)
+        self.dirty = True
         return nodes
 
+    def _parse_fragments(self, xml_contents):
+        items = "".join(
+            f"<{_FRAGMENT_TAG}>{xml_content}</{_FRAGMENT_TAG}>"
+            for xml_content in xml_contents
+        )
+        wrapper = f"{self._fragment_wrapper()}{items}</root>"
+        fragment_root = etree.fromstring(wrapper, _create_hardened_parser())
+        results = []
+        for item in fragment_root:
+            nodes = list(item)
+            assert any(
+                isinstance(node.tag, str) for node in nodes
+            ), "Fragment must contain at least one element"
+            for node in nodes:
+                for elem in node.iter():
+                    elem.sourceline = 0
+            results.append(nodes)
+        return results
+
+    def _fragment_wrapper(self):
+        nsmap = self._dom.getroot().nsmap
+        key = tuple(sorted(nsmap.items(), key=lambda item: item[0] or ""))
+        if self._wrapper_cache is None or self._wrapper_cache[0] != key:
+            namespaces = [
+                f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+                for prefix, uri in key
+            ]
+            self._wrapper_cache = (key, f"<root {' '.join(namespaces)}>")
+        return self._wrapper_cache[1]
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Writes the same XML declaration Word uses and preserves the original
+        encoding (ascii or utf-8).
+        """
+        standalone = ' standalone="yes"' if self._dom.docinfo.standalone else ""
+        declaration = (
+            f'<?xml version="1.0" encoding="{self.encoding.upper()}"{standalone}?>\n'
+        )
+        content = etree.tostring(self._dom.getroot(), encoding=self.encoding.upper())
+        if content.startswith(b"<?xml"):
+            content = content[content.index(b"?>") + 2 :].lstrip()
+        self.xml_path.write_bytes(declaration.encode("ascii") + content)
+        self.dirty = False
+
+
+def _create_hardened_parser():
+    """
+    Create an lxml parser with the protections defusedxml applies to minidom.
+
+    External entities, DTD loading and network access are disabled; entity
+    declarations are rejected after parsing by _reject_entity_declarations.
+    """
+    return etree.XMLParser(
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        dtd_validation=False,
+        remove_blank_text=False,
+    )
+
+
+def _reject_entity_declarations(tree):
+    """Raise ValueError if the document declares entities (as defusedxml does)."""
+    dtd = tree.docinfo.internalDTD
+    if dtd is not None and any(True for _ in dtd.iterentities()):
+        raise ValueError(f"Entity declarations are not allowed: {tree.docinfo.URL}")
+
+
+def _element_start_lines(data):
+    """Return the line each element of an XML document starts on, in document order."""
+    lines = []
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = lambda name, attrs: lines.append(
+        parser.CurrentLineNumber
+    )
+    parser.Parse(data, True)
+    return lines
+
+
+def _remove_preserving_tail(elem):
+    """Remove an lxml element without dropping the text that follows it."""
+    parent = elem.getparent()
+    if elem.tail:
+        previous = elem.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + elem.tail
+        else:
+            parent.text = (parent.text or "") + elem.tail
+    parent.remove(elem)
+
 
 def _create_line_tracking_parser():
     """
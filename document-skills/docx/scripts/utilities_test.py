@@ -0,0 +1,229 @@
+import re
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from lxml import etree
+
+from scripts.document import DocxXMLEditor, LxmlDocxXMLEditor
+from scripts.utilities import LxmlXMLEditor, XMLEditor
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+DOCUMENT_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}">
+  <w:body>
+    <w:p w:rsidR="00000001">
+      <w:r>
+        <w:t>First paragraph</w:t>
+      </w:r>
+    </w:p>
+    <w:p w:rsidR="00000002">
+      <w:r>
+        <w:t xml:space="preserve">Second </w:t>
+      </w:r>
+      <w:ins w:id="1" w:author="A" w:date="2024-01-01T00:00:00Z">
+        <w:r>
+          <w:t>inserted</w:t>
+        </w:r>
+      </w:ins>
+    </w:p>
+    <w:p w:rsidR="00000003">
+      <w:del w:id="2" w:author="A" w:date="2024-01-01T00:00:00Z">
+        <w:r>
+          <w:delText>Removed text</w:delText>
+        </w:r>
+      </w:del>
+    </w:p>
+  </w:body>
+</w:document>
+"""
+
+
+def canonical(path):
+    """C14N of a file with formatting whitespace and generated values removed."""
+    tree = etree.parse(str(path), etree.XMLParser(remove_blank_text=True))
+    for elem in tree.iter(etree.Element):
+        for name in list(elem.attrib):
+            if re.search(r"(date|dateUtc|paraId|textId)$", name):
+                del elem.attrib[name]
+    return etree.tostring(tree, method="c14n")
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the docx directory: python -m unittest scripts.utilities_test
+class TestEngineParity(unittest.TestCase):
+    """The minidom and lxml engines must behave the same way."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def write(self, name, content=DOCUMENT_XML, encoding="utf-8"):
+        path = self.tmp / name
+        path.write_bytes(content.encode(encoding))
+        return path
+
+    def editors(self, minidom_class=XMLEditor, lxml_class=LxmlXMLEditor, **kwargs):
+        return (
+            minidom_class(self.write("minidom.xml"), **kwargs),
+            lxml_class(self.write("lxml.xml"), **kwargs),
+        )
+
+    def describe(self, editor, **query):
+        try:
+            elem = editor.get_node(**query)
+        except ValueError as e:
+            return ("error", str(e))
+        return (editor._tag(elem), editor._line(elem), editor._get_element_text(elem))
+
+    def test_get_node(self):
+        queries = [
+            {"tag": "w:p", "contains": "First"},
+            {"tag": "w:p", "contains": "inserted"},
+            {"tag": "w:p", "line_number": 9},
+            {"tag": "w:r", "line_number": range(1, 30)},
+            {"tag": "w:p", "line_number": range(1, 30), "contains": "Removed"},
+            {"tag": "w:p", "attrs": {"w:rsidR": "00000002"}},
+            {"tag": "w:del", "attrs": {"w:id": "2"}},
+            {"tag": "w:t", "attrs": {"xml:space": "preserve"}},
+            {"tag": "w:p"},
+            {"tag": "w:p", "contains": "missing"},
+            {"tag": "w:tbl"},
+        ]
+        minidom_editor, lxml_editor = self.editors()
+        for query in queries:
+            self.assertEqual(
+                self.describe(minidom_editor, **query),
+                self.describe(lxml_editor, **query),
+                query,
+            )
+
+    def test_direct_text_edits(self):
+        for editor in self.editors():
+            editor.get_node(tag="w:p", contains="First")  # Builds the text cache
+            t = editor.get_node(tag="w:t", contains="First")
+            if hasattr(t, "firstChild"):
+                t.firstChild.data = "Changed"
+            else:
+                t.text = "Changed"
+            self.assertEqual(
+                self.describe(editor, tag="w:p", contains="First")[0], "error"
+            )
+            self.assertEqual(
+                self.describe(editor, tag="w:p", contains="Changed")[2], "Changed"
+            )
+
+    def test_edits_and_save(self):
+        minidom_editor, lxml_editor = self.editors()
+        for editor in (minidom_editor, lxml_editor):
+            first = editor.get_node(tag="w:p", contains="First")
+            new_nodes = editor.replace_node(
+                first, "<w:p><w:r><w:t>Replaced</w:t></w:r></w:p>"
+            )
+            editor.insert_before(
+                new_nodes[0], "<w:p><w:r><w:t>Before</w:t></w:r></w:p>"
+            )
+            editor.insert_after(new_nodes[0], "<w:p><w:r><w:t>After</w:t></w:r></w:p>")
+            editor.append_to(new_nodes[0], "<w:r><w:t> appended</w:t></w:r>")
+            # New elements have no source line but are found by content
+            replaced = editor.get_node(tag="w:p", contains="Replaced appended")
+            self.assertIsNone(editor._line(replaced))
+            self.assertEqual(
+                self.describe(editor, tag="w:p", line_number=4)[0], "error"
+            )
+            editor.save()
+        self.assertEqual(
+            canonical(minidom_editor.xml_path), canonical(lxml_editor.xml_path)
+        )
+
+    def test_tracked_changes(self):
+        minidom_editor, lxml_editor = self.editors(
+            DocxXMLEditor, LxmlDocxXMLEditor, rsid="00ABCDEF", author="Tester"
+        )
+        for editor in (minidom_editor, lxml_editor):
+            run = editor.get_node(tag="w:r", contains="First")
+            wrapper = editor.suggest_deletion(run)
+            editor.insert_after(wrapper, "<w:ins><w:r><w:t> Fresh</w:t></w:r></w:ins>")
+            editor.revert_insertion(editor.get_node(tag="w:ins", attrs={"w:id": "1"}))
+            editor.revert_deletion(editor.get_node(tag="w:del", attrs={"w:id": "2"}))
+            editor.save()
+        self.assertEqual(
+            canonical(minidom_editor.xml_path), canonical(lxml_editor.xml_path)
+        )
+
+        # The w16du namespace is declared once, on the root element
+        content = lxml_editor.xml_path.read_text()
+        self.assertIn('<w:document xmlns:w="', content)
+        self.assertIn("xmlns:w16du=", content.split(">", 2)[1])
+        self.assertNotIn("xmlns:ns0", content)
+
+    def test_suggest_replacements(self):
+        minidom_editor, lxml_editor = self.editors(
+            DocxXMLEditor, LxmlDocxXMLEditor, rsid="00ABCDEF", author="Tester"
+        )
+        replacements = [
+            {"original": "paragraph", "revised": "clause", "all": True},
+            {"original": "Second inserted", "revised": "Not matched"},
+            {"original": "Removed", "revised": "Not matched"},
+        ]
+        for editor in (minidom_editor, lxml_editor):
+            results = editor.suggest_replacements(replacements)
+            self.assertEqual([r["matches"] for r in results], [1, 0, 0])
+            deleted = editor.get_node(tag="w:del", contains="paragraph")
+            self.assertEqual(editor._attribute(deleted, "w:author"), "Tester")
+            editor.get_node(tag="w:ins", contains="clause")
+            # The unchanged text is kept in a plain run
+            kept = editor.get_node(tag="w:t", contains="First")
+            self.assertEqual(editor._text(kept), "First ")
+            editor.save()
+        self.assertEqual(
+            canonical(minidom_editor.xml_path), canonical(lxml_editor.xml_path)
+        )
+
+    def test_preserves_ascii_encoding(self):
+        content = DOCUMENT_XML.replace('encoding="UTF-8"', 'encoding="ascii"')
+        content = content.replace("First paragraph", "First &#8220;quoted&#8221;")
+        for editor_class in (XMLEditor, LxmlXMLEditor):
+            path = self.write(f"{editor_class.__name__}.xml", content, "ascii")
+            editor = editor_class(path)
+            elem = editor.get_node(tag="w:p", contains="&#8220;quoted")
+            editor.append_to(elem, "<w:r><w:t>“new”</w:t></w:r>")
+            editor.save()
+            saved = path.read_bytes()
+            saved.decode("ascii")
+            self.assertIn(b"&#8220;new&#8221;", saved)
+
+    def test_rejects_entity_declarations(self):
+        content = DOCUMENT_XML.replace(
+            "<w:document", '<!DOCTYPE w:document [<!ENTITY e "boom">]>\n<w:document', 1
+        )
+        for editor_class in (XMLEditor, LxmlXMLEditor):
+            path = self.write(f"{editor_class.__name__}.xml", content)
+            with self.assertRaises(ValueError, msg=editor_class.__name__):
+                editor_class(path)
+
+    def test_line_numbers_past_65535(self):
+        # libxml2 cannot report these lines itself
+        filler = (
+            "    <w:p>\n      <w:r>\n        <w:t>x</w:t>\n      </w:r>\n    </w:p>\n"
+        )
+        content = DOCUMENT_XML.replace("  <w:body>\n", "  <w:body>\n" + filler * 14000)
+        path = self.write("big.xml", content)
+        target_line = (
+            content.splitlines().index("          <w:delText>Removed text</w:delText>")
+            + 1
+        )
+        minidom_editor, lxml_editor = XMLEditor(path), LxmlXMLEditor(path)
+        for editor in (minidom_editor, lxml_editor):
+            elem = editor.get_node(tag="w:delText", line_number=target_line)
+            self.assertEqual(editor._get_element_text(elem), "Removed text")
+        self.assertEqual(
+            [minidom_editor._line(e) for e in minidom_editor._iter_elements("w:p")],
+            [lxml_editor._line(e) for e in lxml_editor._iter_elements("w:p")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -220,7 +220,27 @@ class TestGetBoundingBoxMessages(unittest.TestCase):
         messages = get_bounding_box_messages(stream)
         self.assertTrue(any("SUCCESS" in msg for msg in messages))
         self.assertFalse(any("FAILURE" in msg for msg in messages))
-    
+
+    def test_many_fields_on_many_pages(self):
+        """Test that only the intersection on one page of a long form is reported"""
+        fields = []
+        for page in range(1, 11):
+            for row in range(50):
+                fields.append({
+                    "description": f"Field {page}-{row}",
+                    "page_number": page,
+                    "label_bounding_box": [10, row * 15, 50, row * 15 + 10],
+                    "entry_bounding_box": [60, row * 15, 150, row * 15 + 10]
+                })
+        fields[260]["entry_bounding_box"] = [60, 150, 150, 170]  # Overlaps the next row
+        data = {"form_fields": fields}
+
+        stream = self.create_json_stream(data)
+        messages = get_bounding_box_messages(stream)
+        failures = [msg for msg in messages if "FAILURE" in msg]
+        self.assertEqual(len(failures), 1)
+        self.assertTrue(all("`Field 6-10`" in msg and "`Field 6-11`" in msg for msg in failures))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,14 +7,40 @@ Example usage:
 """
 
 import argparse
-import shutil
-import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
+import lxml.etree
+
+try:
+    from .soffice import convert_document
+except ImportError:
+    from soffice import convert_document
+
+# Media formats that are already compressed; deflating them again only costs time
+STORED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".wdp",
+    ".emz",
+    ".wmz",
+    ".mp3",
+    ".m4a",
+    ".mp4",
+    ".m4v",
+    ".mov",
+    ".wmv",
+    ".wma",
+    ".zip",
+    ".docx",
+    ".xlsx",
+    ".pptx",
+}
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
@@ -61,28 +87,36 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+    # Write parts straight from the source directory; [Content_Types].xml goes first
+    files = [f for f in input_dir.rglob("*") if f.is_file()]
+    files.sort(
+        key=lambda f: f.relative_to(input_dir).as_posix() != "[Content_Types].xml"
+    )
 
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
         with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+            for f in files:
+                arcname = f.relative_to(input_dir).as_posix()
+                suffix = f.suffix.lower()
+                if suffix in {".xml", ".rels"}:
+                    # Remove pretty-printing whitespace in memory
+                    zinfo = zipfile.ZipInfo.from_file(f, arcname)
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    zf.writestr(zinfo, condense_xml_bytes(f.read_bytes()))
+                elif suffix in STORED_EXTENSIONS:
+                    zf.write(f, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zf.write(f, arcname)
+    except Exception:
+        output_file.unlink(missing_ok=True)  # Don't leave a partial file behind
+        raise
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
@@ -100,29 +134,14 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to",
-                    filter_name,
-                    "--outdir",
-                    temp_dir,
-                    str(doc_path),
-                ],
-                capture_output=True,
-                timeout=10,
-                text=True,
-            )
-            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
-                error_msg = result.stderr.strip() or "Document validation failed"
-                print(f"Validation error: {error_msg}", file=sys.stderr)
-                return False
+            # Goes through the shared soffice listener when one can be used,
+            # so repeated packs don't each pay LibreOffice's start-up time
+            convert_document(doc_path, temp_dir, filter_name, timeout=10)
             return True
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
         except Exception as e:
@@ -131,28 +150,60 @@ def validate_document(doc_path):
 
 
 def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    """Strip unnecessary whitespace and remove comments (rewrites the file)."""
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_bytes(xml_file.read_bytes()))
+
+
+def condense_xml_bytes(content):
+    """Strip unnecessary whitespace and remove comments from serialized XML.
+
+    Whitespace-only text and comments are removed from every element except
+    prefixed text elements (w:t, a:t, ...), whose content is kept as-is.
+
+    Args:
+        content: XML document as bytes
+
+    Returns:
+        bytes: Condensed UTF-8 XML document with an XML declaration
+    """
+    # Hardened parser: no entity expansion, DTD loading or network access
+    parser = lxml.etree.XMLParser(
+        resolve_entities=False, no_network=True, load_dtd=False
+    )
+    tree = lxml.etree.ElementTree(lxml.etree.fromstring(content, parser=parser))
 
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
+    for element in tree.getroot().iter(lxml.etree.Element):
         # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
+        if element.prefix and lxml.etree.QName(element).localname == "t":
             continue
 
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+        # Remove whitespace-only text nodes (text before the first child and
+        # after each child), then comment nodes, whose tail text is kept
+        if element.text is not None and element.text.strip() == "":
+            element.text = None
+        for child in element:
+            if child.tail is not None and child.tail.strip() == "":
+                child.tail = None
+        for child in list(element):
+            if isinstance(child, lxml.etree._Comment):
+                _remove_preserving_tail(child)
+
+    # Keep standalone="yes" if the part declares it
+    kwargs = {"standalone": True} if tree.docinfo.standalone else {}
+    return lxml.etree.tostring(tree, xml_declaration=True, encoding="UTF-8", **kwargs)
+
+
+def _remove_preserving_tail(node):
+    """Remove a node from its parent, keeping the text that follows it."""
+    parent = node.getparent()
+    if node.tail:
+        previous = node.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + node.tail
+        else:
+            parent.text = (parent.text or "") + node.tail
+    parent.remove(node)
 
 
 if __name__ == "__main__":
@@ -3,12 +3,11 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .docx_text import count_paragraphs
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -67,6 +66,8 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         # Count and compare paragraphs
         self.compare_paragraph_counts()
 
+        if all_valid:
+            self.save_validation_state()
         return all_valid
 
     def validate_whitespace_preservation(self):
@@ -75,13 +76,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self._changed_files():
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Find all w:t elements
                 for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
@@ -128,13 +129,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self._changed_files():
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Find all w:t elements that are descendants of w:del elements
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
@@ -173,17 +174,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     def count_paragraphs_in_unpacked(self):
         """Count the number of paragraphs in the unpacked document."""
         count = 0
+        document_xml = self.unpacked_dir / "word" / "document.xml"
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
+        if document_xml.exists():
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+                count = count_paragraphs(document_xml)
             except Exception as e:
                 print(f"Error counting paragraphs in unpacked document: {e}")
 
@@ -194,19 +189,9 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Stream document.xml straight from the original archive
+            with self.original_package.open("word/document.xml") as document_xml:
+                count = count_paragraphs(document_xml)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -220,12 +205,12 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self._changed_files():
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 # Find w:delText in w:ins that are NOT within w:del
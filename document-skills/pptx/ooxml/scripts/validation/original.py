@@ -0,0 +1,78 @@
+"""
+Read-only access to the parts of an original Office file.
+"""
+
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+
+class OriginalPackage:
+    """Reads individual parts of an original .docx/.pptx/.xlsx straight from the zip.
+
+    The archive is opened once, on first access, and members are read into
+    memory on demand, so validators can compare against the original document
+    without extracting it to a temporary directory.
+
+    Example:
+        with OriginalPackage("original.docx") as package:
+            if package.has_part("word/document.xml"):
+                root = package.parse("word/document.xml").getroot()
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._zip = None
+        self._names = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _archive(self):
+        """Open the archive on first use and return it."""
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.path, "r")
+            self._names = set(self._zip.namelist())
+        return self._zip
+
+    def has_part(self, part_name):
+        """Check if the package contains a part (e.g. "word/document.xml")."""
+        self._archive()
+        return str(part_name) in self._names
+
+    def read(self, part_name):
+        """Return the raw bytes of a part.
+
+        Raises:
+            KeyError: If the part does not exist in the package
+        """
+        return self._archive().read(str(part_name))
+
+    def open(self, part_name):
+        """Open a part for streaming reads and return a binary file object.
+
+        Raises:
+            KeyError: If the part does not exist in the package
+        """
+        return self._archive().open(str(part_name))
+
+    def parse(self, part_name):
+        """Parse a part and return it as an lxml ElementTree.
+
+        Raises:
+            KeyError: If the part does not exist in the package
+            lxml.etree.XMLSyntaxError: If the part is not well-formed XML
+        """
+        root = lxml.etree.fromstring(self.read(part_name))
+        return lxml.etree.ElementTree(root)
+
+    def close(self):
+        """Close the underlying archive."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+            self._names = None
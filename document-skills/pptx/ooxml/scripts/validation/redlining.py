@@ -2,11 +2,25 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
-import zipfile
+import bisect
+import collections
+import difflib
+import re
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from .docx_text import iter_paragraphs
+from .original import OriginalPackage
+
+# Words, runs of whitespace and single other characters, so that joining the
+# tokens gives back the text. CJK characters are single tokens as those scripts
+# do not separate words with spaces.
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_WORD_PATTERN = re.compile(rf"[^\W{_CJK}]+|\s+|.", re.DOTALL)
+
+# Largest product of word counts aligned word by word in one changed block
+_MAX_WORD_DIFF_COST = 4_000_000
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -27,92 +41,49 @@ class RedliningValidator:
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
+        # Text with Claude's insertions dropped and Claude's deletions kept,
+        # i.e. the document as it was before Claude's tracked changes
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+            modified_text, claude_changed = self._extract_text_content(modified_file)
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
 
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        if not claude_changed:
             if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
+                print("PASSED - No tracked changes by Claude found.")
             return True
 
+        # Read the original document.xml straight from the archive
+        try:
+            with OriginalPackage(self.original_docx) as package:
+                if not package.has_part("word/document.xml"):
+                    print(
+                        f"FAILED - Original document.xml not found in {self.original_docx}"
+                    )
+                    return False
+                with package.open("word/document.xml") as original_xml:
+                    original_text, _ = self._extract_text_content(original_xml)
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            print(error_message)
+            return False
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed word-level differences between the document texts."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,152 +98,162 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
-        else:
-            error_parts.append("Unable to generate word diff (git not available)")
+        # Show word diff
+        word_diff = self._get_word_diff(original_text, modified_text)
+        if word_diff:
+            error_parts.extend(["Differences:", "============", word_diff])
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+    def _get_word_diff(self, original_text, modified_text):
+        """Generate a word diff in the style of git diff --word-diff=plain -U0.
 
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
+        Paragraphs are aligned first; only the changed paragraphs are diffed word
+        by word. Removed text is shown as [-text-] and added text as {+text+}.
+        """
+        original = original_text.split("\n")
+        modified = modified_text.split("\n")
+
+        # Most of a long document is usually unchanged at both ends
+        prefix = 0
+        limit = min(len(original), len(modified))
+        while prefix < limit and original[prefix] == modified[prefix]:
+            prefix += 1
+        suffix = 0
+        limit -= prefix
+        while suffix < limit and original[-1 - suffix] == modified[-1 - suffix]:
+            suffix += 1
+        original = original[prefix : len(original) - suffix]
+        modified = modified[prefix : len(modified) - suffix]
+
+        lines = []
+        for tag, i1, i2, j1, j2 in self._align_paragraphs(original, modified):
+            if tag == "delete":
+                lines.extend(f"[-{line}-]" for line in original[i1:i2])
+            elif tag == "insert":
+                lines.extend(f"{{+{line}+}}" for line in modified[j1:j2])
+            else:
+                lines.extend(
+                    self._diff_words(
+                        "\n".join(original[i1:i2]), "\n".join(modified[j1:j2])
+                    ).split("\n")
                 )
+        return "\n".join(lines)
+
+    def _align_paragraphs(self, original, modified):
+        """Return the changed blocks between two lists of paragraphs.
+
+        Like patience diff, paragraphs that occur exactly once on each side are
+        matched up first (in order, by a longest increasing subsequence). Only
+        the gaps between these anchors are compared with difflib, which keeps
+        long documents with scattered edits close to linear time.
 
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
-
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
-
-        Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
+        Returns:
+            list: difflib-style opcodes without the "equal" blocks
         """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
+        original_counts = collections.Counter(original)
+        modified_counts = collections.Counter(modified)
+        unique_positions = {
+            line: i for i, line in enumerate(original) if original_counts[line] == 1
+        }
+        pairs = [
+            (unique_positions[line], j)
+            for j, line in enumerate(modified)
+            if modified_counts[line] == 1 and line in unique_positions
+        ]
 
+        # Longest increasing subsequence of original positions (patience sorting).
+        # Without moved paragraphs all pairs are already in order.
+        if all(a[0] < b[0] for a, b in zip(pairs, pairs[1:])):
+            return self._gap_opcodes(original, modified, pairs)
+        tails = []  # tails[k]: index into pairs ending the best run of length k+1
+        previous = [None] * len(pairs)
+        tail_values = []
+        for index, (i, _) in enumerate(pairs):
+            k = bisect.bisect_left(tail_values, i)
+            previous[index] = tails[k - 1] if k else None
+            if k == len(tails):
+                tails.append(index)
+                tail_values.append(i)
+            else:
+                tails[k] = index
+                tail_values[k] = i
+        anchors = []
+        index = tails[-1] if tails else None
+        while index is not None:
+            anchors.append(pairs[index])
+            index = previous[index]
+        anchors.reverse()
+        return self._gap_opcodes(original, modified, anchors)
+
+    def _gap_opcodes(self, original, modified, anchors):
+        """Diff the paragraphs between matched (original, modified) positions."""
+        opcodes = []
+        i = j = 0
+        for anchor_i, anchor_j in anchors + [(len(original), len(modified))]:
+            if i < anchor_i and j < anchor_j:
+                matcher = difflib.SequenceMatcher(
+                    None, original[i:anchor_i], modified[j:anchor_j], autojunk=False
+                )
+                opcodes.extend(
+                    (tag, i + i1, i + i2, j + j1, j + j2)
+                    for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+                    if tag != "equal"
+                )
+            elif i < anchor_i:
+                opcodes.append(("delete", i, anchor_i, j, j))
+            elif j < anchor_j:
+                opcodes.append(("insert", i, i, j, anchor_j))
+            i, j = anchor_i + 1, anchor_j + 1
+        return opcodes
+
+    def _diff_words(self, original, modified):
+        """Mark the words that differ between two paragraphs."""
+        original_words = _WORD_PATTERN.findall(original)
+        modified_words = _WORD_PATTERN.findall(modified)
+        if len(original_words) * len(modified_words) > _MAX_WORD_DIFF_COST:
+            # Too large to align word by word in reasonable time
+            return f"[-{original}-]{{+{modified}+}}"
+
+        matcher = difflib.SequenceMatcher(
+            None, original_words, modified_words, autojunk=False
+        )
+        parts = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                parts.append("".join(original_words[i1:i2]))
+                continue
+            if tag in ("delete", "replace"):
+                parts.append(f"[-{''.join(original_words[i1:i2])}-]")
+            if tag in ("insert", "replace"):
+                parts.append(f"{{+{''.join(modified_words[j1:j2])}+}}")
+        return "".join(parts)
+
+    def _extract_text_content(self, source):
+        """Extract the text of a document.xml without Claude's tracked changes.
+
+        Claude's insertions are dropped and Claude's deletions are read as
+        plain text. Empty paragraphs are skipped to avoid false positives when
+        tracked insertions add only structural elements without text content.
+
+        Returns:
+            tuple: (text with one line per paragraph, whether any tracked change
+                    by Claude was found)
+        """
         paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
+        # Authors of every w:ins/w:del, including table row changes in w:trPr
+        authors = set()
+        for paragraph in iter_paragraphs(
+            source,
+            include_insertions=lambda author: author != "Claude",
+            include_deletions={"Claude"},
+            changed_by=authors,
+        ):
             # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
+            if paragraph.text:
+                paragraphs.append(paragraph.text)
 
-        return "\n".join(paragraphs)
+        return "\n".join(paragraphs), "Claude" in authors
 
 
 if __name__ == "__main__":
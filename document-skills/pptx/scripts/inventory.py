@@ -11,11 +11,15 @@ This module provides functionality to:
 - Export to JSON with clean, structured data
 
 Classes:
+    FontCatalog: Index of the installed font files, built once per process
+    TextMeasurer: Cached text width measurement and line wrapping for one font
     ParagraphData: Represents a text paragraph with formatting
     ShapeData: Represents a shape with position and text content
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    extract_slide_inventory: Extract the text shapes of one slide
+    get_inventory_as_dict: Extract as JSON-serializable data, optionally in parallel
     save_inventory: Save extracted data to JSON
 
 Usage:
@@ -23,15 +27,22 @@ Usage:
 """
 
 import argparse
+import bisect
+import functools
 import json
+import os
 import platform
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from overlaps import intersecting_pairs
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.enum.dml import MSO_FILL
 from pptx.enum.text import PP_ALIGN
 from pptx.shapes.base import BaseShape
 
@@ -60,6 +71,9 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 4
+    Processes slides in 4 worker processes
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,6 +90,18 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--font-cache",
+        metavar="FILE",
+        help="Reuse the font catalog saved in FILE while the font directories are unchanged",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes for slides (default: 1; 0 uses all CPUs)",
+    )
 
     args = parser.parse_args()
 
@@ -89,16 +115,21 @@ The output JSON includes:
         sys.exit(1)
 
     try:
+        if args.font_cache:
+            get_font_catalog(Path(args.font_cache))
+
         print(f"Extracting text inventory from: {args.input}")
         if args.issues_only:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        inventory = get_inventory_as_dict(
+            input_path, issues_only=args.issues_only, jobs=args.jobs
+        )
 
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        save_inventory_dict(inventory, output_path)
 
         print(f"Output saved to: {args.output}")
 
@@ -134,6 +165,320 @@ class ShapeWithPosition:
     absolute_top: int  # in EMUs
 
 
+# Trailing words of a font file name that describe its style, as (bold, italic)
+FONT_STYLE_WORDS = {
+    "regular": (False, False),
+    "normal": (False, False),
+    "roman": (False, False),
+    "book": (False, False),
+    "bold": (True, False),
+    "italic": (False, True),
+    "oblique": (False, True),
+}
+
+
+def normalize_font_name(name: str) -> str:
+    """Lowercase a font or file name and drop spaces, hyphens and underscores."""
+    return re.sub(r"[\s_-]+", "", name.lower())
+
+
+def split_font_style(name: str) -> Tuple[str, bool, bool]:
+    """Split a normalized font name into (family, bold, italic).
+
+    Example: "dejavusansboldoblique" -> ("dejavusans", True, True)
+    """
+    bold = italic = False
+    stripped = True
+    while stripped:
+        stripped = False
+        for word, (is_bold, is_italic) in FONT_STYLE_WORDS.items():
+            if name.endswith(word) and len(name) > len(word):
+                name = name[: -len(word)]
+                bold, italic = bold or is_bold, italic or is_italic
+                stripped = True
+    return name, bold, italic
+
+
+class FontCatalog:
+    """Index of the font files in the platform's font directories.
+
+    The directories (and their subdirectories) are scanned once, and font names
+    are resolved against the index by family and style. A catalog can be saved
+    to a JSON file and reused while the modification times of the scanned
+    directories stay the same.
+    """
+
+    def __init__(self, paths: List[str], directories: Dict[str, Optional[int]]):
+        """
+        Args:
+            paths: Font files in priority order
+            directories: Scanned directories with their st_mtime_ns, or None if missing
+        """
+        self.paths = paths
+        self.directories = directories
+        # Normalized family -> [((bold, italic), path)] in priority order
+        self._families: Dict[str, List[Tuple[Tuple[bool, bool], str]]] = {}
+        # (normalized file name, (bold, italic), path) for partial matches
+        self._names: List[Tuple[str, Tuple[bool, bool], str]] = []
+        self._found: Dict[Tuple[str, bool, bool], Optional[str]] = {}
+
+        for path in paths:
+            name = normalize_font_name(Path(path).stem)
+            family, bold, italic = split_font_style(name)
+            self._families.setdefault(family, []).append(((bold, italic), path))
+            self._names.append((name, (bold, italic), path))
+
+    @staticmethod
+    def font_directories() -> Tuple[List[str], List[str]]:
+        """Return the font directories and file extensions of this platform."""
+        if platform.system() == "Darwin":  # macOS
+            font_dirs = [
+                "/System/Library/Fonts/",
+                "/Library/Fonts/",
+                "~/Library/Fonts/",
+            ]
+            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
+        else:  # Linux
+            font_dirs = [
+                "/usr/share/fonts/truetype/",
+                "/usr/local/share/fonts/",
+                "~/.fonts/",
+            ]
+            extensions = [".ttf", ".otf"]
+        return font_dirs, extensions
+
+    @classmethod
+    def scan(cls) -> "FontCatalog":
+        """Build a catalog by walking the font directories."""
+        font_dirs, extensions = cls.font_directories()
+        paths: List[str] = []
+        directories: Dict[str, Optional[int]] = {}
+
+        for font_dir in font_dirs:
+            root = os.path.expanduser(font_dir)
+            if not os.path.isdir(root):
+                directories[root] = None
+                continue
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames.sort()
+                try:
+                    directories[dirpath] = os.stat(dirpath).st_mtime_ns
+                except OSError:
+                    continue
+                fonts = []
+                for filename in filenames:
+                    ext = os.path.splitext(filename)[1].lower()
+                    if ext in extensions:
+                        fonts.append((extensions.index(ext), filename))
+                paths.extend(
+                    os.path.join(dirpath, filename) for _, filename in sorted(fonts)
+                )
+
+        return cls(paths, directories)
+
+    @classmethod
+    def load(cls, cache_path: Path) -> "FontCatalog":
+        """Read a catalog saved with save(), or scan and save a new one.
+
+        The saved catalog is used only if it was made on the same platform and
+        none of the scanned directories has been modified, added or removed.
+        """
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            directories = data["directories"]
+            if data["platform"] == platform.system() and all(
+                cls._mtime(directory) == mtime
+                for directory, mtime in directories.items()
+            ):
+                return cls(data["paths"], directories)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+        catalog = cls.scan()
+        try:
+            catalog.save(cache_path)
+        except OSError as e:
+            print(f"Warning: Could not save font cache {cache_path}: {e}")
+        return catalog
+
+    @staticmethod
+    def _mtime(directory: str) -> Optional[int]:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def save(self, cache_path: Path) -> None:
+        """Save the catalog as JSON for load()."""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "platform": platform.system(),
+            "directories": self.directories,
+            "paths": self.paths,
+        }
+        cache_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    def find(
+        self, font_name: str, bold: bool = False, italic: bool = False
+    ) -> Optional[str]:
+        """Get the font file path for a font name and style.
+
+        Files of the same family are preferred in the requested style, then in
+        the regular style. Without such files, a file whose name contains the
+        font name is used. Results are memoized.
+
+        Args:
+            font_name: Name of the font (e.g., 'Arial', 'Calibri', 'DejaVu Sans Bold')
+            bold: Whether a bold face is wanted
+            italic: Whether an italic face is wanted
+
+        Returns:
+            Path to the font file, or None if not found
+        """
+        key = (font_name, bold, italic)
+        if key not in self._found:
+            self._found[key] = self._find(font_name, bold, italic)
+        return self._found[key]
+
+    def _find(self, font_name: str, bold: bool, italic: bool) -> Optional[str]:
+        name = normalize_font_name(font_name)
+        if not name:
+            return None
+        family, name_bold, name_italic = split_font_style(name)
+        style = (bold or name_bold, italic or name_italic)
+
+        candidates = self._families.get(family)
+        if candidates:
+            _, path = min(
+                candidates, key=lambda c: (c[0] != style, c[0] != (False, False))
+            )
+            return path
+
+        matches = [entry for entry in self._names if name in entry[0]]
+        if matches:
+            _, _, path = min(matches, key=lambda m: (m[1] != style, len(m[0])))
+            return path
+
+        return None
+
+
+_font_catalog: Optional[FontCatalog] = None
+
+
+def get_font_catalog(cache_path: Optional[Path] = None) -> FontCatalog:
+    """Return the font catalog of this process, building it on first use.
+
+    Args:
+        cache_path: JSON file to reuse the catalog from (see FontCatalog.load).
+                    Only used by the call that builds the catalog.
+    """
+    global _font_catalog
+    if _font_catalog is None:
+        _font_catalog = (
+            FontCatalog.load(cache_path) if cache_path else FontCatalog.scan()
+        )
+    return _font_catalog
+
+
+@functools.lru_cache(maxsize=64)
+def load_font(path: Optional[str], size: int) -> Any:
+    """Load a font for text measurement, falling back to PIL's default font.
+
+    Fonts are cached by (path, size); load_font.cache_info() reports the hits
+    and misses.
+    """
+    if path:
+        try:
+            return ImageFont.truetype(path, size=size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
+
+
+class TextMeasurer:
+    """Text widths and line wrapping for one font, built from cached word widths.
+
+    A line of space-separated words is as wide as its words and spaces plus a
+    kerning adjustment for each pair of glyphs that meet at a space. Each word
+    is measured with PIL once per font, so wrapping a paragraph costs one
+    measurement per new word instead of one per candidate line.
+    """
+
+    def __init__(self, font: Any):
+        self.font = font
+        self._draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        self._widths: Dict[str, float] = {}
+        self._space = self.measure(" ")
+
+    def measure(self, text: str) -> float:
+        """Width of text in pixels as measured by PIL, cached."""
+        width = self._widths.get(text)
+        if width is None:
+            width = self._widths[text] = self._draw.textlength(text, font=self.font)
+        return width
+
+    def _kerning(self, left: str, right: str) -> float:
+        """Adjustment to the width of two adjacent characters."""
+        return self.measure(left + right) - self.measure(left) - self.measure(right)
+
+    def _offsets(self, words: List[str]) -> List[float]:
+        """Cumulative widths of the words after the first.
+
+        offsets[j] - offsets[i] is the width that words[i + 1 : j + 1] add to a
+        line that ends with words[i], including the spaces between them.
+        """
+        offsets = [0.0]
+        for k in range(1, len(words)):
+            added = self._space
+            if words[k - 1]:
+                added += self._kerning(words[k - 1][-1], " ")
+            elif k > 1:
+                added += self._kerning(" ", " ")
+            if words[k]:
+                added += self._kerning(" ", words[k][0]) + self.measure(words[k])
+            offsets.append(offsets[-1] + added)
+        return offsets
+
+    def width(self, text: str) -> float:
+        """Width of text in pixels (see measure for a direct measurement)."""
+        words = text.split(" ")
+        return self.measure(words[0]) + self._offsets(words)[-1]
+
+    def wrap(self, line: str, max_width: float) -> List[str]:
+        """Wrap a single line of text to fit within max_width pixels.
+
+        Lines break at spaces; a word wider than max_width gets a line of its
+        own. Spaces at the start of wrapped lines are dropped.
+        """
+        if not line:
+            return [""]
+
+        words = line.split(" ")
+        offsets = self._offsets(words)
+        if self.measure(words[0]) + offsets[-1] <= max_width:
+            return [line]
+
+        wrapped = []
+        start = 0
+        while start < len(words):
+            if not words[start]:
+                start += 1
+                continue
+            # Last word that still fits on a line starting with words[start]
+            limit = max_width - self.measure(words[start]) + offsets[start]
+            end = bisect.bisect_right(offsets, limit, start + 1)
+            wrapped.append(" ".join(words[start:end]))
+            start = end
+
+        return wrapped
+
+
+@functools.lru_cache(maxsize=64)
+def get_text_measurer(path: Optional[str], size: int) -> TextMeasurer:
+    """Return the shared TextMeasurer of a font loaded with load_font."""
+    return TextMeasurer(load_font(path, size))
+
+
 class ParagraphData:
     """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
 
@@ -158,13 +503,12 @@ class ParagraphData:
         self.theme_color: Optional[str] = None
         self.line_spacing: Optional[float] = None
 
+        # Reading must not change the presentation: python-pptx adds an empty
+        # <a:pPr/> when alignment or level is read from a paragraph without one
+        pPr = paragraph._p.pPr if getattr(paragraph, "_p", None) is not None else None
+
         # Check for bullet formatting
-        if (
-            hasattr(paragraph, "_p")
-            and paragraph._p is not None
-            and paragraph._p.pPr is not None
-        ):
-            pPr = paragraph._p.pPr
+        if pPr is not None:
             ns = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
             if (
                 pPr.find(f"{ns}buChar") is not None
@@ -175,7 +519,7 @@ class ParagraphData:
                     self.level = paragraph.level
 
         # Add alignment if not LEFT (default)
-        if hasattr(paragraph, "alignment") and paragraph.alignment is not None:
+        if pPr is not None and paragraph.alignment is not None:
             alignment_map = {
                 PP_ALIGN.CENTER: "CENTER",
                 PP_ALIGN.RIGHT: "RIGHT",
@@ -190,10 +534,11 @@ class ParagraphData:
         if hasattr(paragraph, "space_after") and paragraph.space_after:
             self.space_after = paragraph.space_after.pt
 
-        # Extract font properties from first run
+        # Extract font properties from first run. run.font adds an empty
+        # <a:rPr/> to runs without one, so it is only read when there is one.
         if paragraph.runs:
             first_run = paragraph.runs[0]
-            if hasattr(first_run, "font"):
+            if first_run._r.rPr is not None:
                 font = first_run.font
                 if font.name:
                     self.font_name = font.name
@@ -206,18 +551,22 @@ class ParagraphData:
                 if font.underline is not None:
                     self.underline = font.underline
 
-                # Handle color - both RGB and theme colors
-                try:
-                    # Try RGB color first
-                    if font.color.rgb:
-                        self.color = str(font.color.rgb)
-                except (AttributeError, TypeError):
-                    # Fall back to theme color
+                # Handle color - both RGB and theme colors. font.color would add
+                # an empty <a:solidFill/> to runs without a fill, so read the
+                # color through font.fill instead.
+                if font.fill.type == MSO_FILL.SOLID:
+                    color = font.fill.fore_color
                     try:
-                        if font.color.theme_color:
-                            self.theme_color = font.color.theme_color.name
+                        # Try RGB color first
+                        if color.rgb:
+                            self.color = str(color.rgb)
                     except (AttributeError, TypeError):
-                        pass
+                        # Fall back to theme color
+                        try:
+                            if color.theme_color:
+                                self.theme_color = color.theme_color.name
+                        except (AttributeError, TypeError):
+                            pass
 
         # Add line spacing if set
         if hasattr(paragraph, "line_spacing") and paragraph.line_spacing is not None:
@@ -277,70 +626,20 @@ class ShapeData:
         return int(inches * dpi)
 
     @staticmethod
-    def get_font_path(font_name: str) -> Optional[str]:
+    def get_font_path(
+        font_name: str, bold: bool = False, italic: bool = False
+    ) -> Optional[str]:
         """Get the font file path for a given font name.
 
         Args:
             font_name: Name of the font (e.g., 'Arial', 'Calibri')
+            bold: Whether a bold face is wanted
+            italic: Whether an italic face is wanted
 
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return get_font_catalog().find(font_name, bold, italic)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -531,34 +830,6 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
-        """Wrap a single line of text to fit within max_width_px."""
-        if not line:
-            return [""]
-
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
-        words = line.split(" ")
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
-
-        if current_line:
-            wrapped.append(current_line)
-
-        return wrapped
-
     def _estimate_frame_overflow(self) -> None:
         """Estimate if text overflows the shape bounds using PIL text measurement."""
         if not self.shape or not hasattr(self.shape, "text_frame"):
@@ -573,10 +844,6 @@ class ShapeData:
         if usable_width_px <= 0 or usable_height_px <= 0:
             return
 
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
         # Get default font size from placeholder or use conservative estimate
         default_font_size = self._get_default_font_size()
 
@@ -593,21 +860,15 @@ class ShapeData:
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            font_path = self.get_font_path(
+                font_name, bool(para_data.bold), bool(para_data.italic)
+            )
+            measurer = get_text_measurer(font_path, font_size)
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
             for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
-                all_wrapped_lines.extend(wrapped)
+                all_wrapped_lines.extend(measurer.wrap(line, usable_width_px))
 
             if all_wrapped_lines:
                 # Calculate line height
@@ -678,6 +939,17 @@ class ShapeData:
                 )
                 break
 
+    def update_text_issues(self) -> None:
+        """Recompute the frame overflow and warnings after the text changed.
+
+        Position, size, slide overflow and overlaps do not depend on the text
+        and are kept.
+        """
+        self.frame_overflow_bottom = None
+        self.warnings = []
+        self._estimate_frame_overflow()
+        self._detect_bullet_issues()
+
     @property
     def has_any_issues(self) -> bool:
         """Check if shape has any issues (overflow, overlap, or warnings)."""
@@ -888,27 +1160,71 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
     """
-    n = len(shapes)
+    for i, shape in enumerate(shapes):
+        # Ensure shape IDs are set
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    rects = [(shape.left, shape.top, shape.width, shape.height) for shape in shapes]
+
+    # Only compare shapes whose bounding boxes meet
+    for i, j in intersecting_pairs(
+        [(left, top, left + width, top + height) for left, top, width, height in rects]
+    ):
+        overlaps, overlap_area = calculate_overlap(rects[i], rects[j])
+
+        if overlaps:
+            # Add shape IDs with overlap area in square inches
+            shapes[i].overlapping_shapes[shapes[j].shape_id] = overlap_area
+            shapes[j].overlapping_shapes[shapes[i].shape_id] = overlap_area
+
+
+def extract_slide_inventory(
+    slide: Any, issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Extract the text shapes of one slide.
+
+    Args:
+        slide: The python-pptx slide
+        issues_only: If True, only include shapes that have overflow or overlap issues
 
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+    Returns a dictionary {shape-N: ShapeData}, sorted by visual position. Slides
+    are independent of each other, so this is the unit of work for both the
+    sequential and the parallel extraction.
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+        )
+        for swp in shapes_with_positions
+    ]
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
 
 
 def extract_text_inventory(
@@ -931,50 +1247,16 @@ def extract_text_inventory(
     inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
-
-        if not shapes_with_positions:
-            continue
-
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
-
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
-
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
-
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
-
-        if not sorted_shapes:
-            continue
-
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
+        shapes = extract_slide_inventory(slide, issues_only=issues_only)
+        if shapes:
+            inventory[f"slide-{slide_idx}"] = shapes
 
     return inventory
 
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+def get_inventory_as_dict(
+    pptx_path: Path, issues_only: bool = False, jobs: int = 1
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
     This is a convenience wrapper around extract_text_inventory that returns
@@ -984,10 +1266,22 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Number of worker processes. With more than one, ranges of slides
+              are extracted in parallel, each worker opening the file itself.
+              0 uses all CPUs.
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs > 1:
+        slide_count = len(Presentation(str(pptx_path)).slides)
+        if slide_count > 1:
+            return _get_inventory_as_dict_parallel(
+                pptx_path, slide_count, issues_only, jobs
+            )
+
     inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
 
     # Convert ShapeData objects to dictionaries
@@ -1000,6 +1294,49 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     return dict_inventory
 
 
+def _get_inventory_as_dict_parallel(
+    pptx_path: Path, slide_count: int, issues_only: bool, jobs: int
+) -> InventoryDict:
+    """Extract ranges of slides in worker processes and merge them in slide order."""
+    # Several ranges per worker even out slides of different complexity;
+    # opening the file again for each range is cheap in comparison
+    range_count = min(slide_count, jobs * 4)
+    bounds = [slide_count * i // range_count for i in range(range_count + 1)]
+
+    dict_inventory: InventoryDict = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for slides in executor.map(
+            _get_slide_range_as_dict,
+            [pptx_path] * range_count,
+            bounds[:-1],
+            bounds[1:],
+            [issues_only] * range_count,
+        ):
+            dict_inventory.update(slides)
+
+    return dict_inventory
+
+
+def _get_slide_range_as_dict(
+    pptx_path: Path, start: int, stop: int, issues_only: bool
+) -> InventoryDict:
+    """Worker: extract slides start to stop - 1 as JSON-serializable dictionaries.
+
+    python-pptx objects cannot be pickled, so each worker opens the file and
+    only plain dictionaries are sent back.
+    """
+    slides = Presentation(str(pptx_path)).slides
+    dict_inventory: InventoryDict = {}
+    for slide_idx in range(start, stop):
+        shapes = extract_slide_inventory(slides[slide_idx], issues_only=issues_only)
+        if shapes:
+            dict_inventory[f"slide-{slide_idx}"] = {
+                shape_key: shape_data.to_dict()
+                for shape_key, shape_data in shapes.items()
+            }
+    return dict_inventory
+
+
 def save_inventory(inventory: InventoryData, output_path: Path) -> None:
     """Save inventory to JSON file with proper formatting.
 
@@ -1012,8 +1349,13 @@ def save_inventory(inventory: InventoryData, output_path: Path) -> None:
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
 
+    save_inventory_dict(json_inventory, output_path)
+
+
+def save_inventory_dict(inventory: InventoryDict, output_path: Path) -> None:
+    """Save an inventory from get_inventory_as_dict to a JSON file."""
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(json_inventory, f, indent=2, ensure_ascii=False)
+        json.dump(inventory, f, indent=2, ensure_ascii=False)
 
 
 if __name__ == "__main__":
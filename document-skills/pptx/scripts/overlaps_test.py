@@ -0,0 +1,126 @@
+import random
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+
+from inventory import calculate_overlap, detect_overlaps
+from overlaps import intersecting_pairs
+
+SLIDE_WIDTH = 13.33
+SLIDE_HEIGHT = 7.5
+
+
+def synthetic_slide(n, seed=0):
+    """Stand-ins for n ShapeData objects of a dense diagram slide, in inches."""
+    rng = random.Random(seed)
+    shapes = []
+    for i in range(n):
+        if i % 50 == 0:
+            # Backgrounds and banners spanning most of the slide
+            left, top = rng.uniform(0, 1), rng.uniform(0, 3)
+            width, height = rng.uniform(10, 13), rng.uniform(0.5, 4.5)
+        else:
+            width, height = rng.uniform(0.05, 1.5), rng.uniform(0.05, 0.8)
+            left = rng.uniform(-0.5, SLIDE_WIDTH - width)
+            top = rng.uniform(-0.5, SLIDE_HEIGHT - height)
+        shapes.append(
+            SimpleNamespace(
+                shape_id=f"shape-{i}",
+                left=round(left, 2),
+                top=round(top, 2),
+                width=round(width, 2),
+                height=round(height, 2),
+                overlapping_shapes={},
+            )
+        )
+    return shapes
+
+
+def detect_overlaps_all_pairs(shapes):
+    """The reference: compare every pair of shapes."""
+    for i in range(len(shapes)):
+        for j in range(i + 1, len(shapes)):
+            shape1, shape2 = shapes[i], shapes[j]
+            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
+            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+            if overlaps:
+                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
+                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+
+
+def overlap_dicts(shapes):
+    # Lists of items so that the key order is compared too
+    return [list(shape.overlapping_shapes.items()) for shape in shapes]
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the scripts directory: python -m unittest overlaps_test
+# Benchmark: python overlaps_test.py --benchmark
+class TestIntersectingPairs(unittest.TestCase):
+    def test_small_input(self):
+        boxes = [(0, 0, 2, 2), (1, 1, 3, 3), (5, 5, 6, 6), (2, 0, 4, 1)]
+        # Touching boxes count; callers apply their own strictness
+        self.assertEqual(intersecting_pairs(boxes), [(0, 1), (0, 3), (1, 3)])
+
+    def test_matches_all_pairs(self):
+        rng = random.Random(1)
+        for n in (40, 300):
+            boxes = []
+            for _ in range(n):
+                x, y = rng.randint(0, 30), rng.randint(0, 30)
+                # Integer corners make touching boxes common; some are reversed
+                boxes.append((x + rng.randint(-3, 3), y, x, y + rng.randint(0, 3)))
+            boxes.append((-100, -100, 100, 100))
+            normalized = [
+                (min(b[0], b[2]), min(b[1], b[3]), max(b[0], b[2]), max(b[1], b[3]))
+                for b in boxes
+            ]
+            expected = [
+                (i, j)
+                for i, a in enumerate(normalized)
+                for j in range(i + 1, len(normalized))
+                if a[0] <= normalized[j][2]
+                and normalized[j][0] <= a[2]
+                and a[1] <= normalized[j][3]
+                and normalized[j][1] <= a[3]
+            ]
+            self.assertEqual(intersecting_pairs(boxes), expected, n)
+
+    def test_degenerate_boxes(self):
+        self.assertEqual(intersecting_pairs([]), [])
+        # 50 points at 7 distinct positions: 8 at the first, 7 at the others
+        points = [(i % 7, i % 7, i % 7, i % 7) for i in range(50)]
+        self.assertEqual(len(intersecting_pairs(points)), 8 * 7 // 2 + 6 * 7 * 6 // 2)
+
+
+class TestDetectOverlaps(unittest.TestCase):
+    def test_same_results_as_all_pairs(self):
+        for n in (10, 100, 1000):
+            shapes, reference = synthetic_slide(n, n), synthetic_slide(n, n)
+            detect_overlaps(shapes)
+            detect_overlaps_all_pairs(reference)
+            self.assertEqual(overlap_dicts(shapes), overlap_dicts(reference), n)
+
+
+def benchmark():
+    print(f"{'shapes':>8} {'all pairs':>12} {'indexed':>12} {'overlaps':>10}")
+    for n in (10, 100, 500, 1000, 2000, 5000):
+        shapes, reference = synthetic_slide(n, n), synthetic_slide(n, n)
+        start = time.perf_counter()
+        detect_overlaps_all_pairs(reference)
+        all_pairs = time.perf_counter() - start
+        start = time.perf_counter()
+        detect_overlaps(shapes)
+        indexed = time.perf_counter() - start
+        assert overlap_dicts(shapes) == overlap_dicts(reference)
+        found = sum(len(shape.overlapping_shapes) for shape in shapes) // 2
+        print(f"{n:>8} {all_pairs:>11.4f}s {indexed:>11.4f}s {found:>10}")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        unittest.main()
@@ -244,6 +244,7 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     shapes_processed = 0
     shapes_cleared = 0
     shapes_replaced = 0
+    replaced_shapes = []
 
     # Process each slide from inventory
     for slide_key, shapes_dict in inventory.items():
@@ -288,43 +289,29 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
+            # Only shapes with new text can have new issues; cleared shapes have none
+            shape_data.update_text_issues()
+            replaced_shapes.append((slide_key, shape_key, shape_data))
 
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
-
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
-
-    # Check if any text overflow got worse
+    # Check for issues after replacements. Reading the inventory does not
+    # modify the presentation, so the replaced shapes are measured in place.
     overflow_errors = []
-    for slide_key, shape_overflows in updated_overflow.items():
-        for shape_key, new_overflow in shape_overflows.items():
-            # Get original overflow (0 if there was no overflow before)
-            original = original_overflow.get(slide_key, {}).get(shape_key, 0.0)
-
-            # Error if overflow increased
-            if new_overflow > original + 0.01:  # Small tolerance for rounding
-                increase = new_overflow - original
-                overflow_errors.append(
-                    f'{slide_key}/{shape_key}: overflow worsened by {increase:.2f}" '
-                    f'(was {original:.2f}", now {new_overflow:.2f}")'
-                )
-
-    # Collect warnings from updated shapes
     warnings = []
-    for slide_key, shapes_dict in updated_inventory.items():
-        for shape_key, shape_data in shapes_dict.items():
-            if shape_data.warnings:
-                for warning in shape_data.warnings:
-                    warnings.append(f"{slide_key}/{shape_key}: {warning}")
+    for slide_key, shape_key, shape_data in replaced_shapes:
+        # Get original overflow (0 if there was no overflow before)
+        new_overflow = shape_data.frame_overflow_bottom
+        original = original_overflow.get(slide_key, {}).get(shape_key, 0.0)
+
+        # Error if overflow increased (small tolerance for rounding)
+        if new_overflow is not None and new_overflow > original + 0.01:
+            increase = new_overflow - original
+            overflow_errors.append(
+                f'{slide_key}/{shape_key}: overflow worsened by {increase:.2f}" '
+                f'(was {original:.2f}", now {new_overflow:.2f}")'
+            )
+
+        for warning in shape_data.warnings:
+            warnings.append(f"{slide_key}/{shape_key}: {warning}")
 
     # Fail if there are any issues
     if overflow_errors or warnings:
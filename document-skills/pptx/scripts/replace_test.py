@@ -0,0 +1,76 @@
+import contextlib
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from inventory import extract_text_inventory
+from inventory_test import LONG_TEXT, build_presentation
+from replace import apply_replacements
+
+MANUAL_BULLET = "manual_bullet_symbol: use proper bullet formatting"
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the scripts directory: python -m unittest replace_test
+class TestApplyReplacements(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = self.tmp / "deck.pptx"
+        self.output = self.tmp / "output.pptx"
+        build_presentation(self.path)
+
+    def replace(self, shapes):
+        """Apply replacements for slide-0 and return the printed output."""
+        json_file = self.tmp / "replacements.json"
+        json_file.write_text(json.dumps({"slide-0": shapes}), encoding="utf-8")
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                apply_replacements(str(self.path), str(json_file), str(self.output))
+        finally:
+            self.printed = output.getvalue()
+
+    def test_worsened_overflow_fails(self):
+        shapes = {"shape-2": {"paragraphs": [{"text": LONG_TEXT}] * 3}}
+        with self.assertRaisesRegex(ValueError, "1 overflow error"):
+            self.replace(shapes)
+        self.assertIn("slide-0/shape-2: overflow worsened by", self.printed)
+        self.assertFalse(self.output.exists())
+
+    def test_manual_bullet_fails(self):
+        shapes = {"shape-2": {"paragraphs": [{"text": "• Growth"}]}}
+        with self.assertRaisesRegex(ValueError, "1 warning"):
+            self.replace(shapes)
+        self.assertIn(f"slide-0/shape-2: {MANUAL_BULLET}", self.printed)
+        self.assertFalse(self.output.exists())
+
+    def test_unchanged_overflow_after_cleared_shape_passes(self):
+        # shape-3 already overflows; clearing shape-1 before it must not make
+        # its overflow be compared against another shape
+        shapes = {
+            "shape-0": {"paragraphs": [{"text": "Results"}]},
+            "shape-2": {"paragraphs": [{"text": "Growth"}]},
+            "shape-3": {"paragraphs": [{"text": LONG_TEXT}]},
+        }
+        self.replace(shapes)
+        self.assertIn("Shapes replaced: 3", self.printed)
+
+        # The in-place check saw what a fresh inventory of the output sees
+        before = extract_text_inventory(self.path)["slide-0"]
+        after = extract_text_inventory(self.output)["slide-0"]
+        self.assertEqual(
+            [shape.paragraphs[0].text for shape in after.values()],
+            ["Results", "Growth", LONG_TEXT],
+        )
+        self.assertEqual(
+            after["shape-2"].frame_overflow_bottom,
+            before["shape-3"].frame_overflow_bottom,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
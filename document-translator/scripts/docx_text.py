@@ -0,0 +1,241 @@
+"""
+Streaming text and paragraph extraction for word/document.xml.
+
+Reads the document part with iterparse and clears elements as it goes, so
+memory stays bounded by the largest paragraph rather than the document size.
+Only the standard library is used so the module can be copied into other
+skills as-is.
+"""
+
+import zipfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+_P = f"{{{W_NS}}}p"
+_R = f"{{{W_NS}}}r"
+_T = f"{{{W_NS}}}t"
+_DEL_TEXT = f"{{{W_NS}}}delText"
+_TAB = f"{{{W_NS}}}tab"
+_BR = f"{{{W_NS}}}br"
+_CR = f"{{{W_NS}}}cr"
+_INS = f"{{{W_NS}}}ins"
+_DEL = f"{{{W_NS}}}del"
+_TBL = f"{{{W_NS}}}tbl"
+_TR = f"{{{W_NS}}}tr"
+_TC = f"{{{W_NS}}}tc"
+_BODY = f"{{{W_NS}}}body"
+_AUTHOR = f"{{{W_NS}}}author"
+
+
+@dataclass
+class Paragraph:
+    """A w:p element of document.xml.
+
+    Attributes:
+        index: Position among all w:p elements of the part, in document order
+        text: Text of the paragraph's runs; tabs and breaks become "\\t" and "\\n"
+        inserted_by: Authors of tracked insertions in the paragraph
+        deleted_by: Authors of tracked deletions in the paragraph
+        cell: (table, row, cell) indexes if the paragraph is in a table cell,
+              counting tables in document order, otherwise None
+        parent: Index of the paragraph this one is nested in (e.g. through a
+                text box), or None for a paragraph that is not nested
+    """
+
+    index: int
+    text: str = ""
+    inserted_by: set = field(default_factory=set)
+    deleted_by: set = field(default_factory=set)
+    cell: tuple = None
+    parent: int = None
+
+
+def _author_filter(option):
+    """Turn an include_* option into a function of the change author."""
+    if callable(option):
+        return option
+    if isinstance(option, bool):
+        return lambda author: option
+    authors = set(option)
+    return lambda author: author in authors
+
+
+def _open_part(source, part):
+    """Return a binary file object for the part and whether to close it."""
+    if hasattr(source, "read"):
+        return source, False
+    if zipfile.is_zipfile(source):
+        archive = zipfile.ZipFile(source)
+        try:
+            stream = archive.open(part)
+        finally:
+            # The member stream keeps its own reference to the archive file
+            archive.close()
+        return stream, True
+    return open(source, "rb"), True
+
+
+def iter_paragraphs(
+    source,
+    include_insertions=True,
+    include_deletions=False,
+    part="word/document.xml",
+    changed_by=None,
+):
+    """
+    Yield the paragraphs of a Word document part in document order.
+
+    Tracked changes are resolved while reading. Text inside an excluded w:ins is
+    dropped, together with any paragraphs inside it. Deleted text (w:delText)
+    and deleted tabs and breaks are only kept inside an included w:del. The
+    defaults give the document as it reads with all changes accepted.
+
+    Args:
+        source: Path to a .docx file, path to an XML part (e.g. an unpacked
+                word/document.xml), or a binary file object
+        include_insertions: Which insertions to keep: True, False, a collection
+                            of author names, or a function taking the author
+        include_deletions: Which deletions to keep, as for include_insertions
+        part: Part to read when source is a .docx file
+        changed_by: Optional set that the authors of all tracked insertions and
+                    deletions in the part are added to, including changes
+                    outside paragraphs such as inserted or deleted table rows
+
+    Yields:
+        Paragraph: One per w:p element that is not inside an excluded insertion.
+                   Paragraphs nested in another paragraph (e.g. in text boxes)
+                   are yielded after it, and their text is not part of it.
+
+    Example:
+        # Text without Claude's changes
+        for para in iter_paragraphs(
+            "unpacked/word/document.xml",
+            include_insertions=lambda author: author != "Claude",
+            include_deletions={"Claude"},
+        ):
+            print(para.index, para.text)
+    """
+    insertion_kept = _author_filter(include_insertions)
+    deletion_kept = _author_filter(include_deletions)
+
+    stream, close = _open_part(source, part)
+    try:
+        index = 0
+        hidden = 0  # Number of open excluded w:ins elements
+        deletions = 0  # Number of open w:del elements
+        kept_deletions = 0  # Number of open included w:del elements
+        in_run = 0
+        changes = []  # Open w:ins/w:del as (hidden, deletion, kept_deletion)
+        tables = []  # Open tables as [table, row, cell]
+        table_count = 0
+        open_paragraphs = []
+        done = []  # Ended paragraphs waiting for their outermost paragraph
+        body = None
+
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == _P:
+                    if not hidden:
+                        cell = tuple(tables[-1]) if tables else None
+                        parent = open_paragraphs[-1].index if open_paragraphs else None
+                        open_paragraphs.append(
+                            Paragraph(index=index, cell=cell, parent=parent)
+                        )
+                    index += 1
+                elif tag == _R:
+                    in_run += 1
+                elif tag == _INS or tag == _DEL:
+                    author = elem.get(_AUTHOR, "")
+                    if changed_by is not None:
+                        changed_by.add(author)
+                    for paragraph in open_paragraphs:
+                        getattr(
+                            paragraph, "inserted_by" if tag == _INS else "deleted_by"
+                        ).add(author)
+                    change = (
+                        tag == _INS and not insertion_kept(author),
+                        tag == _DEL,
+                        tag == _DEL and deletion_kept(author),
+                    )
+                    changes.append(change)
+                    hidden += change[0]
+                    deletions += change[1]
+                    kept_deletions += change[2]
+                elif tag == _TBL:
+                    tables.append([table_count, -1, -1])
+                    table_count += 1
+                elif tag == _TR and tables:
+                    tables[-1][1:] = [tables[-1][1] + 1, -1]
+                elif tag == _TC and tables:
+                    tables[-1][2] += 1
+                elif tag == _BODY:
+                    body = elem
+                continue
+
+            # End event
+            text = None
+            # Tabs and breaks of a deleted run are gated like its w:delText
+            deleted = deletions and not kept_deletions
+            if tag == _T or (tag == _DEL_TEXT and kept_deletions):
+                text = elem.text
+            elif in_run and not deleted and tag == _TAB:
+                text = "\t"
+            elif in_run and not deleted and (tag == _BR or tag == _CR):
+                text = "\n"
+            elif tag == _R:
+                in_run -= 1
+            elif tag == _INS or tag == _DEL:
+                is_hidden, is_deletion, is_kept_deletion = changes.pop()
+                hidden -= is_hidden
+                deletions -= is_deletion
+                kept_deletions -= is_kept_deletion
+            elif tag == _TBL:
+                tables.pop()
+            elif tag == _P and open_paragraphs and not hidden:
+                done.append(open_paragraphs.pop())
+                if not open_paragraphs:
+                    done.sort(key=lambda paragraph: paragraph.index)
+                    yield from done
+                    done = []
+
+            if text and not hidden and open_paragraphs:
+                open_paragraphs[-1].text += text
+
+            elem.clear()
+            if body is not None and tag != _BODY and len(body):
+                # Drop finished top-level blocks so the tree does not grow
+                body.clear()
+    finally:
+        if close:
+            stream.close()
+
+
+def count_paragraphs(source, part="word/document.xml"):
+    """Count all w:p elements of a Word document part (see iter_paragraphs)."""
+    return sum(1 for _ in iter_paragraphs(source, part=part))
+
+
+def extract_text(source, include_insertions=True, include_deletions=False):
+    """
+    Return the non-empty paragraphs of document.xml joined by newlines.
+
+    Args:
+        source: As for iter_paragraphs
+        include_insertions: As for iter_paragraphs
+        include_deletions: As for iter_paragraphs
+
+    Returns:
+        str: The document text, one line per non-empty paragraph
+    """
+    return "\n".join(
+        paragraph.text
+        for paragraph in iter_paragraphs(
+            source,
+            include_insertions=include_insertions,
+            include_deletions=include_deletions,
+        )
+        if paragraph.text
+    )
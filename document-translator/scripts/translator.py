@@ -6,6 +6,7 @@ import platform
 from pathlib import Path
 import docx
 from docx.oxml.ns import qn
+from docx_text import iter_paragraphs
 from pypdf import PdfReader
 import google.generativeai as genai
 from zhipuai import ZhipuAI
@@ -33,8 +34,11 @@ class DocumentTranslator:
             with open(file_path, "r", encoding="utf-8") as f:
                 return f.read()
         elif suffix == ".docx":
-            doc = docx.Document(file_path)
-            return "\n".join([p.text for p in doc.paragraphs])
+            # Stream document.xml instead of building the whole document tree.
+            # Like python-docx's doc.paragraphs: top-level body paragraphs only
+            # (no tables or text boxes), without tracked insertions
+            paragraphs = iter_paragraphs(file_path, include_insertions=False)
+            return "\n".join([p.text for p in paragraphs if p.cell is None and p.parent is None])
         elif suffix == ".pdf":
             reader = PdfReader(file_path)
             text = ""
@@ -0,0 +1,753 @@
+#!/usr/bin/env python3
+"""
+Benchmark the unpack -> pack -> validate pipeline (and XMLEditor/Document for .docx).
+
+Generates synthetic .docx/.pptx packages of a configurable size, runs every
+stage N times, each run in a fresh process, and prints JSON with wall time,
+peak RSS and XML parse counts per stage. Save the output of two runs to
+compare the default implementation against faster modes.
+
+Example usage:
+    python ooxml/scripts/benchmark.py --paragraphs 5000 --tracked-changes 200
+    python ooxml/scripts/benchmark.py --formats pptx --slides 50 --images 10
+    python ooxml/scripts/benchmark.py --validate-jobs 4 --streaming --output fast.json
+    python ooxml/scripts/benchmark.py --formats docx --stages editor,document_save --engine lxml
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import platform
+import random
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree
+import zipfile
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import defusedxml.minidom
+import lxml.etree
+from pack import pack_document
+from unpack import DEFAULT_PRETTY_PRINT_GLOBS, unpack_document
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Skill root (the directory containing ooxml/); Document lives in scripts/ there
+SKILL_ROOT = Path(__file__).resolve().parent.parent.parent
+
+STAGES = ["unpack", "pack", "validate", "editor", "document_save"]
+FORMAT_STAGES = {
+    "docx": ["unpack", "pack", "validate", "editor", "document_save"],
+    "pptx": ["unpack", "pack", "validate"],
+}
+
+# Parse entry points counted in every stage
+PARSE_FUNCTIONS = [
+    (lxml.etree, "parse"),
+    (lxml.etree, "fromstring"),
+    (lxml.etree, "iterparse"),
+    (xml.etree.ElementTree, "parse"),
+    (xml.etree.ElementTree, "fromstring"),
+    (xml.etree.ElementTree, "iterparse"),
+    (defusedxml.minidom, "parse"),
+    (defusedxml.minidom, "parseString"),
+]
+
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua."
+)
+DELETE_MARKER = "Benchmark deletion target"
+COMMENT_MARKER = "Benchmark comment target"
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+CHANGE_DATE = "2024-01-01T00:00:00Z"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark unpack/pack/validate on synthetic Office files"
+    )
+    parser.add_argument(
+        "--formats",
+        default="docx,pptx",
+        help="Comma-separated formats to benchmark (default: docx,pptx)",
+    )
+    parser.add_argument(
+        "--stages",
+        default=",".join(STAGES),
+        help=f"Comma-separated stages to run (default: {','.join(STAGES)})",
+    )
+    parser.add_argument(
+        "-n", "--iterations", type=int, default=3, help="Runs per stage (default: 3)"
+    )
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--tracked-changes", type=int, default=100)
+    parser.add_argument("--comments", type=int, default=20)
+    parser.add_argument("--slides", type=int, default=20)
+    parser.add_argument("--images", type=int, default=5)
+    parser.add_argument(
+        "--unpack-jobs", type=int, default=1, help="Worker processes for unpack"
+    )
+    parser.add_argument(
+        "--pretty-print-all",
+        action="store_true",
+        help="Pretty-print every part when unpacking",
+    )
+    parser.add_argument(
+        "--validate-jobs", type=int, default=1, help="Worker processes for XSD checks"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true", help="Use incremental validation"
+    )
+    parser.add_argument(
+        "--streaming", action="store_true", help="Validate in streaming mode"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["minidom", "lxml"],
+        default="minidom",
+        help="XMLEditor engine for the editor and document_save stages",
+    )
+    parser.add_argument(
+        "--lookups", type=int, default=300, help="get_node calls in the editor stage"
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    for fmt in formats:
+        assert fmt in FORMAT_STAGES, f"Error: unsupported format {fmt}"
+    for stage in stages:
+        assert stage in STAGES, f"Error: unknown stage {stage}"
+    assert args.iterations >= 1, "Error: --iterations must be at least 1"
+
+    sizes = {
+        "paragraphs": args.paragraphs,
+        "tracked_changes": args.tracked_changes,
+        "comments": args.comments,
+        "slides": args.slides,
+        "images": args.images,
+    }
+    options = {
+        "unpack_jobs": args.unpack_jobs,
+        "pretty_print_all": args.pretty_print_all,
+        "validate_jobs": args.validate_jobs,
+        "incremental": args.incremental,
+        "streaming": args.streaming,
+        "engine": args.engine,
+        "lookups": args.lookups,
+    }
+
+    report = run_benchmark(formats, stages, args.iterations, sizes, options)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+def run_benchmark(formats, stages, iterations, sizes, options):
+    """Generate fixtures and run each stage of the pipeline.
+
+    Args:
+        formats: Formats to benchmark ("docx", "pptx")
+        stages: Stages to run ("unpack", "pack", "validate", "editor",
+            "document_save");
+            stages that don't apply to a format are skipped
+        iterations: Number of runs per stage, each in a fresh process
+        sizes: Fixture sizes ("paragraphs", "tracked_changes", "comments",
+            "slides", "images")
+        options: Pipeline options ("unpack_jobs", "pretty_print_all",
+            "validate_jobs", "incremental", "streaming", "engine", "lookups")
+
+    Returns:
+        dict: JSON-serializable report with "config", "fixtures" and "results"
+    """
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"iterations": iterations, "sizes": sizes, "options": options},
+        "fixtures": {},
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="ooxml_benchmark_") as work_dir:
+        for fmt in formats:
+            fixture_dir = Path(work_dir) / fmt
+            fixture_dir.mkdir()
+            source = fixture_dir / f"synthetic.{fmt}"
+            try:
+                if fmt == "docx":
+                    build_docx(source, **_pick(sizes, DOCX_SIZES))
+                else:
+                    build_pptx(source, **_pick(sizes, PPTX_SIZES))
+            except ImportError as e:
+                report["results"][fmt] = {"skipped": f"Missing dependency: {e.name}"}
+                continue
+
+            unpacked = fixture_dir / "unpacked"
+            unpack_document(source, unpacked)
+            fixture = {"format": fmt, "source": str(source), "unpacked": str(unpacked)}
+            with zipfile.ZipFile(source) as zf:
+                report["fixtures"][fmt] = {
+                    "file_bytes": source.stat().st_size,
+                    "parts": len(zf.namelist()),
+                    "uncompressed_bytes": sum(i.file_size for i in zf.infolist()),
+                }
+
+            results = report["results"][fmt] = {}
+            for stage in stages:
+                if stage not in FORMAT_STAGES[fmt]:
+                    continue
+                if stage in ("editor", "document_save") and not _document_available():
+                    results[stage] = {"skipped": "scripts/document.py not found"}
+                    continue
+                runs = [
+                    _run_isolated(stage, fixture, options) for _ in range(iterations)
+                ]
+                results[stage] = _summarize(runs)
+
+    return report
+
+
+def _run_isolated(stage, fixture, options):
+    """Run one iteration of a stage in a fresh process, so peak RSS is per stage."""
+    # Executor workers (unlike Pool workers) may start their own pools, which
+    # validation and unpack do with --jobs
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(_run_stage, stage, fixture, options).result()
+
+
+def _run_stage(stage, fixture, options):
+    """Run one iteration of a stage and return its measurements."""
+    stage_function = {
+        "unpack": _stage_unpack,
+        "pack": _stage_pack,
+        "validate": _stage_validate,
+        "editor": _stage_editor,
+        "document_save": _stage_document_save,
+    }[stage]
+
+    with tempfile.TemporaryDirectory(prefix="ooxml_stage_") as temp_dir:
+        _reset_peak_rss()
+        baseline_rss = _peak_rss_mb()
+        with _count_parses() as parses, contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            details = stage_function(fixture, options, Path(temp_dir))
+            wall = time.perf_counter() - start
+
+    result = {
+        "wall_seconds": wall,
+        "peak_rss_mb": _peak_rss_mb(),
+        "baseline_rss_mb": baseline_rss,
+        "xml_parses": sum(parses.values()),
+        "xml_parses_by_function": dict(parses),
+    }
+    result.update(details)
+    return result
+
+
+def _stage_unpack(fixture, options, temp_dir):
+    if options["pretty_print_all"]:
+        pretty_print = ["*.xml", "*.rels"]
+    else:
+        pretty_print = DEFAULT_PRETTY_PRINT_GLOBS
+    timings = unpack_document(
+        fixture["source"],
+        temp_dir / "out",
+        pretty_print=pretty_print,
+        jobs=options["unpack_jobs"],
+    )
+    return {"pretty_printed": timings["pretty_printed"]}
+
+
+def _stage_pack(fixture, options, temp_dir):
+    output = temp_dir / f"out.{fixture['format']}"
+    pack_document(fixture["unpacked"], output, validate=False)
+    return {"output_bytes": output.stat().st_size}
+
+
+def _stage_validate(fixture, options, temp_dir):
+    unpacked = Path(fixture["unpacked"])
+    original = Path(fixture["source"])
+    if fixture["format"] == "docx":
+        validators = [DOCXSchemaValidator, RedliningValidator]
+    else:
+        validators = [PPTXSchemaValidator]
+
+    valid = True
+    for V in validators:
+        if issubclass(V, BaseSchemaValidator):
+            validator = V(
+                unpacked,
+                original,
+                jobs=options["validate_jobs"],
+                incremental=options["incremental"],
+                streaming=options["streaming"],
+            )
+        else:
+            validator = V(unpacked, original)
+        if not validator.validate():
+            valid = False
+    return {"valid": valid}
+
+
+def _stage_editor(fixture, options, temp_dir):
+    sys.path.insert(0, str(SKILL_ROOT))
+    from scripts.utilities import LxmlXMLEditor, XMLEditor
+
+    editor_class = LxmlXMLEditor if options["engine"] == "lxml" else XMLEditor
+    path = Path(fixture["unpacked"]) / "word" / "document.xml"
+
+    # Paragraphs without attributes open on their own line once pretty-printed
+    text = path.read_text(encoding="utf-8")
+    para_lines = [
+        number
+        for number, line in enumerate(text.splitlines(), 1)
+        if line.strip() == "<w:p>"
+    ]
+    change_ids = re.findall(r'<w:(?:ins|del) w:id="(\d+)"', text)
+    numbers = [int(n) for n in re.findall(r"Paragraph (\d+)\. ", text)]
+    rng = random.Random(0)
+    queries = []
+    while len(queries) < options["lookups"]:
+        queries.append({"tag": "w:p", "contains": f"Paragraph {rng.choice(numbers)}. "})
+        queries.append({"tag": "w:p", "line_number": rng.choice(para_lines)})
+        if change_ids:
+            tag = rng.choice(["w:ins", "w:del"])
+            change_id = rng.choice(change_ids)
+            queries.append({"tag": tag, "attrs": {"w:id": change_id}})
+    queries = queries[: options["lookups"]]
+
+    start = time.perf_counter()
+    editor = editor_class(path)
+    loaded = time.perf_counter()
+    found = 0
+    for query in queries:
+        try:
+            editor.get_node(**query)
+            found += 1
+        except ValueError:
+            pass
+    looked_up = time.perf_counter()
+
+    return {
+        "engine": options["engine"],
+        "lookups": len(queries),
+        "found": found,
+        "load_seconds": loaded - start,
+        "lookup_seconds": looked_up - loaded,
+    }
+
+
+def _stage_document_save(fixture, options, temp_dir):
+    sys.path.insert(0, str(SKILL_ROOT))
+    from scripts.document import Document
+
+    start = time.perf_counter()
+    doc = Document(fixture["unpacked"], engine=options["engine"])
+    opened = time.perf_counter()
+
+    try:
+        editor = doc["word/document.xml"]
+        run = editor.get_node(tag="w:r", contains=DELETE_MARKER)
+        deleted = editor.suggest_deletion(run)
+        editor.insert_after(
+            deleted, "<w:ins><w:r><w:t>Benchmark insertion</w:t></w:r></w:ins>"
+        )
+        para = editor.get_node(tag="w:p", contains=COMMENT_MARKER)
+        doc.add_comment(start=para, end=para, text="Benchmark comment")
+        edited = time.perf_counter()
+
+        report = doc.save(destination=temp_dir / "saved")
+        saved = time.perf_counter()
+    finally:
+        shutil.rmtree(doc.temp_dir, ignore_errors=True)
+
+    return {
+        "open_seconds": opened - start,
+        "edit_seconds": edited - opened,
+        "save_seconds": saved - edited,
+        "serialized_parts": sum(1 for entry in report if entry["seconds"]),
+        "serialize_seconds": sum(entry["seconds"] for entry in report),
+        "bytes_written": sum(entry["bytes"] for entry in report),
+    }
+
+
+def _summarize(runs):
+    """Collapse per-iteration measurements into a stage summary."""
+    walls = [run["wall_seconds"] for run in runs]
+    rss = [run["peak_rss_mb"] for run in runs if run["peak_rss_mb"] is not None]
+    return {
+        "iterations": len(runs),
+        "wall_seconds_min": min(walls),
+        "wall_seconds_mean": sum(walls) / len(walls),
+        "wall_seconds_max": max(walls),
+        "peak_rss_mb": max(rss) if rss else None,
+        "xml_parses": runs[-1]["xml_parses"],
+        "runs": runs,
+    }
+
+
+@contextlib.contextmanager
+def _count_parses():
+    """Count calls to the XML parse entry points while the block runs."""
+    counts = Counter()
+    originals = []
+
+    def counting(function, label):
+        def wrapper(*args, **kwargs):
+            counts[label] += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    for module, name in PARSE_FUNCTIONS:
+        function = getattr(module, name)
+        originals.append((module, name, function))
+        setattr(module, name, counting(function, f"{module.__name__}.{name}"))
+    try:
+        yield counts
+    finally:
+        for module, name, function in originals:
+            setattr(module, name, function)
+
+
+def _reset_peak_rss():
+    """Restart the peak RSS of this process from its current RSS, where supported.
+
+    On Linux ru_maxrss survives exec, so a spawned worker starts with the peak
+    of the benchmark process (which built the fixtures) and would hide the
+    stage's own peak. Only Linux allows resetting it; elsewhere this does nothing.
+    """
+    with contextlib.suppress(OSError):
+        Path("/proc/self/clear_refs").write_text("5")
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process and its children, in MB."""
+    if resource is None:
+        return None
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / divisor
+    with contextlib.suppress(OSError):
+        # Unlike ru_maxrss, VmHWM starts over after _reset_peak_rss
+        status = Path("/proc/self/status").read_text()
+        match = re.search(r"^VmHWM:\s+(\d+) kB", status, re.MULTILINE)
+        if match:
+            own = int(match.group(1)) / 1024
+    return round(max(own, children), 1)
+
+
+def _document_available():
+    """Check if this skill ships the Document library (docx only)."""
+    return (SKILL_ROOT / "scripts" / "document.py").exists()
+
+
+def _pick(values, keys):
+    return {key: values[key] for key in keys}
+
+
+# ==================== Synthetic fixtures ====================
+
+DOCX_SIZES = ["paragraphs", "tracked_changes", "comments", "images"]
+COMMENT_PARTS = {
+    "comments": f"{DOC_REL}/comments",
+    "commentsExtended": "http://schemas.microsoft.com/office/2011/relationships/commentsExtended",
+    "commentsIds": "http://schemas.microsoft.com/office/2016/09/relationships/commentsIds",
+    "commentsExtensible": "http://schemas.microsoft.com/office/2018/08/relationships/commentsExtensible",
+}
+PPTX_SIZES = ["slides", "images"]
+
+
+def build_docx(path, paragraphs=2000, tracked_changes=100, comments=20, images=5):
+    """Write a synthetic .docx with text, tracked changes, comments and images.
+
+    Tracked changes are authored by "Reviewer", so a Document edit session
+    (author "Claude") passes redlining validation. Two paragraphs carry the
+    DELETE_MARKER and COMMENT_MARKER texts used by the document_save stage.
+    """
+    paragraphs = max(paragraphs, 2)
+    change_every = paragraphs // tracked_changes if tracked_changes else 0
+    comment_every = paragraphs // comments if comments else 0
+    image_every = paragraphs // images if images else 0
+
+    body = []
+    change_id = 1000
+    comment_id = 0
+    image_id = 0
+    for i in range(paragraphs):
+        content = []
+        commented = comment_every and i % comment_every == 0 and comment_id < comments
+        if commented:
+            content.append(f'<w:commentRangeStart w:id="{comment_id}"/>')
+
+        if i == paragraphs // 3:
+            text = DELETE_MARKER
+        elif i == 2 * paragraphs // 3:
+            text = COMMENT_MARKER
+        else:
+            text = f"Paragraph {i + 1}. {LOREM}"
+        content.append(f"<w:r><w:t>{text}</w:t></w:r>")
+
+        if (
+            change_every
+            and i % change_every == 0
+            and change_id - 1000 < tracked_changes
+        ):
+            if change_id % 2:
+                content.append(
+                    f'<w:del w:id="{change_id}" w:author="Reviewer" w:date="{CHANGE_DATE}">'
+                    f'<w:r><w:delText xml:space="preserve"> removed words</w:delText></w:r></w:del>'
+                )
+            else:
+                content.append(
+                    f'<w:ins w:id="{change_id}" w:author="Reviewer" w:date="{CHANGE_DATE}">'
+                    f'<w:r><w:t xml:space="preserve"> added words</w:t></w:r></w:ins>'
+                )
+            change_id += 1
+
+        if commented:
+            content.append(f'<w:commentRangeEnd w:id="{comment_id}"/>')
+            content.append(f'<w:r><w:commentReference w:id="{comment_id}"/></w:r>')
+            comment_id += 1
+        body.append(f"<w:p>{''.join(content)}</w:p>")
+
+        if image_every and i % image_every == image_every - 1 and image_id < images:
+            image_id += 1
+            body.append(_docx_image_paragraph(image_id))
+
+    document_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}" '
+        'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" '
+        'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+        'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+        f"<w:body>{''.join(body)}"
+        '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+        '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" '
+        'w:header="720" w:footer="720" w:gutter="0"/></w:sectPr>'
+        "</w:body></w:document>"
+    )
+
+    relationships = [
+        ("rId1", f"{DOC_REL}/styles", "styles.xml"),
+        ("rId2", f"{DOC_REL}/settings", "settings.xml"),
+    ]
+    overrides = [
+        ("/word/document.xml", "document.main"),
+        ("/word/styles.xml", "styles"),
+        ("/word/settings.xml", "settings"),
+    ]
+    parts = {
+        "word/document.xml": document_xml,
+        "word/styles.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<w:styles xmlns:w="{W_NS}"><w:docDefaults/></w:styles>'
+        ),
+        "word/settings.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<w:settings xmlns:w="{W_NS}"><w:defaultTabStop w:val="720"/>'
+            "<w:compat/></w:settings>"
+        ),
+    }
+
+    if comment_id:
+        # Word always writes the three extension parts alongside comments.xml
+        for n, (name, rel_type) in enumerate(COMMENT_PARTS.items(), start=3):
+            relationships.append((f"rId{n}", rel_type, f"{name}.xml"))
+            overrides.append((f"/word/{name}.xml", name))
+        parts.update(_docx_comment_parts(comment_id))
+
+    for n in range(1, image_id + 1):
+        relationships.append(
+            (f"rIdImage{n}", f"{DOC_REL}/image", f"media/image{n}.png")
+        )
+
+    parts["word/_rels/document.xml.rels"] = _relationships_xml(relationships)
+    parts["_rels/.rels"] = _relationships_xml(
+        [("rId1", f"{DOC_REL}/officeDocument", "word/document.xml")]
+    )
+    parts["[Content_Types].xml"] = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Default Extension="png" ContentType="image/png"/>'
+        + "".join(
+            f'<Override PartName="{name}" ContentType="application/'
+            f'vnd.openxmlformats-officedocument.wordprocessingml.{kind}+xml"/>'
+            for name, kind in overrides
+        )
+        + "</Types>"
+    )
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", parts.pop("[Content_Types].xml"))
+        for name, content in parts.items():
+            zf.writestr(name, content)
+        for n in range(1, image_id + 1):
+            zf.writestr(f"word/media/image{n}.png", _png_bytes(seed=n))
+
+
+def build_pptx(path, slides=20, images=5):
+    """Write a synthetic .pptx from python-pptx's default template.
+
+    Raises:
+        ImportError: If python-pptx is not installed
+    """
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    layout = prs.slide_layouts[1]  # Title and Content
+    for i in range(max(slides, 1)):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = f"Slide {i + 1}"
+        text_frame = slide.placeholders[1].text_frame
+        text_frame.text = LOREM
+        for j in range(4):
+            text_frame.add_paragraph().text = f"Point {j + 1} on slide {i + 1}"
+
+    for n in range(images):
+        slide = prs.slides[n % len(prs.slides)]
+        slide.shapes.add_picture(
+            io.BytesIO(_png_bytes(seed=n + 1)),
+            Inches(6),
+            Inches(4.5),
+            Inches(2),
+            Inches(2),
+        )
+    prs.save(str(path))
+
+
+def _docx_image_paragraph(n):
+    """A paragraph with an inline picture referencing rIdImage{n}."""
+    size = 1828800  # 2 inches in EMU
+    return (
+        "<w:p><w:r><w:drawing>"
+        '<wp:inline distT="0" distB="0" distL="0" distR="0">'
+        f'<wp:extent cx="{size}" cy="{size}"/>'
+        f'<wp:docPr id="{n}" name="Picture {n}"/>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+        f'<pic:pic><pic:nvPicPr><pic:cNvPr id="{n}" name="image{n}.png"/><pic:cNvPicPr/></pic:nvPicPr>'
+        f'<pic:blipFill><a:blip r:embed="rIdImage{n}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+        f'<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{size}" cy="{size}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr></pic:pic>'
+        "</a:graphicData></a:graphic></wp:inline>"
+        "</w:drawing></w:r></w:p>"
+    )
+
+
+def _docx_comment_parts(count):
+    """comments.xml and its three extension parts for count comments."""
+    ids = [(f"{0x10000000 + i:08X}", f"{0x20000000 + i:08X}") for i in range(count)]
+    prolog = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    namespaces = (
+        f'xmlns:w="{W_NS}" '
+        'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+        'xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml" '
+        'xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml" '
+        'xmlns:w16cid="http://schemas.microsoft.com/office/word/2016/wordml/cid" '
+        'xmlns:w16cex="http://schemas.microsoft.com/office/word/2018/wordml/cex" '
+        'mc:Ignorable="w14 w15 w16cid w16cex"'
+    )
+    comments = "".join(
+        f'<w:comment w:id="{i}" w:author="Reviewer" w:date="{CHANGE_DATE}" w:initials="R">'
+        f'<w:p w14:paraId="{para_id}" w14:textId="77777777">'
+        f"<w:r><w:t>Reviewer comment {i + 1}</w:t></w:r></w:p></w:comment>"
+        for i, (para_id, _) in enumerate(ids)
+    )
+    extended = "".join(
+        f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>' for para_id, _ in ids
+    )
+    comment_ids = "".join(
+        f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+        for para_id, durable_id in ids
+    )
+    extensible = "".join(
+        f'<w16cex:commentExtensible w16cex:durableId="{durable_id}" '
+        f'w16cex:dateUtc="{CHANGE_DATE}"/>'
+        for _, durable_id in ids
+    )
+    return {
+        "word/comments.xml": f"{prolog}<w:comments {namespaces}>{comments}</w:comments>",
+        "word/commentsExtended.xml": (
+            f"{prolog}<w15:commentsEx {namespaces}>{extended}</w15:commentsEx>"
+        ),
+        "word/commentsIds.xml": (
+            f"{prolog}<w16cid:commentsIds {namespaces}>"
+            f"{comment_ids}</w16cid:commentsIds>"
+        ),
+        "word/commentsExtensible.xml": (
+            f"{prolog}<w16cex:commentsExtensible {namespaces}>"
+            f"{extensible}</w16cex:commentsExtensible>"
+        ),
+    }
+
+
+def _relationships_xml(relationships):
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{REL_NS}">'
+        + "".join(
+            f'<Relationship Id="{rid}" Type="{rel_type}" Target="{target}"/>'
+            for rid, rel_type, target in relationships
+        )
+        + "</Relationships>"
+    )
+
+
+def _png_bytes(seed, width=256, height=256):
+    """A noisy RGB PNG (incompressible, like a photo) without needing Pillow."""
+    rng = random.Random(seed)
+    rows = b"".join(b"\x00" + rng.randbytes(width * 3) for _ in range(height))
+
+    def chunk(kind, data):
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+        )
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+if __name__ == "__main__":
+    main()
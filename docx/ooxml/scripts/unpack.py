@@ -1,29 +1,172 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir> [--pretty-print GLOB ...] [--jobs N]
+"""
+
+import argparse
+import fnmatch
 import random
-import sys
-import defusedxml.minidom
+import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
+import defusedxml.minidom
+
+# Parts that are pretty-printed by default: the main story parts, comments and
+# the package metadata that editing scripts touch. Everything else (styles,
+# themes, chart caches, customXml, media) is extracted as-is.
+DEFAULT_PRETTY_PRINT_GLOBS = (
+    "[Content_Types].xml",
+    "*.rels",
+    # Word
+    "word/document.xml",
+    "word/footnotes.xml",
+    "word/endnotes.xml",
+    "word/header*.xml",
+    "word/footer*.xml",
+    "word/comments*.xml",
+    "word/people.xml",
+    "word/settings.xml",
+    # PowerPoint
+    "ppt/presentation.xml",
+    "ppt/slides/*.xml",
+    "ppt/notesSlides/*.xml",
+    "ppt/comments/*.xml",
+    # Excel
+    "xl/workbook.xml",
+    "xl/worksheets/*.xml",
+    "xl/sharedStrings.xml",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack an Office file")
+    parser.add_argument("input_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--pretty-print",
+        action="append",
+        metavar="GLOB",
+        help="Pretty-print only parts matching GLOB (repeatable; default: main story parts)",
+    )
+    parser.add_argument(
+        "--pretty-print-all",
+        action="store_true",
+        help="Pretty-print every .xml and .rels part",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for pretty-printing (default: 1)",
+    )
+    parser.add_argument(
+        "--timing", action="store_true", help="Print time spent in each phase"
+    )
+    args = parser.parse_args()
+
+    if args.pretty_print_all:
+        pretty_print = ["*.xml", "*.rels"]
+    else:
+        pretty_print = args.pretty_print or DEFAULT_PRETTY_PRINT_GLOBS
+
+    timings = unpack_document(
+        args.input_file, args.output_dir, pretty_print=pretty_print, jobs=args.jobs
+    )
+
+    if args.timing:
+        print(
+            f"Extracted {timings['parts']} parts in {timings['extract_seconds']:.2f}s"
+        )
+        print(
+            f"Pretty-printed {timings['pretty_printed']} of {timings['xml_parts']} "
+            f"XML parts in {timings['pretty_print_seconds']:.2f}s"
+        )
+        print(f"Total: {timings['total_seconds']:.2f}s")
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
 
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
+def unpack_document(
+    input_file, output_dir, pretty_print=DEFAULT_PRETTY_PRINT_GLOBS, jobs=1
+):
+    """Extract an Office file and pretty-print selected XML parts.
 
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
+    Binary parts are copied straight from the archive without being decoded.
+    XML parts matching one of the pretty_print globs are re-indented so they
+    can be read and edited line by line; other XML parts are left as stored.
+
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to extract into (created if needed)
+        pretty_print: Glob patterns matched against part names such as
+            "word/document.xml" ("*" also matches "/"). Pass ["*.xml", "*.rels"]
+            to pretty-print everything, or [] for none.
+        jobs: Number of worker processes used for pretty-printing (1 = serial)
+
+    Returns:
+        dict: Part counts and seconds spent per phase ("extract_seconds",
+              "pretty_print_seconds", "total_seconds")
+    """
+    start = time.perf_counter()
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Extract everything
+    with zipfile.ZipFile(input_file) as zf:
+        part_names = [name for name in zf.namelist() if not name.endswith("/")]
+        zf.extractall(output_path)
+    extracted = time.perf_counter()
+
+    # Pretty print the selected XML files
+    xml_parts = [
+        name for name in part_names if name.lower().endswith((".xml", ".rels"))
+    ]
+    selected = [
+        output_path / name for name in xml_parts if _matches_any(name, pretty_print)
+    ]
+    if jobs > 1 and len(selected) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(selected) // (jobs * 4))
+            list(executor.map(pretty_print_xml, selected, chunksize=chunksize))
+    else:
+        for xml_file in selected:
+            pretty_print_xml(xml_file)
+    finished = time.perf_counter()
+
+    return {
+        "parts": len(part_names),
+        "xml_parts": len(xml_parts),
+        "pretty_printed": len(selected),
+        "extract_seconds": extracted - start,
+        "pretty_print_seconds": finished - extracted,
+        "total_seconds": finished - start,
+    }
+
+
+def pretty_print_xml(xml_file):
+    """Re-indent an XML file in place (ASCII output with character references)."""
+    xml_file = Path(xml_file)
     content = xml_file.read_text(encoding="utf-8")
     dom = defusedxml.minidom.parseString(content)
     xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
 
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+def _matches_any(part_name, patterns):
+    """Check if a part name matches any glob pattern (or equals it literally)."""
+    return any(
+        part_name == pattern or fnmatch.fnmatchcase(part_name, pattern)
+        for pattern in patterns
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Process-wide registry of compiled XSD schemas.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import lxml.etree
+
+
+class _SchemaEntry:
+    """A compiled schema (or the error raised while compiling it) and its lock."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.schema = None
+        self.error = None
+        self.compile_time = 0.0
+        self.validate_time = 0.0
+        self.validate_count = 0
+
+
+class SchemaRegistry:
+    """Compiles each XSD schema once per process and reuses it for every validation.
+
+    Schemas are keyed by resolved path and compiled lazily on first use.
+    Compilation and validation are thread-safe: each schema has its own lock,
+    so different schemas can be compiled and used concurrently while a single
+    lxml XMLSchema (whose error_log is shared state) is used by one thread at
+    a time.
+
+    Example:
+        registry = SchemaRegistry()
+        registry.warm_up([schemas_dir / "ISO-IEC29500-4_2016/wml.xsd"])
+        is_valid, errors = registry.validate(schema_path, xml_doc)
+        print(registry.stats())
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, schema_path):
+        """Get or create the entry for a schema path."""
+        key = Path(schema_path).resolve()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _SchemaEntry()
+        return entry, key
+
+    def _compile(self, entry, key):
+        """Compile the schema for an entry if needed. Caller must hold entry.lock."""
+        if entry.schema is None and entry.error is None:
+            start = time.perf_counter()
+            try:
+                with open(key, "rb") as xsd_file:
+                    parser = lxml.etree.XMLParser()
+                    xsd_doc = lxml.etree.parse(
+                        xsd_file, parser=parser, base_url=str(key)
+                    )
+                    entry.schema = lxml.etree.XMLSchema(xsd_doc)
+            except Exception as e:
+                entry.error = e
+            entry.compile_time = time.perf_counter() - start
+
+        if entry.error is not None:
+            raise entry.error
+        return entry.schema
+
+    def get(self, schema_path):
+        """Return the compiled lxml.etree.XMLSchema for a schema path.
+
+        Raises:
+            Exception: The error raised while loading or compiling the schema
+        """
+        entry, key = self._entry(schema_path)
+        with entry.lock:
+            return self._compile(entry, key)
+
+    def validate(self, schema_path, xml_doc):
+        """Validate a parsed document against a schema.
+
+        Args:
+            schema_path: Path to the XSD schema
+            xml_doc: lxml ElementTree to validate
+
+        Returns:
+            tuple: (is_valid, error_messages) where error_messages is a list of str
+        """
+        entry, key = self._entry(schema_path)
+        with entry.lock:
+            schema = self._compile(entry, key)
+            start = time.perf_counter()
+            is_valid = schema.validate(xml_doc)
+            errors = [] if is_valid else [error.message for error in schema.error_log]
+            entry.validate_time += time.perf_counter() - start
+            entry.validate_count += 1
+        return is_valid, errors
+
+    def warm_up(self, schema_paths):
+        """Compile a set of schemas ahead of time.
+
+        Schemas that fail to compile are skipped here; the error is raised
+        again when the schema is used.
+
+        Returns:
+            float: Total compile time in seconds for the given schemas
+        """
+        schema_paths = list(schema_paths)
+        for schema_path in schema_paths:
+            try:
+                self.get(schema_path)
+            except Exception:
+                pass
+        with self._lock:
+            keys = {Path(p).resolve() for p in schema_paths}
+            return sum(
+                entry.compile_time
+                for key, entry in self._entries.items()
+                if key in keys
+            )
+
+    def stats(self):
+        """Return compile and validation timings.
+
+        Returns:
+            dict: Totals ("schemas", "compile_seconds", "validate_seconds",
+                  "validations") plus a "per_schema" dict keyed by schema path
+        """
+        with self._lock:
+            entries = dict(self._entries)
+
+        per_schema = {
+            str(key): {
+                "compiled": entry.schema is not None,
+                "compile_seconds": entry.compile_time,
+                "validate_seconds": entry.validate_time,
+                "validations": entry.validate_count,
+            }
+            for key, entry in entries.items()
+        }
+        return {
+            "schemas": sum(1 for entry in entries.values() if entry.schema is not None),
+            "compile_seconds": sum(e.compile_time for e in entries.values()),
+            "validate_seconds": sum(e.validate_time for e in entries.values()),
+            "validations": sum(e.validate_count for e in entries.values()),
+            "per_schema": per_schema,
+        }
+
+    def clear(self):
+        """Drop all compiled schemas."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by all validators in this process
+SCHEMA_REGISTRY = SchemaRegistry()
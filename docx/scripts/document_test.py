@@ -0,0 +1,335 @@
+import contextlib
+import io
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+
+from scripts.document import Document
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+PKG_NS = "http://schemas.openxmlformats.org/package/2006"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+WML = "application/vnd.openxmlformats-officedocument.wordprocessingml"
+
+PACKAGE = {
+    "[Content_Types].xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="{PKG_NS}/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml" ContentType="{WML}.document.main+xml"/>
+  <Override PartName="/word/settings.xml" ContentType="{WML}.settings+xml"/>
+</Types>
+""",
+    "_rels/.rels": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="{PKG_NS}/relationships">
+  <Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="word/document.xml"/>
+</Relationships>
+""",
+    "word/_rels/document.xml.rels": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="{PKG_NS}/relationships">
+  <Relationship Id="rId1" Type="{REL_NS}/settings" Target="settings.xml"/>
+</Relationships>
+""",
+    "word/settings.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings xmlns:w="{W_NS}">
+  <w:defaultTabStop w:val="720"/>
+</w:settings>
+""",
+    "word/document.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}">
+  <w:body>
+    <w:p>
+      <w:r>
+        <w:t>First paragraph</w:t>
+      </w:r>
+    </w:p>
+    <w:p>
+      <w:r>
+        <w:t>Second paragraph</w:t>
+      </w:r>
+    </w:p>
+  </w:body>
+</w:document>
+""",
+}
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the docx directory: python -m unittest scripts.document_test
+class DocumentTestCase(unittest.TestCase):
+    """Builds a minimal unpacked .docx in a temporary directory."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def package(self, name="unpacked"):
+        """Write the minimal package to a new directory and return its path."""
+        unpacked = self.tmp / name
+        for part, content in PACKAGE.items():
+            path = unpacked / part
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        return unpacked
+
+    def quietly(self, function, *args, **kwargs):
+        """Call function without its progress output."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            return function(*args, **kwargs)
+
+    def open(self, unpacked, **kwargs):
+        return self.quietly(Document, unpacked, **kwargs)
+
+
+def elements(path, name):
+    """Attributes (by local name) of every element with a local name in an XML file."""
+    return [
+        {key.split("}")[-1]: value for key, value in elem.attrib.items()}
+        for elem in ET.parse(path).iter()
+        if elem.tag.split("}")[-1] == name
+    ]
+
+
+class TestSaveInPlace(DocumentTestCase):
+    def test_validation_baseline_is_taken_before_saving_in_place(self):
+        for engine in ("minidom", "lxml"):
+            doc = self.open(self.package(engine), engine=engine)
+            editor = doc["word/document.xml"]
+            editor.suggest_deletion(editor.get_node(tag="w:r", contains="First"))
+            editor.append_to(editor.get_node(tag="w:body"), "<w:bogus/>")
+            self.quietly(doc.save, validate=False)
+
+            with zipfile.ZipFile(doc.original_docx) as original:
+                baseline = original.read("word/document.xml").decode()
+            self.assertNotIn("Claude", baseline, engine)
+            self.assertNotIn("bogus", baseline, engine)
+
+            # The schema error is new, not a pre-existing one of the original
+            with self.assertRaises(ValueError, msg=engine):
+                self.quietly(doc.validate)
+
+
+class TestAddComments(DocumentTestCase):
+    def test_batch_round_trip(self):
+        for engine in ("minidom", "lxml"):
+            unpacked = self.package(engine)
+            doc = self.open(unpacked, engine=engine)
+            # A comment without ranges in document.xml cannot be replied to
+            orphan = doc._comments.add("No ranges", doc.author, doc.initials)["id"]
+            editor = doc["word/document.xml"]
+            first = editor.get_node(tag="w:r", contains="First")
+            second = editor.get_node(tag="w:p", contains="Second")
+            base = doc.next_comment_id
+            results = doc.add_comments(
+                [
+                    {"start": first, "end": first, "text": "On a run"},
+                    {"parent": base, "text": "Reply"},
+                    {"start": second, "end": second, "text": "On a paragraph"},
+                    {"parent": base + 1, "text": "Reply to a reply"},
+                    {"parent": orphan, "text": "Reply to the orphan"},
+                    {"parent": base + 4, "text": "Reply to a failed reply"},
+                ]
+            )
+            ids = [result["id"] for result in results]
+            self.assertEqual(ids, [base, base + 1, base + 2, base + 3, None, None])
+            self.assertIn("Node not found", results[4]["error"])
+            self.assertEqual(
+                results[5]["error"], f"parent comment id={base + 4} was not added"
+            )
+            before = {
+                comment_id: dict(comment)
+                for comment_id, comment in doc.existing_comments.items()
+            }
+            self.quietly(doc.save, validate=False)
+
+            # The reloaded store sees the same comments across the four parts
+            after = self.open(unpacked, engine=engine).existing_comments
+            self.assertEqual(after, before, engine)
+            self.assertEqual(set(after), {orphan, base, base + 1, base + 2, base + 3})
+            para_ids = {comment["para_id"] for comment in after.values()}
+            durable_ids = {comment["durable_id"] for comment in after.values()}
+            self.assertEqual(len(para_ids), len(after))
+            self.assertEqual(len(durable_ids), len(after))
+            self.assertEqual(after[base + 1]["parent_para_id"], after[base]["para_id"])
+            self.assertEqual(
+                after[base + 3]["parent_para_id"], after[base + 1]["para_id"]
+            )
+            self.assertIsNone(after[base]["parent_para_id"])
+            self.assertIsNone(after[base + 2]["parent_para_id"])
+
+            word = unpacked / "word"
+            comment_ex = elements(word / "commentsExtended.xml", "commentEx")
+            self.assertEqual({elem["paraId"] for elem in comment_ex}, para_ids)
+            comment_ids = elements(word / "commentsIds.xml", "commentId")
+            self.assertEqual(
+                {elem["paraId"]: elem["durableId"] for elem in comment_ids},
+                {c["para_id"]: c["durable_id"] for c in after.values()},
+            )
+            extensible = elements(word / "commentsExtensible.xml", "commentExtensible")
+            self.assertEqual({elem["durableId"] for elem in extensible}, durable_ids)
+
+            # Ranges are in document.xml for every comment but the orphan
+            document_xml = word / "document.xml"
+            anchored = {str(i) for i in (base, base + 1, base + 2, base + 3)}
+            for name in ("commentRangeStart", "commentRangeEnd", "commentReference"):
+                found = [elem["id"] for elem in elements(document_xml, name)]
+                self.assertEqual(sorted(found), sorted(anchored), (engine, name))
+
+
+class TestApplyEdits(DocumentTestCase):
+    def editors(self):
+        """Yield the document.xml editor of a fresh package for each engine."""
+        for engine in ("minidom", "lxml"):
+            yield self.open(self.package(engine), engine=engine)["word/document.xml"]
+
+    def layout(self, editor, elem=None):
+        """(tag, text) of the children of an element (default: the body)."""
+        if elem is None:
+            elem = editor.get_node(tag="w:body")
+        return [
+            (editor._tag(child), editor._get_element_text(child))
+            for child in editor._children(elem)
+        ]
+
+    def test_edits_apply_bottom_up(self):
+        for editor in self.editors():
+            # Record the order the edits are applied in
+            applied = []
+            place_nodes, suggest_deletion = editor._place_nodes, editor.suggest_deletion
+
+            def record_place_nodes(operation, elem, nodes):
+                applied.append((operation, editor._get_element_text(elem)))
+                return place_nodes(operation, elem, nodes)
+
+            def record_suggest_deletion(elem):
+                applied.append(("suggest_deletion", editor._get_element_text(elem)))
+                return suggest_deletion(elem)
+
+            editor._place_nodes = record_place_nodes
+            editor.suggest_deletion = record_suggest_deletion
+
+            first = {"tag": "w:p", "contains": "First"}
+            results = editor.apply_edits(
+                [
+                    (first, "insert_before", "<w:p><w:r><w:t>Top</w:t></w:r></w:p>"),
+                    ({"tag": "w:r", "contains": "First"}, "suggest_deletion", None),
+                    (first, "append_to", "<w:r><w:t> end</w:t></w:r>"),
+                    (
+                        {"tag": "w:p", "contains": "Second"},
+                        "insert_after",
+                        "<w:p><w:r><w:t>Bottom</w:t></w:r></w:p>",
+                    ),
+                ]
+            )
+            # Last position first, inner elements before the element itself,
+            # and edits on the same element in the order given
+            self.assertEqual(
+                applied,
+                [
+                    ("insert_after", "Second paragraph"),
+                    ("suggest_deletion", "First paragraph"),
+                    ("insert_before", "First paragraph"),
+                    ("append_to", "First paragraph"),
+                ],
+            )
+            # Locators were resolved before the deletion changed the paragraph
+            self.assertEqual([result["error"] for result in results], [None] * 4)
+            self.assertEqual(
+                self.layout(editor),
+                [
+                    ("w:p", "Top"),
+                    ("w:p", "First paragraph end"),
+                    ("w:p", "Second paragraph"),
+                    ("w:p", "Bottom"),
+                ],
+            )
+            paragraph = results[2]["target"]
+            self.assertEqual(
+                [tag for tag, _ in self.layout(editor, paragraph)], ["w:del", "w:r"]
+            )
+
+    def test_same_target_keeps_call_order(self):
+        for editor in self.editors():
+            second = {"tag": "w:p", "contains": "Second"}
+            editor.apply_edits(
+                [
+                    (second, "insert_after", "<w:p><w:r><w:t>A</w:t></w:r></w:p>"),
+                    (second, "insert_after", "<w:p><w:r><w:t>B</w:t></w:r></w:p>"),
+                    (second, "insert_before", "<w:p><w:r><w:t>C</w:t></w:r></w:p>"),
+                    (second, "insert_before", "<w:p><w:r><w:t>D</w:t></w:r></w:p>"),
+                ]
+            )
+            # Like consecutive insert_after calls on the same node: last is first
+            self.assertEqual(
+                [text for _, text in self.layout(editor)],
+                ["First paragraph", "C", "D", "Second paragraph", "B", "A"],
+            )
+
+    def test_insertion_after_deleted_run_goes_next_to_its_deletion(self):
+        for editor in self.editors():
+            run = {"tag": "w:r", "contains": "First"}
+            results = editor.apply_edits(
+                [
+                    (run, "suggest_deletion", None),
+                    (run, "insert_after", "<w:ins><w:r><w:t>New</w:t></w:r></w:ins>"),
+                    (run, "insert_before", "<w:r><w:t>Before </w:t></w:r>"),
+                ]
+            )
+            paragraph = editor.get_node(tag="w:p", contains="New")
+            self.assertEqual(
+                self.layout(editor, paragraph),
+                [("w:r", "Before "), ("w:del", "First paragraph"), ("w:ins", "New")],
+            )
+            self.assertEqual(results[0]["result"], editor._parent(results[0]["target"]))
+
+    def test_rejects_targets_inside_replaced_element(self):
+        for editor in self.editors():
+            before = self.layout(editor)
+            for locator in (
+                {"tag": "w:t", "contains": "First"},
+                {"tag": "w:p", "contains": "First"},
+            ):
+                with self.assertRaisesRegex(ValueError, "removed by a replace_node"):
+                    editor.apply_edits(
+                        [
+                            (
+                                {"tag": "w:p", "contains": "Second"},
+                                "insert_after",
+                                "<w:p><w:r><w:t>Kept out</w:t></w:r></w:p>",
+                            ),
+                            (
+                                {"tag": "w:p", "contains": "First"},
+                                "replace_node",
+                                "<w:p><w:r><w:t>Replaced</w:t></w:r></w:p>",
+                            ),
+                            (locator, "suggest_deletion", None),
+                        ]
+                    )
+            # Nothing was applied, not even the unrelated edit
+            self.assertEqual(self.layout(editor), before)
+            self.assertFalse(editor.dirty)
+
+
+class TestSaveDirectEdits(DocumentTestCase):
+    def test_direct_attribute_edit_is_saved(self):
+        for engine in ("minidom", "lxml"):
+            unpacked = self.package(engine)
+            doc = self.open(unpacked, engine=engine)
+            paragraph = doc["word/document.xml"].get_node(tag="w:p", contains="Second")
+            # No reindex(): the editor does not know about the change
+            if engine == "minidom":
+                paragraph.setAttribute("w:rsidR", "00ABCDEF")
+            else:
+                paragraph.set(f"{{{W_NS}}}rsidR", "00ABCDEF")
+            report = self.quietly(doc.save, validate=False)
+
+            self.assertIn("word/document.xml", [entry["part"] for entry in report])
+            saved = (unpacked / "word" / "document.xml").read_text(encoding="utf-8")
+            self.assertIn('w:rsidR="00ABCDEF"', saved, engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
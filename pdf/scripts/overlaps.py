@@ -0,0 +1,117 @@
+"""
+Find intersecting rectangles without comparing every pair.
+
+Rectangles are bucketed into a uniform grid whose cells are about the size of a
+typical rectangle, and only rectangles that share a cell are compared.
+Rectangles that would cover many cells (backgrounds, page-wide boxes) are kept
+out of the grid and compared with all others directly. Each intersecting pair
+is reported once, from the cell holding the top-left corner of the
+intersection.
+
+The result is a superset of any stricter overlap test: touching rectangles
+count as intersecting, so callers apply their own test (tolerance, strict
+inequality, ...) to the pairs returned. Only the standard library is used so
+the module can be copied into other skills as-is.
+
+Usage:
+    from overlaps import intersecting_pairs
+
+    for i, j in intersecting_pairs([(0, 0, 2, 2), (1, 1, 3, 3), (5, 5, 6, 6)]):
+        print(i, j)  # 0 1
+"""
+
+import math
+from typing import List, Sequence, Tuple
+
+# Below this many rectangles, comparing every pair is faster than bucketing
+_BRUTE_FORCE_LIMIT = 32
+
+# Rectangles covering more grid cells than this are compared with all others
+_MAX_CELLS_PER_BOX = 64
+
+
+def _normalize(box: Sequence[float]) -> Tuple[float, float, float, float]:
+    x0, y0, x1, y1 = box[:4]
+    return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+
+
+def _intersect(a, b) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def intersecting_pairs(boxes: Sequence[Sequence[float]]) -> List[Tuple[int, int]]:
+    """
+    Return the pairs of rectangles that intersect or touch.
+
+    Args:
+        boxes: Rectangles as (x0, y0, x1, y1); the corners may be given in
+               either order
+
+    Returns:
+        list: Pairs (i, j) of indexes into boxes with i < j, sorted
+    """
+    rects = [_normalize(box) for box in boxes]
+    n = len(rects)
+
+    if n <= _BRUTE_FORCE_LIMIT:
+        return [
+            (i, j)
+            for i in range(n)
+            for j in range(i + 1, n)
+            if _intersect(rects[i], rects[j])
+        ]
+
+    # Cells about the size of the median rectangle, but never so small that a
+    # scatter of tiny rectangles gets one cell each over a huge area
+    origin_x = min(r[0] for r in rects)
+    origin_y = min(r[1] for r in rects)
+    extent = max(
+        max(r[2] for r in rects) - origin_x, max(r[3] for r in rects) - origin_y
+    )
+    sizes = sorted(max(r[2] - r[0], r[3] - r[1]) for r in rects)
+    cell = max(sizes[n // 2], extent / math.sqrt(n))
+    if not cell > 0:
+        cell = 1.0
+
+    grid = {}
+    spans = [None] * n
+    large = []
+    for i, (x0, y0, x1, y1) in enumerate(rects):
+        col0 = int((x0 - origin_x) // cell)
+        row0 = int((y0 - origin_y) // cell)
+        col1 = int((x1 - origin_x) // cell)
+        row1 = int((y1 - origin_y) // cell)
+        if (col1 - col0 + 1) * (row1 - row0 + 1) > _MAX_CELLS_PER_BOX:
+            large.append(i)
+            continue
+        spans[i] = (col0, row0)
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                grid.setdefault((col, row), []).append(i)
+
+    pairs = []
+    for (col, row), members in grid.items():
+        for a, i in enumerate(members):
+            ri = rects[i]
+            col_i, row_i = spans[i]
+            for j in members[a + 1 :]:
+                col_j, row_j = spans[j]
+                # Only the cell of the intersection's top-left corner reports
+                if (
+                    max(col_i, col_j) == col
+                    and max(row_i, row_j) == row
+                    and _intersect(ri, rects[j])
+                ):
+                    pairs.append((i, j) if i < j else (j, i))
+
+    for i in large:
+        ri = rects[i]
+        for j in range(n):
+            # Pairs of two large rectangles are reported by the first one
+            if spans[j] is None and j <= i:
+                continue
+            if _intersect(ri, rects[j]):
+                pairs.append((i, j) if i < j else (j, i))
+
+    pairs.sort()
+    return pairs
@@ -0,0 +1,189 @@
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import lxml.etree
+from PIL import Image, ImageDraw
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches
+
+from inventory import (
+    extract_text_inventory,
+    get_font_catalog,
+    get_text_measurer,
+    load_font,
+)
+
+LONG_TEXT = " ".join(["Revenue grew in every region this quarter."] * 6)
+
+
+def build_presentation(path):
+    """Save a one-slide deck whose runs and paragraphs have varied formatting.
+
+    The shapes are, top to bottom: the title (shape-0), the body placeholder
+    (shape-1), a text box with colored runs (shape-2) and a small text box
+    whose text overflows it (shape-3).
+    """
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = "Quarterly results"
+    slide.placeholders[1].text_frame.text = "Revenue grew\nCosts fell"
+
+    frame = slide.shapes.add_textbox(
+        Inches(1), Inches(4.5), Inches(4), Inches(2)
+    ).text_frame
+    run = frame.paragraphs[0].add_run()
+    run.text = "Red"
+    run.font.color.rgb = RGBColor(0xFF, 0x00, 0x00)
+    paragraph = frame.add_paragraph()
+    paragraph.alignment = PP_ALIGN.CENTER
+    run = paragraph.add_run()
+    run.text = "Accent"
+    run.font.color.theme_color = MSO_THEME_COLOR.ACCENT_1
+    run = frame.add_paragraph().add_run()
+    run.text = "Bold"
+    run.font.bold = True
+    frame.add_paragraph().text = "Plain"
+
+    box = slide.shapes.add_textbox(Inches(6), Inches(6), Inches(2), Inches(0.8))
+    box.text_frame.text = LONG_TEXT
+    prs.save(path)
+
+
+def wrap_by_prefixes(line, max_width, draw, font):
+    """The reference: the old wrapper, which measures every candidate line."""
+    if not line:
+        return [""]
+
+    if draw.textlength(line, font=font) <= max_width:
+        return [line]
+
+    wrapped = []
+    current_line = ""
+    for word in line.split(" "):
+        test_line = current_line + (" " if current_line else "") + word
+        if draw.textlength(test_line, font=font) <= max_width:
+            current_line = test_line
+        else:
+            if current_line:
+                wrapped.append(current_line)
+            current_line = word
+
+    if current_line:
+        wrapped.append(current_line)
+    return wrapped
+
+
+def random_line(rng):
+    """Words of letters, accents, CJK and punctuation, with repeated spaces."""
+    alphabet = "abcdefghijklmnopqrstuvwxyzAVWTLYfi.,;'-éüßçØ漢字かな"
+    words = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        for _ in range(rng.randint(1, 30))
+    ]
+    return " ".join(words).strip(" ") if rng.random() < 0.5 else " ".join(words)
+
+
+def slide_xml(prs):
+    return [lxml.etree.tostring(slide._element) for slide in prs.slides]
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the scripts directory: python -m unittest inventory_test
+class InventoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = self.tmp / "deck.pptx"
+        build_presentation(self.path)
+        self.prs = Presentation(str(self.path))
+
+
+class TestExtractTextInventory(InventoryTestCase):
+    def test_slide_xml_is_unchanged(self):
+        before = slide_xml(self.prs)
+        inventory = extract_text_inventory(self.path, self.prs)
+        for shapes in inventory.values():
+            for shape in shapes.values():
+                shape.to_dict()
+        self.assertEqual(slide_xml(self.prs), before)
+
+    def test_formatting(self):
+        inventory = extract_text_inventory(self.path, self.prs)
+        paragraphs = [p.to_dict() for p in inventory["slide-0"]["shape-2"].paragraphs]
+        self.assertEqual(
+            [(p["text"], p.get("color"), p.get("theme_color")) for p in paragraphs],
+            [
+                ("Red", "FF0000", None),
+                ("Accent", None, "ACCENT_1"),
+                ("Bold", None, None),
+                ("Plain", None, None),
+            ],
+        )
+        self.assertEqual(paragraphs[1]["alignment"], "CENTER")
+        self.assertTrue(paragraphs[2]["bold"])
+
+
+class TestUpdateTextIssues(InventoryTestCase):
+    def test_matches_a_fresh_inventory(self):
+        shapes = extract_text_inventory(self.path, self.prs)["slide-0"]
+        self.assertIsNotNone(shapes["shape-3"].frame_overflow_bottom)
+        self.assertIsNone(shapes["shape-2"].frame_overflow_bottom)
+        overlaps = {key: dict(s.overlapping_shapes) for key, s in shapes.items()}
+
+        shapes["shape-3"].shape.text_frame.text = "Fits"
+        shapes["shape-2"].shape.text_frame.text = f"• {LONG_TEXT}\n{LONG_TEXT}"
+        for shape in shapes.values():
+            shape.update_text_issues()
+
+        fresh = extract_text_inventory(self.path, self.prs)["slide-0"]
+        self.assertEqual(list(fresh), list(shapes))
+        for key, shape in shapes.items():
+            self.assertEqual(
+                shape.frame_overflow_bottom, fresh[key].frame_overflow_bottom, key
+            )
+            self.assertEqual(shape.warnings, fresh[key].warnings, key)
+            self.assertEqual(shape.overlapping_shapes, overlaps[key], key)
+        self.assertIsNone(shapes["shape-3"].frame_overflow_bottom)
+        self.assertIsNotNone(shapes["shape-2"].frame_overflow_bottom)
+        self.assertEqual(
+            shapes["shape-2"].warnings,
+            ["manual_bullet_symbol: use proper bullet formatting"],
+        )
+
+
+class TestTextMeasurer(unittest.TestCase):
+    def test_wrap_matches_prefix_measurement(self):
+        catalog = get_font_catalog()
+        paths = [None]  # PIL's default font
+        for name in ("DejaVu Sans", "DejaVu Serif", "DejaVu Sans Mono"):
+            path = catalog.find(name, False, False)
+            if path:
+                paths.append(path)
+
+        rng = random.Random(22)
+        draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        for path in paths:
+            for _ in range(1000):
+                size = rng.randint(8, 40)
+                font = load_font(path, size)
+                measurer = get_text_measurer(path, size)
+                line = random_line(rng)
+                max_width = rng.uniform(10, 600)
+                self.assertEqual(
+                    measurer.wrap(line, max_width),
+                    wrap_by_prefixes(line, max_width, draw, font),
+                    (path, size, line, max_width),
+                )
+                self.assertAlmostEqual(
+                    measurer.width(line), draw.textlength(line, font=font), 6
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
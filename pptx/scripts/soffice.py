@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+"""
+Shared LibreOffice (soffice) conversion service.
+
+Every `soffice --headless --convert-to ...` call pays LibreOffice's start-up
+cost. This module keeps one headless soffice listening on a UNO pipe with a
+random name and sends conversion and recalculation jobs to it, so only the
+first job pays for start-up. The listener is detached and outlives the process
+that started it; later clients find it through a state file in a directory
+only this user can access. A watchdog process stops the listener once it has
+been idle for IDLE_TIMEOUT seconds.
+
+When the Python UNO bridge (the "uno" module) is not importable, or
+SOFFICE_SERVICE=0 is set, each job runs in its own soffice process against a
+small pool of persistent profiles, so concurrent jobs never share a profile.
+
+Every job has a timeout. A listener that hangs is killed; one that crashed is
+started again and the job is retried once.
+
+Example usage:
+    python soffice.py start    # optional, clients start the listener on demand
+    python soffice.py status
+    python soffice.py stop
+
+    from soffice import convert_document
+    pdf_path = convert_document("deck.pptx", "out", "pdf", timeout=120)
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import secrets
+import signal
+import stat
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+try:
+    import uno
+except ImportError:
+    uno = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DEFAULT_TIMEOUT = 60  # Seconds a single job may take
+START_TIMEOUT = 60  # Seconds soffice may take to start listening
+IDLE_TIMEOUT = 600  # Seconds the listener may sit unused before it is stopped
+POOL_SIZE = 4  # Profiles used when jobs run in one-shot soffice processes
+# Per-user, not in the shared temp directory: whoever can write the state file
+# or the profiles could point clients at their own listener
+STATE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "soffice-service"
+)
+
+# Export filters for targets given without one (e.g. "pdf"), by document family
+DEFAULT_FILTERS = {
+    ("pdf", "writer"): "writer_pdf_Export",
+    ("pdf", "impress"): "impress_pdf_Export",
+    ("pdf", "calc"): "calc_pdf_Export",
+}
+DOCUMENT_FAMILIES = {
+    ".docx": "writer",
+    ".doc": "writer",
+    ".odt": "writer",
+    ".rtf": "writer",
+    ".pptx": "impress",
+    ".ppt": "impress",
+    ".odp": "impress",
+    ".xlsx": "calc",
+    ".xls": "calc",
+    ".ods": "calc",
+}
+
+RECALC_MACRO_URL = (
+    "vnd.sun.star.script:Standard.Module1.RecalculateAndSave"
+    "?language=Basic&location=application"
+)
+RECALC_MACRO = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE script:module PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "module.dtd">
+<script:module xmlns:script="http://openoffice.org/2000/script" script:name="Module1" script:language="StarBasic">
+    Sub RecalculateAndSave()
+      ThisComponent.calculateAll()
+      ThisComponent.store()
+      ThisComponent.close(True)
+    End Sub
+</script:module>"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the soffice listener")
+    parser.add_argument("command", choices=["start", "stop", "status", "watch"])
+    # Used by the watchdog process the listener is started with
+    parser.add_argument("--state-dir", default=STATE_DIR, help=argparse.SUPPRESS)
+    parser.add_argument("--pid", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if uno is None:
+        print(
+            "The Python UNO bridge is not available; jobs run in one-shot "
+            "soffice processes and no listener is used."
+        )
+        sys.exit(0 if args.command != "start" else 1)
+
+    service = get_service()
+    if args.command == "start":
+        state = service.start()
+        print(f"soffice listening on pipe {state['pipe']} (pid {state['pid']})")
+    elif args.command == "stop":
+        service.stop()
+        print("soffice listener stopped")
+    elif args.command == "watch":
+        SofficeService(args.state_dir).watch(args.pid)
+    else:
+        state = service.status()
+        if state:
+            print(f"soffice listening on pipe {state['pipe']} (pid {state['pid']})")
+        else:
+            print("soffice listener is not running")
+
+
+def convert_document(input_path, output_dir, convert_to, timeout=DEFAULT_TIMEOUT):
+    """Convert a document with LibreOffice, like `soffice --convert-to`.
+
+    Args:
+        input_path: Document to convert
+        output_dir: Directory the converted file is written to
+        convert_to: Target in soffice's "ext[:filter]" form, e.g. "pdf" or
+            "html:HTML"
+        timeout: Seconds the conversion may take
+
+    Returns:
+        Path: The converted file, output_dir / "<input stem>.<ext>"
+
+    Raises:
+        FileNotFoundError: If soffice is not installed
+        TimeoutError: If the conversion did not finish within the timeout
+        RuntimeError: If LibreOffice could not convert the document
+    """
+    input_path = Path(input_path).resolve()
+    output_dir = Path(output_dir).resolve()
+    extension, _, filter_name = convert_to.partition(":")
+    output_path = output_dir / f"{input_path.stem}.{extension}"
+
+    if _use_listener():
+        if not filter_name:
+            family = DOCUMENT_FAMILIES.get(input_path.suffix.lower())
+            filter_name = DEFAULT_FILTERS.get((extension, family))
+            if filter_name is None:
+                raise RuntimeError(
+                    f"No default export filter for {input_path.suffix} to {extension}"
+                )
+
+        def job(desktop):
+            document = _load_document(desktop, input_path, ReadOnly=True)
+            try:
+                document.storeToURL(
+                    output_path.as_uri(), _properties(FilterName=filter_name)
+                )
+            finally:
+                document.close(True)
+
+        get_service().run(job, timeout)
+        error = ""
+    else:
+        _, error = _run_in_profile(
+            ["--convert-to", convert_to, "--outdir", str(output_dir), str(input_path)],
+            timeout,
+        )
+
+    if not output_path.exists():
+        raise RuntimeError(error.strip() or "Conversion failed")
+    return output_path
+
+
+def recalculate_document(path, timeout=DEFAULT_TIMEOUT):
+    """Recalculate all formulas in a spreadsheet and save it in place.
+
+    Raises:
+        FileNotFoundError: If soffice is not installed
+        TimeoutError: If the recalculation did not finish within the timeout
+        RuntimeError: If LibreOffice could not open or save the document
+    """
+    path = Path(path).resolve()
+
+    if _use_listener():
+
+        def job(desktop):
+            document = _load_document(desktop, path)
+            try:
+                document.calculateAll()
+                document.store()
+            finally:
+                document.close(True)
+
+        get_service().run(job, timeout)
+        return
+
+    returncode, error = _run_in_profile(
+        [RECALC_MACRO_URL, str(path)], timeout, setup=_install_recalc_macro
+    )
+    if returncode != 0:
+        raise RuntimeError(error.strip() or "Unknown error during recalculation")
+
+
+class SofficeService:
+    """A detached headless soffice listening on a private UNO pipe.
+
+    The listener's pid and pipe name are kept in a state file so every
+    process that uses the service shares one LibreOffice instance. It is
+    started on the first job and runs until stop() is called, it dies, or it
+    has been idle for idle_timeout seconds.
+    """
+
+    def __init__(
+        self, state_dir=STATE_DIR, soffice="soffice", idle_timeout=IDLE_TIMEOUT
+    ):
+        self.state_dir = Path(state_dir)
+        self.soffice = soffice
+        self.idle_timeout = idle_timeout
+        self.profile_dir = self.state_dir / "listener-profile"
+        self._state_file = self.state_dir / "listener.json"
+        self._used_file = self.state_dir / "listener.used"
+        self._lock = threading.Lock()
+        self._desktop = None
+        self._desktop_pid = None
+
+    def status(self):
+        """Return the listener's state ({"pid", "pipe"}) if it is reachable."""
+        state = self._read_state()
+        if state and self._resolve(state) is not None:
+            return state
+        return None
+
+    def start(self):
+        """Start the listener unless it is already running and return its state."""
+        with self._lock:
+            return self._ensure_started()[0]
+
+    def stop(self):
+        """Kill the listener and forget its state."""
+        with self._lock:
+            self._desktop = None
+            state = self._read_state()
+            if state and self._resolve(state) is not None:
+                _kill_process_group(state["pid"])
+            self._state_file.unlink(missing_ok=True)
+
+    def run(self, job, timeout=DEFAULT_TIMEOUT):
+        """Run job(desktop) on the listener.
+
+        A job that exceeds the timeout gets the listener killed, since a hung
+        LibreOffice would block every later job. If the listener died while
+        running the job, it is started again and the job is retried once.
+
+        Raises:
+            TimeoutError: If the job did not finish within the timeout
+            RuntimeError: If the job failed
+        """
+        _private_dir(self.state_dir)
+        # The shared lock keeps the watchdog from stopping the listener mid-job
+        with _file_lock(self.state_dir / "listener.busy", shared=True):
+            try:
+                for attempt in range(2):
+                    self._used_file.touch()
+                    desktop = self._connect()
+                    try:
+                        return _call_with_timeout(job, desktop, timeout)
+                    except TimeoutError:
+                        self.stop()
+                        raise
+                    except Exception as e:
+                        if self.status():
+                            raise RuntimeError(f"soffice job failed: {e}") from e
+                        # The listener crashed; start a fresh one for the retry
+                        self.stop()
+                        if attempt:
+                            raise RuntimeError(f"soffice crashed: {e}") from e
+            finally:
+                self._used_file.touch()
+
+    def watch(self, pid):
+        """Stop the listener with the given pid once it has been idle long enough.
+
+        This runs in a detached watchdog process started with the listener and
+        returns once the listener is stopped, has died or has been replaced.
+        """
+        while True:
+            time.sleep(min(self.idle_timeout, 30))
+            with _file_lock(self.state_dir / "listener.lock"):
+                state = self._read_state()
+                if state is None or state["pid"] != pid:
+                    return
+                try:
+                    idle = time.time() - self._used_file.stat().st_mtime
+                except OSError:
+                    idle = self.idle_timeout
+                if idle < self.idle_timeout:
+                    continue
+                with _file_lock(
+                    self.state_dir / "listener.busy", blocking=False
+                ) as acquired:
+                    if not acquired:
+                        continue  # A job is running
+                    if self._resolve(state) is not None:
+                        _kill_process_group(pid)
+                    # Otherwise it died and its pid may have been reused
+                    self._state_file.unlink(missing_ok=True)
+                    return
+
+    def _connect(self):
+        """Return a Desktop proxy for the listener, starting it if needed."""
+        with self._lock:
+            state, context = self._ensure_started()
+            if self._desktop is not None and self._desktop_pid == state["pid"]:
+                return self._desktop
+
+            self._desktop = context.ServiceManager.createInstanceWithContext(
+                "com.sun.star.frame.Desktop", context
+            )
+            self._desktop_pid = state["pid"]
+            return self._desktop
+
+    def _ensure_started(self):
+        """Start the listener if no reachable one is recorded. Caller holds _lock.
+
+        Returns:
+            tuple: (state, component context of the listener)
+        """
+        _private_dir(self.state_dir)
+        # Serialize start-up across processes so only one listener is spawned
+        with _file_lock(self.state_dir / "listener.lock"):
+            state = self._read_state()
+            context = self._resolve(state) if state else None
+            if context is not None:
+                return state, context
+
+            # Any recorded state is stale (the listener died and its pid may
+            # have been reused), so it is replaced rather than killed. The
+            # pipe name is random so that other users cannot guess it.
+            pipe = f"soffice-{secrets.token_hex(16)}"
+            process = subprocess.Popen(
+                [
+                    self.soffice,
+                    "--headless",
+                    "--invisible",
+                    "--nologo",
+                    "--nodefault",
+                    "--norestore",
+                    "--nolockcheck",
+                    f"-env:UserInstallation={self.profile_dir.as_uri()}",
+                    f"--accept=pipe,name={pipe};urp;StarOffice.ComponentContext",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            state = {"pid": process.pid, "pipe": pipe}
+
+            deadline = time.monotonic() + START_TIMEOUT
+            while True:
+                context = self._resolve(state)
+                if context is not None:
+                    break
+                if process.poll() is not None:
+                    raise RuntimeError(
+                        f"soffice exited with code {process.returncode} during start-up"
+                    )
+                if time.monotonic() > deadline:
+                    _kill_process_group(process.pid)
+                    raise TimeoutError(
+                        f"soffice did not start listening within {START_TIMEOUT}s"
+                    )
+                time.sleep(0.2)
+
+            self._used_file.touch()
+            fd = os.open(self._state_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as handle:
+                json.dump(state, handle)
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    str(Path(__file__).resolve()),
+                    "watch",
+                    "--state-dir",
+                    str(self.state_dir),
+                    "--pid",
+                    str(process.pid),
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            return state, context
+
+    def _read_state(self):
+        """Read the listener's state file, or None if it is missing or invalid.
+
+        Raises:
+            RuntimeError: If the state directory is not private to this user
+        """
+        _private_dir(self.state_dir)
+        try:
+            with open(self._state_file) as handle:
+                if not _owned_by_user(os.fstat(handle.fileno())):
+                    return None
+                state = json.load(handle)
+            return {"pid": int(state["pid"]), "pipe": str(state["pipe"])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _resolve(self, state):
+        """Connect to the listener's pipe and return its component context.
+
+        Returns None if nothing answers on the pipe, e.g. because the listener
+        died or is still starting up.
+        """
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        try:
+            return resolver.resolve(
+                f"uno:pipe,name={state['pipe']};urp;StarOffice.ComponentContext"
+            )
+        except Exception:
+            return None
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_service():
+    """Return the process-wide SofficeService."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = SofficeService()
+        return _service
+
+
+def _use_listener():
+    """Check if jobs should go to the UNO listener."""
+    return uno is not None and os.environ.get("SOFFICE_SERVICE", "1") != "0"
+
+
+def _properties(**values):
+    """Build a tuple of UNO PropertyValues."""
+    properties = []
+    for name, value in values.items():
+        prop = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+def _load_document(desktop, path, **properties):
+    """Open a document hidden in the listener."""
+    document = desktop.loadComponentFromURL(
+        Path(path).as_uri(), "_blank", 0, _properties(Hidden=True, **properties)
+    )
+    if document is None:
+        raise RuntimeError(f"LibreOffice could not open {path}")
+    return document
+
+
+def _call_with_timeout(func, arg, timeout):
+    """Call func(arg) in a worker thread and wait at most timeout seconds."""
+    result = {}
+
+    def target():
+        try:
+            result["value"] = func(arg)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"soffice job did not finish within {timeout}s")
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
+
+
+def _run_in_profile(args, timeout, setup=None):
+    """Run one soffice process on a free profile from the pool.
+
+    Args:
+        args: soffice arguments after the common headless options
+        timeout: Seconds the process may take; it is killed afterwards
+        setup: Optional callable(profile_dir, soffice_cmd) run before the job
+
+    Returns:
+        tuple: (returncode, stderr)
+    """
+    with _profile_slot() as profile_dir:
+        base_cmd = [
+            "soffice",
+            "--headless",
+            "--norestore",
+            "--nolockcheck",
+            f"-env:UserInstallation={profile_dir.as_uri()}",
+        ]
+        if setup is not None:
+            setup(profile_dir, base_cmd)
+
+        process = subprocess.Popen(
+            base_cmd + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=True,
+        )
+        try:
+            _, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # soffice is a wrapper around soffice.bin; kill the whole group
+            _kill_process_group(process.pid)
+            process.communicate()
+            raise TimeoutError(f"soffice did not finish within {timeout}s")
+        return process.returncode, stderr
+
+
+@contextlib.contextmanager
+def _profile_slot():
+    """Hold one profile directory from the pool for the duration of a job."""
+    _private_dir(STATE_DIR)
+    if fcntl is None:
+        yield STATE_DIR / "profile-0"
+        return
+
+    for slot in range(POOL_SIZE):
+        handle = open(STATE_DIR / f"profile-{slot}.lock", "w")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            continue
+        try:
+            yield STATE_DIR / f"profile-{slot}"
+        finally:
+            handle.close()
+        return
+
+    # Every profile is busy; wait for one
+    with _file_lock(STATE_DIR / f"profile-{os.getpid() % POOL_SIZE}.lock"):
+        yield STATE_DIR / f"profile-{os.getpid() % POOL_SIZE}"
+
+
+@contextlib.contextmanager
+def _file_lock(path, shared=False, blocking=True):
+    """Hold a lock on a file (no-op where fcntl is unavailable).
+
+    Yields:
+        bool: False if blocking is False and someone else holds the lock
+    """
+    with open(path, "w") as handle:
+        if fcntl is None:
+            yield True
+            return
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        try:
+            fcntl.flock(handle, operation if blocking else operation | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        yield True
+
+
+def _install_recalc_macro(profile_dir, soffice_cmd):
+    """Install the RecalculateAndSave Basic macro into a pool profile."""
+    macro_dir = profile_dir / "user" / "basic" / "Standard"
+    macro_file = macro_dir / "Module1.xba"
+    if macro_file.exists() and "RecalculateAndSave" in macro_file.read_text():
+        return
+
+    if not macro_dir.exists():
+        # Let soffice create the profile before adding the module to it
+        subprocess.run(
+            soffice_cmd + ["--terminate_after_init"],
+            capture_output=True,
+            timeout=START_TIMEOUT,
+        )
+        macro_dir.mkdir(parents=True, exist_ok=True)
+    macro_file.write_text(RECALC_MACRO)
+
+
+def _kill_process_group(pid):
+    """Kill a process started with start_new_session=True and its children."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(pid, signal.SIGKILL)
+        else:
+            os.kill(pid, signal.SIGTERM)
+    except OSError:
+        pass
+
+
+def _private_dir(path):
+    """Create a directory only this user can access, or check that it is one.
+
+    Raises:
+        RuntimeError: If the path belongs to another user, is accessible to
+            other users, or is not a directory
+    """
+    path = Path(path)
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = path.lstat()
+    if not stat.S_ISDIR(info.st_mode) or not _owned_by_user(info, 0o077):
+        raise RuntimeError(
+            f"{path} is not a private directory of this user; remove it and retry"
+        )
+    return path
+
+
+def _owned_by_user(info, forbidden=0o022):
+    """Check a stat result for this user's ownership and no forbidden mode bits."""
+    if not hasattr(os, "getuid"):
+        return True  # Windows: per-user directories are protected by ACLs
+    return info.st_uid == os.getuid() and not info.st_mode & forbidden
+
+
+if __name__ == "__main__":
+    main()
@@ -49,10 +49,12 @@ from pathlib import Path
 from inventory import extract_text_inventory
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from soffice import convert_document
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
 CONVERSION_DPI = 100  # DPI for PDF to image conversion
+CONVERSION_TIMEOUT = 300  # Seconds allowed for the PDF conversion
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
@@ -212,25 +214,14 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
     # Convert to PDF
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
+    try:
+        pdf_path = convert_document(
+            pptx_path, temp_dir, "pdf", timeout=CONVERSION_TIMEOUT
+        )
+    except (RuntimeError, TimeoutError) as e:
+        raise RuntimeError("PDF conversion failed") from e
 
     # Convert PDF to images
     print(f"Converting to images at {dpi} DPI...")